@@ -15,7 +15,7 @@
 
 # Import your models and settings
 from app.core.config import settings
-from app.models.base import Base, metadata
+from app.models.base import Base, engine_connect_args, metadata
 from app.models.audit import AuditBase
 
 # This is the Alembic Config object
@@ -81,6 +81,7 @@ async def run_async_migrations() -> None:
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args=engine_connect_args(),
     )
 
     async with connectable.connect() as connection:
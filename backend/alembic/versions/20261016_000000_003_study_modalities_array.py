@@ -0,0 +1,46 @@
+"""Store study modalities as text[] with a GIN index
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert modalities_in_study from a comma-separated string to text[]."""
+
+    op.execute(
+        "ALTER TABLE studies ALTER COLUMN modalities_in_study TYPE varchar(16)[] "
+        "USING string_to_array(modalities_in_study, ',')"
+    )
+    op.create_index(
+        "ix_studies_modalities_gin",
+        "studies",
+        ["modalities_in_study"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Restore modalities_in_study as a comma-separated string."""
+
+    op.drop_index("ix_studies_modalities_gin", table_name="studies")
+    op.alter_column(
+        "studies",
+        "modalities_in_study",
+        type_=sa.String(256),
+        postgresql_using="array_to_string(modalities_in_study, ',')",
+    )
@@ -0,0 +1,36 @@
+"""Record the checksum algorithm for stored instance files
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 00:00:01.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add file_checksum_algo; existing checksums were computed with SHA-256."""
+
+    op.add_column(
+        "instances",
+        sa.Column("file_checksum_algo", sa.String(16), nullable=True),
+    )
+    op.execute(
+        "UPDATE instances SET file_checksum_algo = 'sha256' WHERE file_checksum IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Drop file_checksum_algo."""
+
+    op.drop_column("instances", "file_checksum_algo")
@@ -0,0 +1,34 @@
+"""Index instance file checksums for content-addressed storage
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 00:00:02.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add an index on instances.file_checksum."""
+
+    op.create_index(
+        "ix_instances_file_checksum",
+        "instances",
+        ["file_checksum"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the file_checksum index."""
+
+    op.drop_index("ix_instances_file_checksum", table_name="instances")
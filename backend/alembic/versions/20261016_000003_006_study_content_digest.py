@@ -0,0 +1,33 @@
+"""Add a content digest over each study's instance checksums
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 00:00:03.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add studies.content_digest (left NULL for existing studies)."""
+
+    op.add_column(
+        "studies",
+        sa.Column("content_digest", sa.String(64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop studies.content_digest."""
+
+    op.drop_column("studies", "content_digest")
@@ -0,0 +1,45 @@
+"""Store annotation geometry and measurements as jsonb
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16 00:00:04.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ("geometry", "measurements")
+
+
+def upgrade() -> None:
+    """Convert annotation JSON columns from json to jsonb."""
+
+    for column in _COLUMNS:
+        op.alter_column(
+            "annotations",
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    """Restore annotation JSON columns as json."""
+
+    for column in _COLUMNS:
+        op.alter_column(
+            "annotations",
+            column,
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+        )
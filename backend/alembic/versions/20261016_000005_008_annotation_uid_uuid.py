@@ -0,0 +1,40 @@
+"""Store annotation_uid as a native uuid
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16 00:00:05.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert annotation_uid from varchar(36) to uuid."""
+
+    op.alter_column(
+        "annotations",
+        "annotation_uid",
+        type_=sa.Uuid(),
+        postgresql_using="annotation_uid::uuid",
+    )
+
+
+def downgrade() -> None:
+    """Restore annotation_uid as varchar(36)."""
+
+    op.alter_column(
+        "annotations",
+        "annotation_uid",
+        type_=sa.String(36),
+        postgresql_using="annotation_uid::text",
+    )
@@ -0,0 +1,42 @@
+"""Make the annotation study/series index covering
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16 00:00:06.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Rebuild ix_annotations_study_series with INCLUDE columns."""
+
+    op.drop_index("ix_annotations_study_series", table_name="annotations")
+    op.create_index(
+        "ix_annotations_study_series",
+        "annotations",
+        ["study_uid", "series_uid"],
+        unique=False,
+        postgresql_include=["instance_uid", "frame_number", "annotation_type", "annotation_uid"],
+    )
+
+
+def downgrade() -> None:
+    """Restore the plain (study_uid, series_uid) index."""
+
+    op.drop_index("ix_annotations_study_series", table_name="annotations")
+    op.create_index(
+        "ix_annotations_study_series",
+        "annotations",
+        ["study_uid", "series_uid"],
+        unique=False,
+    )
@@ -0,0 +1,34 @@
+"""Drop the annotation study_uid index covered by ix_annotations_study_series
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16 00:00:07.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop ix_annotations_study_uid (study_uid leads the composite index)."""
+
+    op.drop_index(op.f("ix_annotations_study_uid"), table_name="annotations")
+
+
+def downgrade() -> None:
+    """Restore ix_annotations_study_uid."""
+
+    op.create_index(
+        op.f("ix_annotations_study_uid"),
+        "annotations",
+        ["study_uid"],
+        unique=False,
+    )
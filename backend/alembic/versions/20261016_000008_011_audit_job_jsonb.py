@@ -0,0 +1,61 @@
+"""Store audit log and AI job JSON columns as jsonb
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16 00:00:08.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = {
+    "audit_logs": ("details", "old_value", "new_value"),
+    "ai_jobs": ("parameters", "results", "result_files", "quality_metrics"),
+}
+
+
+def upgrade() -> None:
+    """Convert JSON columns to jsonb and index audit log details."""
+
+    for table, columns in _COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSONB(),
+                postgresql_using=f"{column}::jsonb",
+            )
+
+    op.create_index(
+        "ix_audit_logs_details_gin",
+        "audit_logs",
+        ["details"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"details": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Drop the details index and restore JSON columns as json."""
+
+    op.drop_index("ix_audit_logs_details_gin", table_name="audit_logs")
+
+    for table, columns in _COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.JSON(),
+                postgresql_using=f"{column}::json",
+            )
@@ -0,0 +1,62 @@
+"""Replace the audit_logs timestamp B-trees with a BRIN index
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16 00:00:09.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Build ix_audit_logs_timestamp_brin and drop the timestamp B-trees."""
+
+    # CONCURRENTLY cannot run inside a transaction; avoid locking out audit writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_logs_timestamp_brin",
+            "audit_logs",
+            ["timestamp"],
+            unique=False,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 128},
+            postgresql_concurrently=True,
+        )
+        # The composite user/resource B-trees still serve per-entity ranges
+        for index in ("ix_audit_logs_timestamp", "ix_audit_logs_timestamp_desc"):
+            op.drop_index(index, table_name="audit_logs", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Restore the timestamp B-tree indexes."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_logs_timestamp",
+            "audit_logs",
+            ["timestamp"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_audit_logs_timestamp_desc",
+            "audit_logs",
+            [sa.text("timestamp DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_audit_logs_timestamp_brin",
+            table_name="audit_logs",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,54 @@
+"""Extend the audit action and AI job status indexes with their sort keys
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16 00:00:10.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the action indexes and add created_at to ix_ai_jobs_status_priority."""
+
+    op.drop_index(op.f("ix_audit_logs_action"), table_name="audit_logs")
+    op.drop_index("ix_audit_logs_action_timestamp", table_name="audit_logs")
+    op.create_index(
+        "ix_audit_logs_action_timestamp_id",
+        "audit_logs",
+        ["action", sa.text("timestamp DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+    op.drop_index("ix_ai_jobs_status_priority", table_name="ai_jobs")
+    op.create_index(
+        "ix_ai_jobs_status_priority",
+        "ai_jobs",
+        ["status", "priority", sa.text("created_at DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Restore the previous action and status/priority indexes."""
+
+    op.drop_index("ix_ai_jobs_status_priority", table_name="ai_jobs")
+    op.create_index(
+        "ix_ai_jobs_status_priority", "ai_jobs", ["status", "priority"], unique=False
+    )
+
+    op.drop_index("ix_audit_logs_action_timestamp_id", table_name="audit_logs")
+    op.create_index(
+        "ix_audit_logs_action_timestamp", "audit_logs", ["action", "timestamp"], unique=False
+    )
+    op.create_index(op.f("ix_audit_logs_action"), "audit_logs", ["action"], unique=False)
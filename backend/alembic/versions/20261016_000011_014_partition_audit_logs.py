@@ -0,0 +1,120 @@
+"""Partition audit_logs by month on timestamp
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16 00:00:11.000000
+
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months after the current one to create partitions for; the application
+# creates later ones at startup (app.services.audit_trail)
+_MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    """Return the first day of the month ``months`` after ``month``."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_indexes() -> None:
+    """Create the audit_logs indexes (on every partition when partitioned)."""
+    for column in ("user_id", "resource_type", "resource_id"):
+        op.create_index(op.f(f"ix_audit_logs_{column}"), "audit_logs", [column], unique=False)
+    op.create_index(
+        "ix_audit_logs_user_timestamp", "audit_logs", ["user_id", "timestamp"], unique=False
+    )
+    op.create_index(
+        "ix_audit_logs_resource_timestamp",
+        "audit_logs",
+        ["resource_type", "resource_id", "timestamp"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_audit_logs_action_timestamp_id",
+        "audit_logs",
+        ["action", sa.text("timestamp DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_audit_logs_timestamp_brin",
+        "audit_logs",
+        ["timestamp"],
+        unique=False,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 128},
+    )
+    op.create_index(
+        "ix_audit_logs_details_gin",
+        "audit_logs",
+        ["details"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"details": "jsonb_path_ops"},
+    )
+
+
+def _swap_table(create_sql: str, partitions: Sequence[str] = ()) -> None:
+    """Copy audit_logs into a new table built by ``create_sql`` and swap it in.
+
+    The id sequence is detached first so dropping the old table keeps it.
+    """
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY NONE")
+    op.execute(create_sql)
+    for statement in partitions:
+        op.execute(statement)
+    op.execute("INSERT INTO audit_logs_new SELECT * FROM audit_logs")
+    op.execute("DROP TABLE audit_logs")
+    op.execute("ALTER TABLE audit_logs_new RENAME TO audit_logs")
+    op.execute("ALTER TABLE audit_logs RENAME CONSTRAINT audit_logs_new_pkey TO pk_audit_logs")
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+
+
+def upgrade() -> None:
+    """Rebuild audit_logs as a table range-partitioned by month."""
+
+    # One partition per month from the oldest entry through _MONTHS_AHEAD
+    # months from now, plus a default partition so no write is ever rejected
+    oldest = op.get_bind().scalar(sa.text("SELECT min(timestamp) FROM audit_logs"))
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    month = oldest.astimezone(timezone.utc).date().replace(day=1) if oldest else this_month
+    partitions = []
+    while month <= _add_months(this_month, _MONTHS_AHEAD):
+        end = _add_months(month, 1)
+        partitions.append(
+            f"CREATE TABLE audit_logs_{month:%Y_%m} PARTITION OF audit_logs_new "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+            f"TO ('{end.isoformat()} 00:00:00+00')"
+        )
+        month = end
+    partitions.append("CREATE TABLE audit_logs_default PARTITION OF audit_logs_new DEFAULT")
+
+    _swap_table(
+        "CREATE TABLE audit_logs_new "
+        "(LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS, "
+        "PRIMARY KEY (id, timestamp)) PARTITION BY RANGE (timestamp)",
+        partitions,
+    )
+    _create_indexes()
+
+
+def downgrade() -> None:
+    """Rebuild audit_logs as a single unpartitioned table."""
+
+    _swap_table(
+        "CREATE TABLE audit_logs_new "
+        "(LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS, PRIMARY KEY (id))"
+    )
+    _create_indexes()
@@ -0,0 +1,44 @@
+"""Store instance geometry as float8[] instead of backslash-delimited strings
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16 00:00:12.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Column -> length of its previous varchar type
+_COLUMNS = {
+    "image_position_patient": 128,
+    "image_orientation_patient": 256,
+    "pixel_spacing": 64,
+}
+
+
+def upgrade() -> None:
+    """Convert geometry columns from "a\\b\\c" strings to float8[]."""
+
+    for column in _COLUMNS:
+        op.execute(
+            f"ALTER TABLE instances ALTER COLUMN {column} TYPE float8[] "
+            f"USING string_to_array(nullif({column}, ''), '\\')::float8[]"
+        )
+
+
+def downgrade() -> None:
+    """Restore geometry columns as backslash-delimited strings."""
+
+    for column, length in _COLUMNS.items():
+        op.execute(
+            f"ALTER TABLE instances ALTER COLUMN {column} TYPE varchar({length}) "
+            f"USING array_to_string({column}, '\\')"
+        )
@@ -0,0 +1,34 @@
+"""Add a generated duration_ms column to ai_jobs
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16 00:00:13.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "016"
+down_revision: Union[str, None] = "015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add ai_jobs.duration_ms computed from started_at/completed_at."""
+
+    op.execute(
+        "ALTER TABLE ai_jobs ADD COLUMN duration_ms bigint GENERATED ALWAYS AS "
+        "((EXTRACT(EPOCH FROM (completed_at - started_at)) * 1000)::bigint) STORED"
+    )
+    op.create_index("ix_ai_jobs_duration", "ai_jobs", ["duration_ms"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop ai_jobs.duration_ms."""
+
+    op.drop_index("ix_ai_jobs_duration", table_name="ai_jobs")
+    op.drop_column("ai_jobs", "duration_ms")
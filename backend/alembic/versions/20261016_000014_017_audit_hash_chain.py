@@ -0,0 +1,34 @@
+"""Add the tamper-evident hash chain columns to audit_logs
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-16 00:00:14.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "017"
+down_revision: Union[str, None] = "016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add audit_logs.prev_hash and row_hash."""
+
+    op.add_column("audit_logs", sa.Column("prev_hash", sa.LargeBinary(32), nullable=True))
+    op.add_column("audit_logs", sa.Column("row_hash", sa.LargeBinary(32), nullable=True))
+    op.create_index(op.f("ix_audit_logs_row_hash"), "audit_logs", ["row_hash"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the hash chain columns."""
+
+    op.drop_index(op.f("ix_audit_logs_row_hash"), table_name="audit_logs")
+    op.drop_column("audit_logs", "row_hash")
+    op.drop_column("audit_logs", "prev_hash")
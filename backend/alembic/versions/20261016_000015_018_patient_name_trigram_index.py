@@ -0,0 +1,39 @@
+"""Add a trigram index for patient name search
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-16 00:00:15.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "018"
+down_revision: Union[str, None] = "017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Rename the plain name index and add ix_patients_name_trgm."""
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("ALTER INDEX ix_patients_name_lower RENAME TO ix_patients_name")
+    op.create_index(
+        "ix_patients_name_trgm",
+        "patients",
+        ["patient_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"patient_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Drop the trigram index and restore the previous index name."""
+
+    op.drop_index("ix_patients_name_trgm", table_name="patients")
+    op.execute("ALTER INDEX ix_patients_name RENAME TO ix_patients_name_lower")
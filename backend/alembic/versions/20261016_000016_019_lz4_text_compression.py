@@ -0,0 +1,37 @@
+"""Compress long diagnostic and comment text with lz4
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-16 00:00:16.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "019"
+down_revision: Union[str, None] = "018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = (
+    ("ai_jobs", "error_message"),
+    ("ai_jobs", "error_traceback"),
+    ("patients", "comments"),
+)
+
+
+def upgrade() -> None:
+    """Use lz4 TOAST compression (PostgreSQL 14+) for newly written values."""
+
+    for table, column in _COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    """Restore the server's default TOAST compression."""
+
+    for table, column in _COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION default")
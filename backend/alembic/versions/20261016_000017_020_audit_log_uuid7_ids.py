@@ -0,0 +1,62 @@
+"""Identify audit log rows by time-ordered UUIDv7 instead of a sequence
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-16 00:00:17.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "020"
+down_revision: Union[str, None] = "019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert audit_logs.id to uuid and drop its sequence."""
+
+    # Existing rows get UUIDv7 layout ids: the timestamp in milliseconds, then
+    # the version/variant nibbles and the old id, so they keep their order
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN id DROP DEFAULT")
+    op.execute(
+        "ALTER TABLE audit_logs ALTER COLUMN id TYPE uuid USING ("
+        "lpad(to_hex(floor(extract(epoch FROM timestamp) * 1000)::bigint), 12, '0')"
+        " || '7000' || '8' || lpad(to_hex(id), 15, '0'))::uuid"
+    )
+    op.execute("DROP SEQUENCE IF EXISTS audit_logs_id_seq")
+
+
+def downgrade() -> None:
+    """Renumber audit_logs rows in id order with a sequence-backed integer id."""
+
+    op.add_column("audit_logs", sa.Column("legacy_id", sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE audit_logs AS a SET legacy_id = n.rn FROM ("
+        "SELECT id, row_number() OVER (ORDER BY id) AS rn FROM audit_logs"
+        ") AS n WHERE a.id = n.id"
+    )
+    op.drop_index("ix_audit_logs_action_timestamp_id", table_name="audit_logs")
+    op.execute("ALTER TABLE audit_logs DROP CONSTRAINT pk_audit_logs")
+    op.drop_column("audit_logs", "id")
+    op.alter_column("audit_logs", "legacy_id", new_column_name="id", nullable=False)
+
+    op.execute("CREATE SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+    op.execute(
+        "SELECT setval('audit_logs_id_seq', coalesce(max(id), 0) + 1, false) FROM audit_logs"
+    )
+    op.execute(
+        "ALTER TABLE audit_logs ALTER COLUMN id SET DEFAULT nextval('audit_logs_id_seq')"
+    )
+    op.execute("ALTER TABLE audit_logs ADD CONSTRAINT pk_audit_logs PRIMARY KEY (id, timestamp)")
+    op.create_index(
+        "ix_audit_logs_action_timestamp_id",
+        "audit_logs",
+        ["action", sa.text("timestamp DESC"), sa.text("id DESC")],
+        unique=False,
+    )
@@ -0,0 +1,115 @@
+"""Maintain study and series counters with triggers
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-16 00:00:18.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "021"
+down_revision: Union[str, None] = "020"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COUNTER_COLUMNS = {
+    "series": ("num_instances",),
+    "studies": ("num_series", "num_instances"),
+}
+
+_INSTANCES_FUNCTION = """
+CREATE OR REPLACE FUNCTION instances_update_counts() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    delta integer := CASE TG_OP WHEN 'INSERT' THEN 1 ELSE -1 END;
+BEGIN
+    UPDATE series AS s SET num_instances = s.num_instances + delta * c.n
+    FROM (
+        SELECT series_instance_uid_fk AS uid, count(*) AS n
+        FROM changed_rows GROUP BY series_instance_uid_fk
+    ) AS c
+    WHERE s.series_instance_uid = c.uid;
+    UPDATE studies AS st SET num_instances = st.num_instances + delta * c.n
+    FROM (
+        SELECT s.study_instance_uid_fk AS uid, count(*) AS n
+        FROM changed_rows AS i
+        JOIN series AS s ON s.series_instance_uid = i.series_instance_uid_fk
+        GROUP BY s.study_instance_uid_fk
+    ) AS c
+    WHERE st.study_instance_uid = c.uid;
+    RETURN NULL;
+END
+$$
+"""
+
+_SERIES_FUNCTION = """
+CREATE OR REPLACE FUNCTION series_update_counts() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    delta integer := CASE TG_OP WHEN 'INSERT' THEN 1 ELSE -1 END;
+BEGIN
+    UPDATE studies AS st
+    SET num_series = st.num_series + delta * c.n,
+        num_instances = st.num_instances + delta * c.instances
+    FROM (
+        SELECT study_instance_uid_fk AS uid, count(*) AS n,
+               sum(num_instances) AS instances
+        FROM changed_rows GROUP BY study_instance_uid_fk
+    ) AS c
+    WHERE st.study_instance_uid = c.uid;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    """Recount the counters and keep them current with statement-level triggers."""
+
+    # Start from exact counts; the application used to set these itself
+    op.execute(
+        "UPDATE series AS s SET num_instances = "
+        "(SELECT count(*) FROM instances AS i "
+        "WHERE i.series_instance_uid_fk = s.series_instance_uid)"
+    )
+    op.execute(
+        "UPDATE studies AS st SET "
+        "num_series = (SELECT count(*) FROM series AS s "
+        "WHERE s.study_instance_uid_fk = st.study_instance_uid), "
+        "num_instances = (SELECT coalesce(sum(s.num_instances), 0) FROM series AS s "
+        "WHERE s.study_instance_uid_fk = st.study_instance_uid)"
+    )
+    for table, columns in _COUNTER_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, nullable=False, server_default="0")
+
+    op.execute(_INSTANCES_FUNCTION)
+    op.execute(_SERIES_FUNCTION)
+    for table, function in (
+        ("instances", "instances_update_counts"),
+        ("series", "series_update_counts"),
+    ):
+        for event, rows in (("INSERT", "NEW"), ("DELETE", "OLD")):
+            op.execute(
+                f"CREATE TRIGGER {table}_count_{event.lower()} AFTER {event} ON {table} "
+                f"REFERENCING {rows} TABLE AS changed_rows "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+            )
+
+
+def downgrade() -> None:
+    """Drop the counter triggers and restore the nullable columns."""
+
+    for table in ("instances", "series"):
+        for event in ("insert", "delete"):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_count_{event} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS instances_update_counts()")
+    op.execute("DROP FUNCTION IF EXISTS series_update_counts()")
+
+    for table, columns in _COUNTER_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, nullable=True, server_default=None)
@@ -0,0 +1,51 @@
+"""Cluster instances by series playback order
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-16 00:00:19.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "022"
+down_revision: Union[str, None] = "021"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the covering series order index and cluster instances on it.
+
+    CLUSTER rewrites the table under an ACCESS EXCLUSIVE lock. Rows inserted
+    later are not kept in order, so re-run ``CLUSTER instances`` during
+    maintenance windows; the leftover fillfactor space keeps updates in place.
+    """
+
+    op.create_index(
+        "ix_instances_series_order",
+        "instances",
+        ["series_instance_uid_fk", "instance_number"],
+        unique=False,
+        postgresql_include=["sop_instance_uid", "file_path", "slice_location"],
+    )
+    # Leads with series_instance_uid_fk, so the order index replaces it
+    op.drop_index("ix_instances_series_uid", table_name="instances")
+
+    op.execute("ALTER TABLE instances SET (fillfactor = 90)")
+    op.execute("CLUSTER instances USING ix_instances_series_order")
+    op.execute("ANALYZE instances")
+
+
+def downgrade() -> None:
+    """Restore the plain series index and default table settings."""
+
+    op.execute("ALTER TABLE instances SET WITHOUT CLUSTER")
+    op.execute("ALTER TABLE instances RESET (fillfactor)")
+    op.create_index(
+        "ix_instances_series_uid", "instances", ["series_instance_uid_fk"], unique=False
+    )
+    op.drop_index("ix_instances_series_order", table_name="instances")
@@ -0,0 +1,31 @@
+"""Add series update and annotation values to the auditaction enum
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-16 00:00:20.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "023"
+down_revision: Union[str, None] = "022"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Enum member names, which is what the auditaction type stores
+_VALUES = ("SERIES_UPDATE", "ANNOTATION_CREATE", "ANNOTATION_UPDATE", "ANNOTATION_DELETE")
+
+
+def upgrade() -> None:
+    """Add the new audit actions to the auditaction type."""
+
+    for value in _VALUES:
+        op.execute(f"ALTER TYPE auditaction ADD VALUE IF NOT EXISTS '{value}'")
+
+
+def downgrade() -> None:
+    """Keep the values: PostgreSQL cannot remove values from an enum type."""
@@ -14,7 +14,7 @@
 from pydantic import BaseModel
 
 from app.api.v1.endpoints.auth import require_roles
-from app.core.config import get_settings
+from app.core.config import settings
 from app.core.logging import audit_logger
 from app.core.security import TokenData
 from app.models.audit import AuditLog
@@ -23,7 +23,6 @@
 from app.models.user import User
 
 router = APIRouter()
-settings = get_settings()
 
 
 class SystemStatus(BaseModel):
@@ -325,7 +324,9 @@ async def get_audit_logs(
     total = total_result.scalar() or 0
 
     result = await db.execute(
-        query.order_by(AuditLog.timestamp.desc()).offset(offset).limit(limit)
+        query.order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
+        .offset(offset)
+        .limit(limit)
     )
     logs = result.scalars().all()
 
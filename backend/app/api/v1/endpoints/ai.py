@@ -25,7 +25,7 @@
     get_current_active_user_from_token,
     require_roles,
 )
-from app.core.config import get_settings
+from app.core.config import settings
 from app.core.logging import audit_logger, get_logger
 from app.core.security import TokenData
 from app.models.base import get_db
@@ -35,7 +35,6 @@
 
 logger = get_logger(__name__)
 router = APIRouter()
-settings = get_settings()
 
 
 # Request/Response Models
@@ -7,11 +7,11 @@
 from datetime import datetime
 from enum import Enum
 from typing import Annotated
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.endpoints.auth import get_current_active_user
@@ -135,7 +135,7 @@ class AnnotationListResponse(BaseModel):
 def db_annotation_to_pydantic(db_ann: AnnotationModel) -> Annotation:
     """Convert database annotation model to Pydantic model."""
     return Annotation(
-        id=db_ann.annotation_uid,
+        id=str(db_ann.annotation_uid),
         study_uid=db_ann.study_uid,
         series_uid=db_ann.series_uid,
         instance_uid=db_ann.instance_uid,
@@ -154,6 +154,18 @@ def db_annotation_to_pydantic(db_ann: AnnotationModel) -> Annotation:
     )
 
 
+def select_annotation(annotation_id: str) -> Select:
+    """Build a query for an annotation by external ID (404 if it is not a UUID)."""
+    try:
+        annotation_uid = UUID(annotation_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Annotation not found: {annotation_id}",
+        ) from None
+    return select(AnnotationModel).where(AnnotationModel.annotation_uid == annotation_uid)
+
+
 @router.get("", response_model=AnnotationListResponse)
 async def list_annotations(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -195,7 +207,7 @@ async def get_annotation(
     current_user: Annotated[TokenData, Depends(get_current_active_user)],
 ) -> Annotation:
     """Get annotation by ID."""
-    query = select(AnnotationModel).where(AnnotationModel.annotation_uid == annotation_id)
+    query = select_annotation(annotation_id)
     result = await db.execute(query)
     db_annotation = result.scalar_one_or_none()
 
@@ -215,7 +227,7 @@ async def create_annotation(
     current_user: Annotated[TokenData, Depends(get_current_active_user)],
 ) -> Annotation:
     """Create a new annotation."""
-    ann_uid = str(uuid4())
+    ann_uid = uuid4()
 
     # Convert AnnotationData to dict for JSON storage
     geometry_dict = annotation.data.model_dump()
@@ -247,7 +259,7 @@ async def create_annotation(
     audit_logger.log_access(
         user_id=current_user.user_id,
         resource_type="annotation",
-        resource_id=ann_uid,
+        resource_id=str(ann_uid),
         action="CREATE",
     )
 
@@ -262,7 +274,7 @@ async def update_annotation(
     current_user: Annotated[TokenData, Depends(get_current_active_user)],
 ) -> Annotation:
     """Update an existing annotation."""
-    query = select(AnnotationModel).where(AnnotationModel.annotation_uid == annotation_id)
+    query = select_annotation(annotation_id)
     result = await db.execute(query)
     db_annotation = result.scalar_one_or_none()
 
@@ -315,7 +327,7 @@ async def delete_annotation(
     current_user: Annotated[TokenData, Depends(get_current_active_user)],
 ) -> None:
     """Delete an annotation."""
-    query = select(AnnotationModel).where(AnnotationModel.annotation_uid == annotation_id)
+    query = select_annotation(annotation_id)
     result = await db.execute(query)
     db_annotation = result.scalar_one_or_none()
 
@@ -352,7 +364,7 @@ async def create_annotations_batch(
     """Create multiple annotations in a batch."""
     created = []
     for annotation in annotations:
-        ann_uid = str(uuid4())
+        ann_uid = uuid4()
 
         geometry_dict = annotation.data.model_dump()
         measurements_list = (
@@ -4,7 +4,7 @@
 user management, and role-based access control.
 """
 
-import uuid
+import secrets
 from datetime import datetime, timezone
 from typing import Annotated
 
@@ -31,6 +31,7 @@
     secret_key=settings.secret_key,
     algorithm=settings.algorithm,
     access_token_expire_minutes=settings.access_token_expire_minutes,
+    bcrypt_rounds=settings.bcrypt_rounds,
 )
 
 
@@ -241,7 +242,7 @@ async def login(
         user.failed_login_attempts = 0
 
     # Verify password
-    if not security.verify_password(form_data.password, user.hashed_password):
+    if not await security.averify_password(form_data.password, user.hashed_password):
         # Increment failed attempts
         user.failed_login_attempts = (user.failed_login_attempts or 0) + 1
 
@@ -282,6 +283,10 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Re-hash passwords stored with an outdated bcrypt cost
+    if security.needs_rehash(user.hashed_password):
+        user.hashed_password = await security.ahash_password(form_data.password)
+
     # Reset failed attempts and update last login
     user.failed_login_attempts = 0
     user.last_login = datetime.now(timezone.utc)
@@ -385,14 +390,14 @@ async def change_password(
         )
 
     # Verify current password
-    if not security.verify_password(password_data.current_password, user.hashed_password):
+    if not await security.averify_password(password_data.current_password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
 
     # Update password
-    user.hashed_password = security.hash_password(password_data.new_password)
+    user.hashed_password = await security.ahash_password(password_data.new_password)
     user.password_changed_at = datetime.now(timezone.utc)
     user.must_change_password = False
     await db.commit()
@@ -445,10 +450,10 @@ async def register_user(
 
     # Create new user
     user = User(
-        user_id=f"user_{uuid.uuid4().hex[:12]}",
+        user_id=f"user_{secrets.token_urlsafe(9)}",
         username=user_data.username,
         email=user_data.email,
-        hashed_password=security.hash_password(user_data.password),
+        hashed_password=await security.ahash_password(user_data.password),
         full_name=user_data.full_name,
         roles=",".join(user_data.roles),
         is_active=True,
@@ -489,7 +494,7 @@ async def init_default_users(db: AsyncSession) -> None:
         user_id="user_admin001",
         username="admin",
         email="admin@horalix.local",
-        hashed_password=security.hash_password("admin123"),
+        hashed_password=await security.ahash_password("admin123"),
         full_name="System Administrator",
         roles="admin",
         is_active=True,
@@ -501,7 +506,7 @@ async def init_default_users(db: AsyncSession) -> None:
         user_id="user_rad001",
         username="radiologist",
         email="radiologist@horalix.local",
-        hashed_password=security.hash_password("rad123"),
+        hashed_password=await security.ahash_password("rad123"),
         full_name="Dr. Radiology",
         title="MD",
         department="Radiology",
@@ -515,7 +520,7 @@ async def init_default_users(db: AsyncSession) -> None:
         user_id="user_tech001",
         username="technologist",
         email="tech@horalix.local",
-        hashed_password=security.hash_password("tech123"),
+        hashed_password=await security.ahash_password("tech123"),
         full_name="Medical Technologist",
         department="Imaging",
         roles="technologist",
@@ -12,7 +12,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.endpoints.auth import get_current_active_user
-from app.core.config import get_settings
+from app.core.config import settings
 from app.core.security import TokenData
 from app.models.base import get_db
 from app.models.instance import Instance
@@ -22,7 +22,6 @@
 from app.models.study import Study
 
 router = APIRouter()
-settings = get_settings()
 
 
 class DashboardStats(BaseModel):
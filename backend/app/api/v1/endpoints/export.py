@@ -5,6 +5,7 @@
 
 from datetime import datetime
 from enum import Enum
+from itertools import chain
 from typing import Annotated
 from uuid import uuid4
 
@@ -140,14 +141,17 @@ async def create_export(
     EXPORT_JOBS_DB[job_id] = job.model_dump()
 
     # Log export request
-    resource_ids = request.study_uids + request.series_uids + request.instance_uids
     audit_logger.log_data_export(
         user_id=current_user.user_id,
         export_type=request.export_type.value,
-        resource_ids=resource_ids,
+        resource_ids=chain(request.study_uids, request.series_uids, request.instance_uids),
+        resource_count=(
+            len(request.study_uids) + len(request.series_uids) + len(request.instance_uids)
+        ),
         format=request.format.value,
         anonymized=request.anonymize,
     )
+    await audit_logger.flush()
 
     # Start background export
     background_tasks.add_task(process_export, job_id, request)
@@ -298,6 +302,7 @@ async def quick_export(
         resource_ids=[instance_uid or study_uid],
         format=format.value,
     )
+    await audit_logger.flush()
 
     return StreamingResponse(
         buffer,
@@ -393,7 +398,7 @@ async def export_dicom_with_measurements(
     """
     from pathlib import Path
 
-    from app.core.config import get_settings
+    from app.core.config import settings
     from app.services.dicom.export import (
         DicomExportService,
         ExportRequest as DicomExportRequest,
@@ -404,7 +409,6 @@ async def export_dicom_with_measurements(
         TrackingFrameExport,
     )
 
-    settings = get_settings()
     storage_dir = Path(settings.dicom_storage_path)
 
     # Initialize export service
@@ -517,6 +521,7 @@ async def export_dicom_with_measurements(
         format="dicom",
         anonymized=False,
     )
+    await audit_logger.flush()
 
     # Return as streaming response
     from io import BytesIO
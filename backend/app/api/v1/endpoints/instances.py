@@ -22,7 +22,7 @@
     get_current_active_user,
     get_current_active_user_from_token,
 )
-from app.core.config import get_settings
+from app.core.config import settings
 from app.core.security import TokenData
 from app.models.base import get_db
 from app.models.instance import Instance
@@ -200,7 +200,7 @@ async def get_instance(
     """
     query = (
         select(Instance)
-        .options(selectinload(Instance.series))
+        .options(selectinload(Instance.series).raiseload("*"))
         .where(Instance.sop_instance_uid == instance_uid)
     )
     result = await db.execute(query)
@@ -247,7 +247,6 @@ async def get_pixel_data(
         )
 
     # Get pixel data from stored DICOM file
-    settings = get_settings()
     payload = None
     if instance.file_path and Path(instance.file_path).exists():
         try:
@@ -416,7 +415,6 @@ async def get_thumbnail(
         )
 
     # Get pixel data and create thumbnail
-    settings = get_settings()
     if instance.file_path and Path(instance.file_path).exists():
         try:
             payload = _load_pixel_data(instance.file_path)
@@ -555,7 +553,7 @@ async def get_dicom_tags(
     """
     query = (
         select(Instance)
-        .options(selectinload(Instance.series))
+        .options(selectinload(Instance.series).raiseload("*"))
         .where(Instance.sop_instance_uid == instance_uid)
     )
     result = await db.execute(query)
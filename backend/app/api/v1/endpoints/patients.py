@@ -5,8 +5,9 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
-from sqlalchemy import and_, func, select
+from sqlalchemy import RowMapping, and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.api.v1.endpoints.auth import get_current_active_user, require_roles
 from app.core.logging import audit_logger
@@ -75,6 +76,37 @@ class PatientStudySummary(BaseModel):
     num_instances: int
 
 
+# Columns read by list_patients; labels match the PatientMetadata field names
+_PATIENT_LIST_COLUMNS = (
+    Patient.patient_id,
+    Patient.patient_name,
+    Patient.birth_date,
+    Patient.sex,
+    Patient.ethnic_group,
+    Patient.comments,
+    Patient.issuer_of_patient_id,
+    Patient.other_patient_ids,
+    func.count(Study.id).label("study_count"),
+    func.max(Study.study_date).label("last_study_date"),
+)
+
+
+def _patient_row_to_metadata(row: RowMapping) -> PatientMetadata:
+    """Convert a row of ``_PATIENT_LIST_COLUMNS`` to PatientMetadata response (unvalidated)."""
+    return PatientMetadata.model_construct(
+        patient_id=row["patient_id"],
+        patient_name=row["patient_name"],
+        birth_date=row["birth_date"],
+        sex=row["sex"],
+        age=None,
+        weight=None,
+        ethnic_group=row["ethnic_group"],
+        comments=row["comments"],
+        issuer_of_patient_id=row["issuer_of_patient_id"],
+        other_patient_ids=row["other_patient_ids"],
+        study_count=row["study_count"] or 0,
+        last_study_date=row["last_study_date"],
+    )
 
 
 @router.get("", response_model=PatientListResponse)
@@ -106,13 +138,11 @@ async def list_patients(
     total_result = await db.execute(select(func.count()).select_from(base_query.subquery()))
     total = total_result.scalar() or 0
 
+    # Plain columns rather than Patient entities, which would eagerly load
+    # every patient's studies, series and instances
     offset = (page - 1) * page_size
     query = (
-        select(
-            Patient,
-            func.count(Study.id).label("study_count"),
-            func.max(Study.study_date).label("last_study_date"),
-        )
+        select(*_PATIENT_LIST_COLUMNS)
         .outerjoin(Study, Study.patient_id_fk == Patient.id)
         .group_by(Patient.id)
         .order_by(Patient.patient_name.asc().nullslast())
@@ -124,24 +154,7 @@ async def list_patients(
         query = query.where(and_(*filters))
 
     result = await db.execute(query)
-    patients = []
-    for patient, study_count, last_study_date in result.all():
-        patients.append(
-            PatientMetadata(
-                patient_id=patient.patient_id,
-                patient_name=patient.patient_name,
-                birth_date=patient.birth_date,
-                sex=patient.sex,
-                age=None,
-                weight=None,
-                ethnic_group=patient.ethnic_group,
-                comments=patient.comments,
-                issuer_of_patient_id=patient.issuer_of_patient_id,
-                other_patient_ids=patient.other_patient_ids,
-                study_count=study_count or 0,
-                last_study_date=last_study_date,
-            )
-        )
+    patients = [_patient_row_to_metadata(row) for row in result.mappings()]
 
     return PatientListResponse(
         total=total,
@@ -159,7 +172,7 @@ async def get_patient(
 ) -> PatientMetadata:
     """Get patient information."""
     patient_result = await db.execute(
-        select(Patient).where(Patient.patient_id == patient_id)
+        select(Patient).options(raiseload("*")).where(Patient.patient_id == patient_id)
     )
     patient = patient_result.scalar_one_or_none()
     if not patient:
@@ -295,11 +308,8 @@ async def get_patient_studies(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> list[PatientStudySummary]:
     """Get all studies for a patient."""
-    patient_result = await db.execute(
-        select(Patient).where(Patient.patient_id == patient_id)
-    )
-    patient = patient_result.scalar_one_or_none()
-    if not patient:
+    patient_pk = await db.scalar(select(Patient.id).where(Patient.patient_id == patient_id))
+    if patient_pk is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Patient not found: {patient_id}",
@@ -307,7 +317,8 @@ async def get_patient_studies(
 
     study_result = await db.execute(
         select(Study)
-        .where(Study.patient_id_fk == patient.id)
+        .options(raiseload("*"))
+        .where(Study.patient_id_fk == patient_pk)
         .order_by(Study.study_date.desc().nullslast(), Study.created_at.desc())
     )
     studies = study_result.scalars().all()
@@ -317,7 +328,7 @@ async def get_patient_studies(
             study_instance_uid=study.study_instance_uid,
             study_date=study.study_date,
             study_description=study.study_description,
-            modalities=study.modalities_list,
+            modalities=study.modalities_in_study or [],
             num_series=study.num_series,
             num_instances=study.num_instances,
         )
@@ -11,7 +11,7 @@
 from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.api.v1.endpoints.auth import (
     get_current_active_user,
@@ -169,7 +169,7 @@ async def list_series(
 
     Returns all series matching the specified criteria.
     """
-    query = select(Series).order_by(Series.series_number)
+    query = select(Series).options(raiseload("*")).order_by(Series.series_number)
 
     if study_uid:
         query = query.where(Series.study_instance_uid_fk == study_uid)
@@ -200,7 +200,7 @@ async def get_series(
     """
     query = (
         select(Series)
-        .options(selectinload(Series.instances))
+        .options(selectinload(Series.instances).raiseload("*"), raiseload("*"))
         .where(Series.series_instance_uid == series_uid)
     )
     result = await db.execute(query)
@@ -252,7 +252,7 @@ async def update_series(
     """Update series metadata."""
     query = (
         select(Series)
-        .options(selectinload(Series.instances))
+        .options(selectinload(Series.instances).raiseload("*"), raiseload("*"))
         .where(Series.series_instance_uid == series_uid)
     )
     result = await db.execute(query)
@@ -339,7 +339,9 @@ async def get_series_frames(
     Returns frame positions and metadata for efficient scrolling.
     """
     # Get series
-    series_query = select(Series).where(Series.series_instance_uid == series_uid)
+    series_query = (
+        select(Series).options(raiseload("*")).where(Series.series_instance_uid == series_uid)
+    )
     series_result = await db.execute(series_query)
     series = series_result.scalar_one_or_none()
 
@@ -349,16 +351,17 @@ async def get_series_frames(
             detail=f"Series not found: {series_uid}",
         )
 
-    # Get instances with pagination
+    # Get instances with pagination; only columns ix_instances_series_order
+    # covers, so PostgreSQL answers from the index alone
     instances_query = (
-        select(Instance)
+        select(Instance.sop_instance_uid, Instance.slice_location)
         .where(Instance.series_instance_uid_fk == series_uid)
         .order_by(Instance.instance_number)
         .offset(start)
         .limit(count)
     )
     instances_result = await db.execute(instances_query)
-    instances = instances_result.scalars().all()
+    instances = instances_result.all()
 
     frames = []
     for i, inst in enumerate(instances):
@@ -393,7 +396,7 @@ async def get_volume_info(
     # Get series with first instance for spatial info
     series_query = (
         select(Series)
-        .options(selectinload(Series.instances))
+        .options(selectinload(Series.instances).raiseload("*"), raiseload("*"))
         .where(Series.series_instance_uid == series_uid)
     )
     series_result = await db.execute(series_query)
@@ -470,7 +473,7 @@ async def get_mpr_slice(
 
     query = (
         select(Series)
-        .options(selectinload(Series.instances))
+        .options(selectinload(Series.instances).raiseload("*"), raiseload("*"))
         .where(Series.series_instance_uid == series_uid)
     )
     result = await db.execute(query)
@@ -591,7 +594,7 @@ async def track_measurement(
 
     query = (
         select(Series)
-        .options(selectinload(Series.instances))
+        .options(selectinload(Series.instances).raiseload("*"), raiseload("*"))
         .where(Series.series_instance_uid == series_uid)
     )
     result = await db.execute(query)
@@ -635,15 +638,6 @@ async def track_measurement(
     spacing_tuple = instances[0].pixel_spacing_tuple
     if spacing_tuple:
         spacing_row, spacing_col = spacing_tuple
-    elif instances[0].pixel_spacing:
-        try:
-            parts = str(instances[0].pixel_spacing).split("\\")
-            if len(parts) >= 2:
-                spacing_row = float(parts[0])
-                spacing_col = float(parts[1])
-        except (ValueError, TypeError):
-            spacing_row = 1.0
-            spacing_col = 1.0
 
     def _load_frame_pixel(instance: Instance, frame_idx: int, cached: dict) -> np.ndarray:
         if cached.get("instance_uid") != instance.sop_instance_uid:
@@ -4,33 +4,55 @@
 filtering, pagination, and metadata retrieval.
 """
 
+import asyncio
+import contextlib
+import functools
+from collections.abc import AsyncIterator
 from datetime import date, datetime
 from datetime import time as dt_time
 from enum import Enum
-import hashlib
+import os
+from pathlib import Path
 from typing import Annotated, Any
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
 import aiofiles
 from pydantic import BaseModel, Field
-from sqlalchemy import and_, func, select
+from sqlalchemy import ColumnElement, RowMapping, Select, and_, exists, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.api.v1.endpoints.auth import get_current_active_user, require_roles
-from app.core.config import get_settings
+from app.core.config import settings
 from app.core.logging import audit_logger
 from app.core.security import TokenData
 from app.models.annotation import Annotation
 from app.models.base import get_db
 from app.models.instance import Instance
+from app.models.job import AIJob, JobStatus
 from app.models.patient import Patient
 from app.models.series import Series
 from app.models.study import Study, StudyStatus
+from app.services.dicom.extraction import (
+    DicomExtractionError,
+    extract_upload_metadata,
+    get_parse_executor,
+)
+from app.services.dicom.storage import CHECKSUM_ALGORITHM, content_digest, new_checksum
 
 router = APIRouter()
 
+# Upload streaming chunk size; large chunks amortize read/write syscalls on multi-GB uploads
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB
+
+# Per-request upload limit, resolved once from settings
+MAX_UPLOAD_BYTES = int(settings.dicom.max_upload_size_gb * 1024 * 1024 * 1024)
+
+# Rows fetched per database round trip when streaming study listings
+STREAM_BATCH_SIZE = 100
+
 
 class Modality(str, Enum):
     """Supported DICOM modalities."""
@@ -118,8 +140,11 @@ class StudyDetailResponse(BaseModel):
 
 
 def _study_to_metadata(study: Study, patient: Patient | None = None) -> StudyMetadata:
-    """Convert Study model to StudyMetadata response."""
-    return StudyMetadata(
+    """Convert Study model to StudyMetadata response.
+
+    Values come from the database already typed, so validation is skipped.
+    """
+    return StudyMetadata.model_construct(
         study_instance_uid=study.study_instance_uid,
         study_id=study.study_id,
         study_date=study.study_date,
@@ -128,7 +153,7 @@ def _study_to_metadata(study: Study, patient: Patient | None = None) -> StudyMet
         accession_number=study.accession_number,
         referring_physician_name=study.referring_physician_name,
         institution_name=study.institution_name,
-        modalities_in_study=study.modalities_list,
+        modalities_in_study=study.modalities_in_study or [],
         num_series=study.num_series,
         num_instances=study.num_instances,
         patient_id=patient.patient_id if patient else None,
@@ -139,6 +164,70 @@ def _study_to_metadata(study: Study, patient: Patient | None = None) -> StudyMet
     )
 
 
+# Columns read by list_studies; labels match the StudyMetadata field names
+_STUDY_LIST_COLUMNS = (
+    Study.study_instance_uid,
+    Study.study_id,
+    Study.study_date,
+    Study.study_time,
+    Study.study_description,
+    Study.accession_number,
+    Study.referring_physician_name,
+    Study.institution_name,
+    Study.modalities_in_study,
+    Study.num_series,
+    Study.num_instances,
+    Patient.patient_id.label("patient_id"),
+    Patient.patient_name.label("patient_name"),
+    Study.status,
+    Study.created_at,
+    Study.updated_at,
+)
+
+
+def _study_row_to_metadata(row: RowMapping) -> StudyMetadata:
+    """Convert a row of ``_STUDY_LIST_COLUMNS`` to StudyMetadata response (unvalidated)."""
+    study_time = row["study_time"]
+    return StudyMetadata.model_construct(
+        study_instance_uid=row["study_instance_uid"],
+        study_id=row["study_id"],
+        study_date=row["study_date"],
+        study_time=study_time.strftime("%H:%M:%S") if study_time else None,
+        study_description=row["study_description"],
+        accession_number=row["accession_number"],
+        referring_physician_name=row["referring_physician_name"],
+        institution_name=row["institution_name"],
+        modalities_in_study=row["modalities_in_study"] or [],
+        num_series=row["num_series"],
+        num_instances=row["num_instances"],
+        patient_id=row["patient_id"],
+        patient_name=row["patient_name"],
+        status=row["status"].value,
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
+def _drop_page_cache(paths: list[str]) -> None:
+    """Advise the kernel that freshly stored upload files need not stay cached.
+
+    Called once the upload has been parsed and moved into storage, so nothing
+    reads the files back soon; keeping them cached only evicts hotter pages
+    (e.g. the database buffer cache). Pages still being written back are
+    dropped once clean. Blocks on file I/O; call it off the event loop. No-op
+    where ``posix_fadvise`` is unavailable.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        with contextlib.suppress(OSError):
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+
+
 def _normalize_optional_str(value: str | None) -> str | None:
     if value is None:
         return None
@@ -146,29 +235,34 @@ def _normalize_optional_str(value: str | None) -> str | None:
     return stripped or None
 
 
-@router.get("", response_model=StudyListResponse)
-async def list_studies(
-    current_user: Annotated[TokenData, Depends(get_current_active_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-    patient_id: str | None = Query(None, description="Filter by patient ID"),
-    patient_name: str | None = Query(None, description="Filter by patient name (partial match)"),
-    study_date_from: date | None = Query(None, description="Study date from"),
-    study_date_to: date | None = Query(None, description="Study date to"),
-    modality: Modality | None = Query(None, description="Filter by modality"),
-    accession_number: str | None = Query(None, description="Filter by accession number"),
-    study_description: str | None = Query(None, description="Filter by description"),
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-) -> StudyListResponse:
-    """List studies with filtering and pagination.
+def _has_modality(modality: Modality, dialect_name: str) -> ColumnElement[bool]:
+    """Match studies whose Modalities in Study include ``modality`` exactly.
 
-    Supports filtering by patient, date range, modality, and other criteria.
-    Results are paginated for efficient browsing.
+    On PostgreSQL this is ``modalities_in_study @> ARRAY[...]``, served by the
+    GIN index; elsewhere the column is a JSON array and is searched with
+    ``json_each``.
     """
-    # Build query with joins
+    if dialect_name == "postgresql":
+        return Study.modalities_in_study.contains([modality.value])
+    values = func.json_each(Study.modalities_in_study).table_valued("value")
+    return exists(select(1).select_from(values).where(values.c.value == modality.value))
+
+
+def _study_list_query(
+    patient_id: str | None,
+    patient_name: str | None,
+    study_date_from: date | None,
+    study_date_to: date | None,
+    modality: Modality | None,
+    accession_number: str | None,
+    study_description: str | None,
+    dialect_name: str = "postgresql",
+) -> Select:
+    """Build the filtered, ordered study listing query over ``_STUDY_LIST_COLUMNS``."""
+    # Select only the listed columns so rows are not hydrated into ORM objects
     query = (
-        select(Study)
-        .options(selectinload(Study.patient))
+        select(*_STUDY_LIST_COLUMNS)
+        .outerjoin(Patient, Study.patient_id_fk == Patient.id)
         .order_by(Study.study_date.desc().nullslast(), Study.created_at.desc())
     )
 
@@ -176,12 +270,9 @@ async def list_studies(
     filters = []
 
     if patient_id:
-        query = query.join(Patient, Study.patient_id_fk == Patient.id)
         filters.append(Patient.patient_id == patient_id)
 
     if patient_name:
-        if not patient_id:  # Only join if not already joined
-            query = query.outerjoin(Patient, Study.patient_id_fk == Patient.id)
         filters.append(Patient.patient_name.ilike(f"%{patient_name}%"))
 
     if study_date_from:
@@ -191,7 +282,7 @@ async def list_studies(
         filters.append(Study.study_date <= study_date_to)
 
     if modality:
-        filters.append(Study.modalities_in_study.contains(modality.value))
+        filters.append(_has_modality(modality, dialect_name))
 
     if accession_number:
         filters.append(Study.accession_number == accession_number)
@@ -202,6 +293,39 @@ async def list_studies(
     if filters:
         query = query.where(and_(*filters))
 
+    return query
+
+
+@router.get("", response_model=StudyListResponse)
+async def list_studies(
+    current_user: Annotated[TokenData, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    patient_id: str | None = Query(None, description="Filter by patient ID"),
+    patient_name: str | None = Query(None, description="Filter by patient name (partial match)"),
+    study_date_from: date | None = Query(None, description="Study date from"),
+    study_date_to: date | None = Query(None, description="Study date to"),
+    modality: Modality | None = Query(None, description="Filter by modality"),
+    accession_number: str | None = Query(None, description="Filter by accession number"),
+    study_description: str | None = Query(None, description="Filter by description"),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+) -> StudyListResponse:
+    """List studies with filtering and pagination.
+
+    Supports filtering by patient, date range, modality, and other criteria.
+    Results are paginated for efficient browsing.
+    """
+    query = _study_list_query(
+        patient_id,
+        patient_name,
+        study_date_from,
+        study_date_to,
+        modality,
+        accession_number,
+        study_description,
+        db.get_bind().dialect.name,
+    )
+
     # Get total count
     count_query = select(func.count()).select_from(query.subquery())
     total_result = await db.execute(count_query)
@@ -213,10 +337,9 @@ async def list_studies(
 
     # Execute query
     result = await db.execute(query)
-    studies = result.scalars().all()
 
     # Convert to response
-    study_list = [_study_to_metadata(study, study.patient) for study in studies]
+    study_list = [_study_row_to_metadata(row) for row in result.mappings()]
 
     return StudyListResponse(
         total=total,
@@ -226,6 +349,45 @@ async def list_studies(
     )
 
 
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_studies(
+    current_user: Annotated[TokenData, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    patient_id: str | None = Query(None, description="Filter by patient ID"),
+    patient_name: str | None = Query(None, description="Filter by patient name (partial match)"),
+    study_date_from: date | None = Query(None, description="Study date from"),
+    study_date_to: date | None = Query(None, description="Study date to"),
+    modality: Modality | None = Query(None, description="Filter by modality"),
+    accession_number: str | None = Query(None, description="Filter by accession number"),
+    study_description: str | None = Query(None, description="Filter by description"),
+    limit: int | None = Query(None, ge=1, description="Maximum number of studies"),
+) -> StreamingResponse:
+    """Stream studies as newline-delimited JSON.
+
+    Accepts the same filters as the study list, but writes each study as
+    its row arrives from the database instead of building a page first.
+    """
+    query = _study_list_query(
+        patient_id,
+        patient_name,
+        study_date_from,
+        study_date_to,
+        modality,
+        accession_number,
+        study_description,
+        db.get_bind().dialect.name,
+    )
+    if limit:
+        query = query.limit(limit)
+
+    async def _iter_studies() -> AsyncIterator[bytes]:
+        result = await db.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+        async for row in result.mappings():
+            yield _study_row_to_metadata(row).model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(_iter_studies(), media_type="application/x-ndjson")
+
+
 @router.get("/{study_uid}", response_model=StudyDetailResponse)
 async def get_study(
     study_uid: str,
@@ -237,24 +399,46 @@ async def get_study(
     Returns study metadata along with series summaries and
     information about available AI results and annotations.
     """
-    # Query study with related data
+    # Query study with related data and its annotation count in one statement
+    annotations_count_subquery = (
+        select(func.count())
+        .select_from(Annotation)
+        .where(Annotation.study_uid == Study.study_instance_uid)
+        .correlate(Study)
+        .scalar_subquery()
+    )
+    # Only whether a completed AI job exists matters; don't load the jobs themselves
+    ai_results_exist = (
+        select(AIJob.id)
+        .where(
+            AIJob.study_instance_uid == Study.study_instance_uid,
+            AIJob.status == JobStatus.COMPLETED,
+        )
+        .correlate(Study)
+        .exists()
+    )
     query = (
-        select(Study)
+        select(
+            Study,
+            annotations_count_subquery.label("annotations_count"),
+            ai_results_exist.label("ai_results_available"),
+        )
         .options(
-            selectinload(Study.patient),
-            selectinload(Study.series_list),
-            selectinload(Study.ai_jobs),
+            selectinload(Study.patient).raiseload("*"),
+            selectinload(Study.series_list).raiseload("*"),
+            raiseload("*"),
         )
         .where(Study.study_instance_uid == study_uid)
     )
     result = await db.execute(query)
-    study = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not study:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Study not found: {study_uid}",
         )
+    study, annotations_count, ai_results_available = row
 
     # Log access for audit
     audit_logger.log_access(
@@ -264,9 +448,9 @@ async def get_study(
         action="VIEW",
     )
 
-    # Build series summaries
+    # Build series summaries (DB-sourced, so skip validation)
     series_list = [
-        SeriesSummary(
+        SeriesSummary.model_construct(
             series_instance_uid=s.series_instance_uid,
             series_number=s.series_number,
             series_description=s.series_description,
@@ -277,20 +461,10 @@ async def get_study(
         for s in study.series_list
     ]
 
-    # Check for completed AI jobs
-    ai_results_available = any(job.status.value == "COMPLETED" for job in study.ai_jobs)
-
-    # Query annotations count for this study
-    annotation_count_query = (
-        select(func.count()).select_from(Annotation).where(Annotation.study_uid == study_uid)
-    )
-    annotation_count_result = await db.execute(annotation_count_query)
-    annotations_count = annotation_count_result.scalar() or 0
-
     return StudyDetailResponse(
         study=_study_to_metadata(study, study.patient),
         series=series_list,
-        ai_results_available=ai_results_available,
+        ai_results_available=bool(ai_results_available),
         annotations_count=annotations_count,
     )
 
@@ -305,7 +479,7 @@ async def update_study(
     """Update study metadata."""
     query = (
         select(Study)
-        .options(selectinload(Study.patient))
+        .options(selectinload(Study.patient).raiseload("*"), raiseload("*"))
         .where(Study.study_instance_uid == study_uid)
     )
     result = await db.execute(query)
@@ -341,7 +515,7 @@ async def update_study(
         updated_fields.append("institution_name")
     if payload.modalities_in_study is not None:
         filtered = [m.strip() for m in payload.modalities_in_study if m and m.strip()]
-        study.modalities_list = filtered
+        study.modalities_in_study = filtered or None
         updated_fields.append("modalities_in_study")
 
     await db.commit()
@@ -369,21 +543,20 @@ async def upload_study(
     """Upload a new DICOM study.
 
     Accepts multiple DICOM files and creates a new study entry.
-    Files are streamed to disk, validated, and then indexed.
+    Files are streamed to disk, validated, and then indexed. Header parsing
+    runs in a process pool, overlapping with the upload of the next file; the
+    upload stops at the first file whose header fails to parse.
     """
-    import pydicom
-
     if not files:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No files provided",
         )
 
-    settings = get_settings()
-    max_upload_bytes = int(settings.dicom.max_upload_size_gb * 1024 * 1024 * 1024)
-    chunk_size = 4 * 1024 * 1024  # 4MB
-
     dicom_storage = request.app.state.dicom_storage
+    loop = asyncio.get_running_loop()
+    parse_executor = get_parse_executor()
+    upload_id = uuid4().hex
 
     study_uid = None
     patient_data: dict[str, Any] = {}
@@ -391,6 +564,24 @@ async def upload_study(
     series_map: dict[str, Any] = {}
     total_bytes = 0
     stored_files: list[str] = []
+    stored_checksums: list[str] = []
+    # (file name, temp path, checksum, size, parse future) per streamed file
+    pending: list[tuple[str, Path, str, int, asyncio.Future]] = []
+    # First header parse to fail, recorded as soon as it completes
+    parse_failures: list[tuple[str, BaseException]] = []
+
+    def _record_parse_failure(file_name: str, future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            parse_failures.append((file_name, future.exception()))
+
+    def _raise_parse_failure() -> None:
+        file_name, error = parse_failures[0]
+        if isinstance(error, DicomExtractionError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{file_name}: {str(error)}",
+            )
+        raise error
 
     async def _cleanup_temp(temp_path: Any) -> None:
         try:
@@ -398,24 +589,39 @@ async def _cleanup_temp(temp_path: Any) -> None:
         except Exception:
             pass
 
+    async def _discard_upload() -> None:
+        await asyncio.gather(*(entry[4] for entry in pending), return_exceptions=True)
+        for entry in pending:
+            await _cleanup_temp(entry[1])
+        for path in stored_files:
+            await _cleanup_temp(path)
+        if stored_checksums:
+            await dicom_storage.prune_blobs(stored_checksums)
+
     try:
         for file in files:
+            # Stop streaming parts as soon as an earlier one is known to be invalid
+            if parse_failures:
+                _raise_parse_failure()
             file_name = file.filename or "upload.dcm"
             temp_path = dicom_storage.temp_dir / f"{uuid4().hex}.dcm"
             file_bytes = 0
-            checksum = hashlib.sha256()
+            checksum = new_checksum()
 
             try:
                 async with aiofiles.open(temp_path, "wb") as out_file:
                     while True:
-                        chunk = await file.read(chunk_size)
+                        chunk = await file.read(UPLOAD_CHUNK_SIZE)
                         if not chunk:
                             break
+                        if parse_failures:
+                            await _cleanup_temp(temp_path)
+                            _raise_parse_failure()
                         file_bytes += len(chunk)
                         total_bytes += len(chunk)
 
-                        if max_upload_bytes and (
-                            file_bytes > max_upload_bytes or total_bytes > max_upload_bytes
+                        if MAX_UPLOAD_BYTES and (
+                            file_bytes > MAX_UPLOAD_BYTES or total_bytes > MAX_UPLOAD_BYTES
                         ):
                             await _cleanup_temp(temp_path)
                             raise HTTPException(
@@ -427,6 +633,8 @@ async def _cleanup_temp(temp_path: Any) -> None:
 
                         checksum.update(chunk)
                         await out_file.write(chunk)
+
+                    await out_file.flush()
             finally:
                 await file.close()
 
@@ -437,203 +645,67 @@ async def _cleanup_temp(temp_path: Any) -> None:
                     detail=f"File {file_name} is empty",
                 )
 
-            # Parse DICOM to extract metadata
-            try:
-                ds = pydicom.dcmread(str(temp_path), stop_before_pixels=True)
-            except Exception as e:
-                await _cleanup_temp(temp_path)
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid DICOM file {file_name}: {str(e)}",
-                )
-
-            # Extract required UIDs
-            current_study_uid_value = getattr(ds, "StudyInstanceUID", None)
-            series_uid_value = getattr(ds, "SeriesInstanceUID", None)
-            instance_uid_value = getattr(ds, "SOPInstanceUID", None)
-            sop_class_uid_value = getattr(ds, "SOPClassUID", None) or getattr(
-                getattr(ds, "file_meta", None), "MediaStorageSOPClassUID", None
+            # Parse DICOM headers in the pool while the next file streams in
+            parse_future = loop.run_in_executor(
+                parse_executor, extract_upload_metadata, str(temp_path), upload_id
             )
-
-            missing_fields = []
-            if not current_study_uid_value:
-                missing_fields.append("StudyInstanceUID")
-            if not series_uid_value:
-                missing_fields.append("SeriesInstanceUID")
-            if not instance_uid_value:
-                missing_fields.append("SOPInstanceUID")
-            if not sop_class_uid_value:
-                missing_fields.append("SOPClassUID")
-
-            if missing_fields:
-                await _cleanup_temp(temp_path)
+            parse_future.add_done_callback(functools.partial(_record_parse_failure, file_name))
+            pending.append((file_name, temp_path, checksum.hexdigest(), file_bytes, parse_future))
+            # Validate the first file before streaming the rest, so an upload
+            # that is not DICOM at all is refused after one part
+            if len(pending) == 1:
+                await asyncio.wait([parse_future])
+
+        for file_name, temp_path, file_checksum, file_bytes, parse_future in pending:
+            try:
+                metadata = await parse_future
+            except DicomExtractionError as e:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Missing required DICOM fields: {', '.join(missing_fields)}",
+                    detail=f"{file_name}: {str(e)}",
                 )
 
-            current_study_uid = str(current_study_uid_value)
-            series_uid = str(series_uid_value)
-            instance_uid = str(instance_uid_value)
-            sop_class_uid = str(sop_class_uid_value)
+            current_study_uid = metadata["study_instance_uid"]
+            series_uid = metadata["series_instance_uid"]
 
             # Ensure all files belong to the same study
             if study_uid is None:
                 study_uid = current_study_uid
             elif study_uid != current_study_uid:
-                await _cleanup_temp(temp_path)
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="All files must belong to the same study",
                 )
 
-            # Extract patient data (from first file)
+            # Extract patient and study data (from first file)
             if not patient_data:
-                patient_data = {
-                    "patient_id": str(ds.get("PatientID", "UNKNOWN")),
-                    "patient_name": str(ds.get("PatientName", "")),
-                    "birth_date": _parse_dicom_date(ds.get("PatientBirthDate")),
-                    "sex": str(ds.get("PatientSex", "")),
-                }
-
-            # Extract study data (from first file)
+                patient_data = metadata["patient"]
             if not study_data:
-                study_data = {
-                    "study_instance_uid": current_study_uid,
-                    "study_id": str(ds.get("StudyID", "")),
-                    "study_date": _parse_dicom_date(ds.get("StudyDate")),
-                    "study_time": _parse_dicom_time(ds.get("StudyTime")),
-                    "study_description": str(ds.get("StudyDescription", "")),
-                    "accession_number": str(ds.get("AccessionNumber", "")),
-                    "referring_physician_name": str(ds.get("ReferringPhysicianName", "")),
-                    "institution_name": str(ds.get("InstitutionName", "")),
-                }
+                study_data = metadata["study"]
 
             # Extract series data
             if series_uid not in series_map:
-                pixel_spacing_value = None
-                if hasattr(ds, "PixelSpacing") and ds.PixelSpacing:
-                    pixel_spacing_value = (
-                        float(ds.PixelSpacing[0]),
-                        float(ds.PixelSpacing[1]),
-                    )
-                elif hasattr(ds, "ImagerPixelSpacing") and ds.ImagerPixelSpacing:
-                    pixel_spacing_value = (
-                        float(ds.ImagerPixelSpacing[0]),
-                        float(ds.ImagerPixelSpacing[1]),
-                    )
-
-                series_map[series_uid] = {
-                    "series_instance_uid": series_uid,
-                    "series_number": ds.get("SeriesNumber"),
-                    "series_description": str(ds.get("SeriesDescription", "")),
-                    "modality": str(ds.get("Modality", "OT")),
-                    "series_date": _parse_dicom_date(ds.get("SeriesDate")),
-                    "series_time": _parse_dicom_time(ds.get("SeriesTime")),
-                    "body_part_examined": str(ds.get("BodyPartExamined", "")),
-                    "patient_position": str(ds.get("PatientPosition", "")),
-                    "protocol_name": str(ds.get("ProtocolName", "")),
-                    "slice_thickness": (
-                        float(ds.SliceThickness) if hasattr(ds, "SliceThickness") else None
-                    ),
-                    "spacing_between_slices": (
-                        float(ds.SpacingBetweenSlices)
-                        if hasattr(ds, "SpacingBetweenSlices")
-                        else None
-                    ),
-                    "rows": ds.Rows if hasattr(ds, "Rows") else None,
-                    "columns": ds.Columns if hasattr(ds, "Columns") else None,
-                    "pixel_spacing": (
-                        f"{pixel_spacing_value[0]}\\{pixel_spacing_value[1]}"
-                        if pixel_spacing_value
-                        else None
-                    ),
-                    "window_center": (
-                        float(ds.WindowCenter[0])
-                        if hasattr(ds, "WindowCenter") and ds.WindowCenter
-                        else None
-                    ),
-                    "window_width": (
-                        float(ds.WindowWidth[0])
-                        if hasattr(ds, "WindowWidth") and ds.WindowWidth
-                        else None
-                    ),
-                    "instances": [],
-                }
-
-            # Extract instance data
-            instance_data = {
-                "sop_instance_uid": instance_uid,
-                "sop_class_uid": sop_class_uid,
-                "instance_number": ds.get("InstanceNumber"),
-                "rows": ds.Rows if hasattr(ds, "Rows") else None,
-                "columns": ds.Columns if hasattr(ds, "Columns") else None,
-                "bits_allocated": ds.BitsAllocated if hasattr(ds, "BitsAllocated") else None,
-                "bits_stored": ds.BitsStored if hasattr(ds, "BitsStored") else None,
-                "high_bit": ds.HighBit if hasattr(ds, "HighBit") else None,
-                "pixel_representation": (
-                    ds.PixelRepresentation if hasattr(ds, "PixelRepresentation") else None
-                ),
-                "samples_per_pixel": (
-                    ds.SamplesPerPixel if hasattr(ds, "SamplesPerPixel") else None
-                ),
-                "photometric_interpretation": str(ds.get("PhotometricInterpretation", "")),
-                "transfer_syntax_uid": (
-                    str(ds.file_meta.TransferSyntaxUID)
-                    if getattr(ds, "file_meta", None) and getattr(ds.file_meta, "TransferSyntaxUID", None)
-                    else None
-                ),
-                "pixel_spacing": (
-                    f"{float(ds.PixelSpacing[0])}\\{float(ds.PixelSpacing[1])}"
-                    if hasattr(ds, "PixelSpacing") and ds.PixelSpacing
-                    else None
-                ),
-                "image_position_patient": (
-                    "\\".join(str(v) for v in ds.ImagePositionPatient)
-                    if hasattr(ds, "ImagePositionPatient") and ds.ImagePositionPatient
-                    else None
-                ),
-                "image_orientation_patient": (
-                    "\\".join(str(v) for v in ds.ImageOrientationPatient)
-                    if hasattr(ds, "ImageOrientationPatient") and ds.ImageOrientationPatient
-                    else None
-                ),
-                "window_center": (
-                    float(ds.WindowCenter[0])
-                    if hasattr(ds, "WindowCenter") and ds.WindowCenter
-                    else None
-                ),
-                "window_width": (
-                    float(ds.WindowWidth[0])
-                    if hasattr(ds, "WindowWidth") and ds.WindowWidth
-                    else None
-                ),
-                "rescale_intercept": (
-                    float(ds.RescaleIntercept) if hasattr(ds, "RescaleIntercept") else 0.0
-                ),
-                "rescale_slope": float(ds.RescaleSlope) if hasattr(ds, "RescaleSlope") else 1.0,
-                "slice_location": float(ds.SliceLocation) if hasattr(ds, "SliceLocation") else None,
-                "slice_thickness": (
-                    float(ds.SliceThickness) if hasattr(ds, "SliceThickness") else None
-                ),
-                "number_of_frames": int(ds.NumberOfFrames)
-                if hasattr(ds, "NumberOfFrames") and ds.NumberOfFrames
-                else 1,
-            }
+                series_map[series_uid] = {**metadata["series"], "instances": []}
 
+            instance_data = metadata["instance"]
             series_map[series_uid]["instances"].append(instance_data)
 
             # Store file from disk
             storage_result = await dicom_storage.store_instance_file(
                 temp_path,
-                ds,
-                checksum.hexdigest(),
-                file_bytes,
+                patient_id=metadata["patient"]["patient_id"],
+                study_uid=current_study_uid,
+                series_uid=series_uid,
+                instance_uid=metadata["sop_instance_uid"],
+                checksum=file_checksum,
+                file_size=file_bytes,
             )
             instance_data["file_path"] = storage_result["file_path"]
             instance_data["file_size"] = storage_result["file_size"]
             instance_data["file_checksum"] = storage_result["checksum"]
+            instance_data["file_checksum_algo"] = storage_result["checksum_algorithm"]
             stored_files.append(storage_result["file_path"])
+            stored_checksums.append(storage_result["checksum"])
 
         # Create or get patient
         patient_query = select(Patient).where(Patient.patient_id == patient_data["patient_id"])
@@ -646,37 +718,32 @@ async def _cleanup_temp(temp_path: Any) -> None:
             await db.flush()
 
         # Create study
-        modalities = list(set(s["modality"] for s in series_map.values()))
         study = Study(
             **study_data,
-            modalities_in_study=",".join(modalities),
-            num_series=len(series_map),
-            num_instances=sum(len(s["instances"]) for s in series_map.values()),
+            modalities_in_study=sorted({s["modality"] for s in series_map.values()}),
+            content_digest=content_digest(stored_checksums),
             status=StudyStatus.COMPLETE,
             patient_id_fk=patient.id,
         )
         db.add(study)
         await db.flush()
 
-        # Create series and instances
-        for series_data in series_map.values():
+        # Create series and instances with one bulk INSERT each
+        series_rows: list[dict[str, Any]] = []
+        instance_rows: list[dict[str, Any]] = []
+        for series_uid, series_data in series_map.items():
             instances_data = series_data.pop("instances")
-            series = Series(
-                **series_data,
-                study_instance_uid_fk=study.study_instance_uid,
-                num_instances=len(instances_data),
+            series_rows.append({**series_data, "study_instance_uid_fk": study.study_instance_uid})
+            instance_rows.extend(
+                {**inst_data, "series_instance_uid_fk": series_uid} for inst_data in instances_data
             )
-            db.add(series)
-            await db.flush()
-
-            for inst_data in instances_data:
-                instance = Instance(
-                    **inst_data,
-                    series_instance_uid_fk=series.series_instance_uid,
-                )
-                db.add(instance)
 
+        await db.execute(insert(Series), series_rows)
+        await db.execute(insert(Instance), instance_rows)
+        # num_series/num_instances were counted by the series and instance triggers
+        await db.refresh(study, ["num_series", "num_instances"])
         await db.commit()
+        await asyncio.to_thread(_drop_page_cache, stored_files)
 
         audit_logger.log_access(
             user_id=current_user.user_id,
@@ -690,19 +757,11 @@ async def _cleanup_temp(temp_path: Any) -> None:
 
     except HTTPException:
         await db.rollback()
-        for path in stored_files:
-            try:
-                await aiofiles.os.remove(path)
-            except Exception:
-                pass
+        await _discard_upload()
         raise
     except Exception as e:
         await db.rollback()
-        for path in stored_files:
-            try:
-                await aiofiles.os.remove(path)
-            except Exception:
-                pass
+        await _discard_upload()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process uploaded files: {str(e)}",
@@ -732,9 +791,18 @@ async def delete_study(
             detail=f"Study not found: {study_uid}",
         )
 
-    # Delete files from storage
+    # Delete files from storage, then any content blobs only this study referenced
+    checksum_result = await db.execute(
+        select(Instance.file_checksum)
+        .join(Series, Instance.series_instance_uid_fk == Series.series_instance_uid)
+        .where(
+            Series.study_instance_uid_fk == study_uid,
+            Instance.file_checksum_algo == CHECKSUM_ALGORITHM,
+        )
+    )
     dicom_storage = request.app.state.dicom_storage
     await dicom_storage.delete_study(study_uid)
+    await dicom_storage.prune_blobs(checksum_result.scalars().all())
 
     # Delete from database (cascades to series, instances, jobs)
     await db.delete(study)
@@ -746,6 +814,7 @@ async def delete_study(
         resource_id=study_uid,
         action="DELETE",
     )
+    await audit_logger.flush()
 
 
 @router.get("/{study_uid}/thumbnail")
@@ -760,7 +829,7 @@ async def get_study_thumbnail(
     Returns a representative thumbnail from the study's first series.
     """
     # Find study
-    query = select(Study).where(Study.study_instance_uid == study_uid)
+    query = select(Study).options(raiseload("*")).where(Study.study_instance_uid == study_uid)
     result = await db.execute(query)
     study = result.scalar_one_or_none()
 
@@ -788,13 +857,16 @@ async def refresh_study_metadata(
     Re-parses DICOM headers to update study information.
     Useful after manual file modifications or imports.
     """
-    # Find study
-    query = (
-        select(Study)
-        .options(selectinload(Study.patient))
+    # Bump the timestamp server-side and return the updated study in one statement
+    stmt = (
+        update(Study)
         .where(Study.study_instance_uid == study_uid)
+        .values(updated_at=func.now())
+        .returning(Study)
+        .options(selectinload(Study.patient).raiseload("*"), raiseload("*"))
+        .execution_options(populate_existing=True)
     )
-    result = await db.execute(query)
+    result = await db.execute(stmt)
     study = result.scalar_one_or_none()
 
     if not study:
@@ -803,8 +875,6 @@ async def refresh_study_metadata(
             detail=f"Study not found: {study_uid}",
         )
 
-    # Update timestamp
-    study.updated_at = datetime.now()
     await db.commit()
 
     audit_logger.log_access(
@@ -816,30 +886,3 @@ async def refresh_study_metadata(
 
     return _study_to_metadata(study, study.patient)
 
-
-def _parse_dicom_date(value: Any) -> date | None:
-    """Parse DICOM date format (YYYYMMDD)."""
-    if not value:
-        return None
-    try:
-        date_str = str(value)
-        if len(date_str) == 8:
-            return date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))
-    except (ValueError, TypeError):
-        pass
-    return None
-
-
-def _parse_dicom_time(value: Any) -> dt_time | None:
-    """Parse DICOM time format (HHMMSS.FFFFFF)."""
-    if not value:
-        return None
-    try:
-        time_str = str(value).split(".")[0]  # Remove fractional seconds
-        if len(time_str) >= 6:
-            return dt_time(int(time_str[:2]), int(time_str[2:4]), int(time_str[4:6]))
-        if len(time_str) >= 4:
-            return dt_time(int(time_str[:2]), int(time_str[2:4]))
-    except (ValueError, TypeError):
-        pass
-    return None
@@ -1,6 +1,9 @@
 """API v1 Router - Aggregates all API endpoints."""
 
+from typing import Final
+
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.endpoints import (
     admin,
@@ -17,87 +20,26 @@
     studies,
 )
 
-api_router = APIRouter()
-
-# Authentication endpoints
-api_router.include_router(
-    auth.router,
-    prefix="/auth",
-    tags=["Authentication"],
-)
-
-# Patient management
-api_router.include_router(
-    patients.router,
-    prefix="/patients",
-    tags=["Patients"],
-)
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
-# Study management
-api_router.include_router(
-    studies.router,
-    prefix="/studies",
-    tags=["Studies"],
+# (prefix, router, tags) for every resource router mounted under /api/v1
+_ROUTERS: Final[tuple[tuple[str, APIRouter, tuple[str, ...]], ...]] = (
+    ("/auth", auth.router, ("Authentication",)),
+    ("/patients", patients.router, ("Patients",)),
+    ("/studies", studies.router, ("Studies",)),
+    ("/series", series.router, ("Series",)),
+    ("/instances", instances.router, ("Instances",)),
+    ("/ai", ai.router, ("AI Models",)),
+    ("/annotations", annotations.router, ("Annotations",)),
+    ("/export", export.router, ("Export",)),
+    ("/dicomweb", dicomweb.router, ("DICOMweb",)),
+    ("/admin", admin.router, ("Administration",)),
+    ("/dashboard", dashboard.router, ("Dashboard",)),
 )
 
-# Series management
-api_router.include_router(
-    series.router,
-    prefix="/series",
-    tags=["Series"],
-)
+for prefix, router, tags in _ROUTERS:
+    api_router.include_router(router, prefix=prefix, tags=list(tags))
 
-# Instance management
-api_router.include_router(
-    instances.router,
-    prefix="/instances",
-    tags=["Instances"],
-)
-
-# AI inference endpoints
-api_router.include_router(
-    ai.router,
-    prefix="/ai",
-    tags=["AI Models"],
-)
-
-# Annotation endpoints
-api_router.include_router(
-    annotations.router,
-    prefix="/annotations",
-    tags=["Annotations"],
-)
-
-# Export endpoints
-api_router.include_router(
-    export.router,
-    prefix="/export",
-    tags=["Export"],
-)
-
-# DICOMweb endpoints
-api_router.include_router(
-    dicomweb.router,
-    prefix="/dicomweb",
-    tags=["DICOMweb"],
-)
-
-# Admin endpoints
-api_router.include_router(
-    admin.router,
-    prefix="/admin",
-    tags=["Administration"],
-)
-
-# Dashboard endpoints
-api_router.include_router(
-    dashboard.router,
-    prefix="/dashboard",
-    tags=["Dashboard"],
-)
-
-# Health / client error reporting
-api_router.include_router(
-    health.router,
-    tags=["Health"],
-)
+# Health / client error reporting (mounted without a prefix)
+_HEALTH_TAGS: Final = ("Health",)
+api_router.include_router(health.router, tags=list(_HEALTH_TAGS))
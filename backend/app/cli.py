@@ -19,7 +19,10 @@
 import argparse
 import asyncio
 import getpass
+import re
+import secrets
 import sys
+from functools import cache
 from typing import NoReturn
 
 # Ensure we can import from the app package
@@ -35,6 +38,10 @@
     from app.core.security import SecurityManager
 
 
+# Conservative email shape check: local@domain.tld, no whitespace or extra "@"
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
 def print_banner() -> None:
     """Print Horalix View CLI banner."""
     print("\n" + "=" * 50)
@@ -58,11 +65,23 @@ def print_info(message: str) -> None:
     print(f"INFO: {message}")
 
 
+@cache
+def _security() -> SecurityManager:
+    """Get the CLI's shared security manager (built on first use)."""
+    return SecurityManager(
+        secret_key=settings.secret_key,
+        algorithm=settings.algorithm,
+        access_token_expire_minutes=settings.access_token_expire_minutes,
+        bcrypt_rounds=settings.bcrypt_rounds,
+    )
+
+
 async def check_database() -> bool:
     """Check database connectivity."""
+    # Database layer imported here so `version`/`--help` stay fast
     from sqlalchemy import text
 
-    from app.models.base import async_session_maker
+    from app.models import async_session_maker
 
     try:
         print_info("Checking database connectivity...")
@@ -82,51 +101,50 @@ async def create_admin_user(
     full_name: str | None = None,
 ) -> bool:
     """Create an admin user in the database."""
-    import uuid
+    from sqlalchemy import or_, select
+    from sqlalchemy.dialects.postgresql import insert
 
-    from sqlalchemy import select
+    from app.models import User, async_session_maker
 
-    from app.models.base import async_session_maker
-    from app.models.user import User
-
-    security = SecurityManager(
-        secret_key=settings.secret_key,
-        algorithm=settings.algorithm,
-        access_token_expire_minutes=settings.access_token_expire_minutes,
-    )
+    security = _security()
 
     try:
         async with async_session_maker() as session:
-            # Check if username already exists
-            query = select(User).where(User.username == username)
-            result = await session.execute(query)
-            if result.scalar_one_or_none():
-                print_error(f"Username '{username}' already exists")
-                return False
-
-            # Check if email already exists
-            query = select(User).where(User.email == email)
-            result = await session.execute(query)
-            if result.scalar_one_or_none():
-                print_error(f"Email '{email}' already exists")
-                return False
-
-            # Create the admin user
-            user = User(
-                user_id=f"user_{uuid.uuid4().hex[:12]}",
-                username=username,
-                email=email,
-                hashed_password=security.hash_password(password),
-                full_name=full_name or username.title(),
-                roles="admin",
-                is_active=True,
-                is_verified=True,
+            # Insert in one round trip; unique username/email clashes insert nothing
+            user_id = f"user_{secrets.token_urlsafe(9)}"
+            stmt = (
+                insert(User)
+                .values(
+                    user_id=user_id,
+                    username=username,
+                    email=email,
+                    hashed_password=security.hash_password(password),
+                    full_name=full_name or username.title(),
+                    roles="admin",
+                    is_active=True,
+                    is_verified=True,
+                )
+                .on_conflict_do_nothing()
+                .returning(User.user_id)
             )
-            session.add(user)
+            result = await session.execute(stmt)
+            if result.scalar_one_or_none() is None:
+                # Report which constraint clashed
+                query = (
+                    select(User.username, User.email)
+                    .where(or_(User.username == username, User.email == email))
+                    .limit(1)
+                )
+                existing = (await session.execute(query)).first()
+                if existing is not None and existing.username == username:
+                    print_error(f"Username '{username}' already exists")
+                else:
+                    print_error(f"Email '{email}' already exists")
+                return False
             await session.commit()
 
             print_success(f"Admin user '{username}' created successfully")
-            print_info(f"  User ID: {user.user_id}")
+            print_info(f"  User ID: {user_id}")
             print_info(f"  Email: {email}")
             print_info("  Role: admin")
             return True
@@ -141,8 +159,7 @@ async def init_database() -> bool:
     from sqlalchemy import select
 
     from app.api.v1.endpoints.auth import init_default_users
-    from app.models.base import async_session_maker
-    from app.models.user import User
+    from app.models import User, async_session_maker
 
     try:
         # First check DB connectivity
@@ -216,7 +233,7 @@ def cmd_create_admin(args: argparse.Namespace) -> int:
         return 1
 
     # Validate email format (basic check)
-    if "@" not in email or "." not in email:
+    if not _EMAIL_RE.match(email):
         print_error("Invalid email format")
         return 1
 
@@ -1,7 +1,17 @@
 """Core configuration and utilities for Horalix View backend."""
 
-from app.core.config import settings
+from typing import Any
+
 from app.core.logging import get_logger, setup_logging
 from app.core.security import SecurityManager
 
 __all__ = ["settings", "SecurityManager", "setup_logging", "get_logger"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``settings`` lazily so importing app.core does not build it."""
+    if name == "settings":
+        from app.core.config import settings
+
+        return settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,13 +4,14 @@
 supporting environment variables and .env files for different deployment environments.
 """
 
+import re
 import secrets
 import sys
-from functools import lru_cache
+from functools import cache, cached_property
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, TypeVar
 
-from dotenv import load_dotenv
+import orjson
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,8 +19,26 @@
 BACKEND_DIR = Path(__file__).parent.parent.parent
 ENV_FILE = BACKEND_DIR / ".env"
 
-# Load environment variables from .env file
-load_dotenv(ENV_FILE)
+_NestedSettings = TypeVar("_NestedSettings", bound=BaseSettings)
+
+
+@cache
+def _load_env_file() -> None:
+    """Export the .env file into os.environ (once per process).
+
+    Settings reads .env itself; the nested groups read their prefixed
+    variables from os.environ, so the file is exported before the first of
+    them is built rather than at import time.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv(ENV_FILE)
+
+
+def _build_nested(factory: type[_NestedSettings]) -> _NestedSettings:
+    """Build a nested settings group after exporting the .env file."""
+    _load_env_file()
+    return factory()
 
 
 def _generate_dev_secret_key() -> str:
@@ -27,19 +46,57 @@ def _generate_dev_secret_key() -> str:
     return f"dev-only-insecure-{secrets.token_hex(24)}"
 
 
+# Substrings that mark a SECRET_KEY as a placeholder rather than a real secret
+_INSECURE_KEY_RE = re.compile(
+    r"change-this|your-secret|dev-only|changeme|secret-key-here|placeholder",
+    re.IGNORECASE,
+)
+
+
 def _is_insecure_key(key: str) -> bool:
     """Check if the key is insecure (default placeholder or empty)."""
-    insecure_patterns = [
-        "change-this",
-        "your-secret",
-        "dev-only",
-        "changeme",
-        "secret-key-here",
-        "placeholder",
-    ]
     if not key or len(key) < 32:
         return True
-    return any(pattern in key.lower() for pattern in insecure_patterns)
+    return _INSECURE_KEY_RE.search(key) is not None
+
+
+_PROD_SECRET_KEY_FATAL = (
+    "\n"
+    + "=" * 70
+    + "\n"
+    + "FATAL ERROR: SECRET_KEY is not configured for production!\n"
+    + "=" * 70
+    + "\n"
+    + "\n"
+    + "A secure SECRET_KEY is required in production to protect:\n"
+    + "  - JWT authentication tokens\n"
+    + "  - Encrypted sensitive data\n"
+    + "  - Session security\n"
+    + "\n"
+    + "Generate a secure key with:\n"
+    + "  openssl rand -hex 32\n"
+    + "\n"
+    + "Then set it in your environment or .env file:\n"
+    + "  SECRET_KEY=<your-generated-key>\n"
+    + "=" * 70
+    + "\n"
+)
+
+_DEV_SECRET_KEY_WARNING = (
+    "\n"
+    + "!" * 70
+    + "\n"
+    + "WARNING: Using auto-generated temporary SECRET_KEY for development!\n"
+    + "!" * 70
+    + "\n"
+    + "\n"
+    + "This key is NOT secure and will change on every restart.\n"
+    + "For persistent development, add SECRET_KEY to your .env file.\n"
+    + "\n"
+    + "Generate a key with: openssl rand -hex 32\n"
+    + "!" * 70
+    + "\n"
+)
 
 
 class AIModelSettings(BaseSettings):
@@ -253,14 +310,34 @@ class DatabaseSettings(BaseSettings):
     user: str = Field(default="horalix", description="Database user")
     password: str = Field(default="", description="Database password")
     name: str = Field(default="horalix_view", description="Database name")
-    pool_size: int = Field(default=10, ge=1, le=100, description="Connection pool size")
-    max_overflow: int = Field(default=20, ge=0, le=100, description="Max pool overflow")
+    pool_size: int = Field(default=25, ge=1, le=100, description="Connection pool size")
+    max_overflow: int = Field(default=25, ge=0, le=100, description="Max pool overflow")
+    pool_recycle: int = Field(
+        default=1800, ge=-1, description="Recycle pooled connections after N seconds (-1 = never)"
+    )
+    pgbouncer: bool = Field(
+        default=False,
+        description="Connect through PgBouncer in transaction pooling mode (disables prepared statement caching)",
+    )
 
-    @property
+    @cached_property
     def url(self) -> str:
-        """Get database connection URL."""
+        """Get database connection URL (built once per settings instance)."""
         return f"{self.driver}://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
 
+    @cached_property
+    def audit_repr(self) -> str:
+        """Password-free JSON description for audit records."""
+        return orjson.dumps(
+            {
+                "driver": self.driver,
+                "host": self.host,
+                "port": self.port,
+                "user": self.user,
+                "name": self.name,
+            }
+        ).decode()
+
 
 class RedisSettings(BaseSettings):
     """Redis cache configuration settings."""
@@ -273,13 +350,20 @@ class RedisSettings(BaseSettings):
     db: int = Field(default=0, ge=0, le=15, description="Redis database number")
     ssl: bool = Field(default=False, description="Enable SSL for Redis")
 
-    @property
+    @cached_property
     def url(self) -> str:
-        """Get Redis connection URL."""
+        """Get Redis connection URL (built once per settings instance)."""
         protocol = "rediss" if self.ssl else "redis"
         auth = f":{self.password}@" if self.password else ""
         return f"{protocol}://{auth}{self.host}:{self.port}/{self.db}"
 
+    @cached_property
+    def audit_repr(self) -> str:
+        """Password-free JSON description for audit records."""
+        return orjson.dumps(
+            {"host": self.host, "port": self.port, "db": self.db, "ssl": self.ssl}
+        ).decode()
+
 
 class Settings(BaseSettings):
     """Main application settings."""
@@ -289,6 +373,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # Application settings
@@ -298,6 +383,12 @@ class Settings(BaseSettings):
         default="development", description="Deployment environment"
     )
     debug: bool = Field(default=False, description="Enable debug mode")
+    request_log_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of completed requests logged (all are logged in debug mode)",
+    )
     enable_demo_data: bool = Field(
         default=False, description="Enable demo data seeding (development only)"
     )
@@ -318,67 +409,60 @@ class Settings(BaseSettings):
     )
     access_token_expire_minutes: int = Field(default=60, ge=5, description="Token expiration")
     algorithm: str = Field(default="HS256", description="JWT algorithm")
+    bcrypt_rounds: int = Field(
+        default=12, ge=4, le=31, description="bcrypt cost factor (log2 of rounds)"
+    )
 
     # CORS settings
-    cors_origins: list[str] = Field(
-        default=["http://localhost:3000", "http://localhost:5173"],
+    cors_origins: tuple[str, ...] = Field(
+        default=("http://localhost:3000", "http://localhost:5173"),
         description="Allowed CORS origins",
     )
     cors_allow_credentials: bool = Field(default=True, description="Allow CORS credentials")
 
-    # Nested settings
-    ai: AIModelSettings = Field(default_factory=AIModelSettings)
-    dicom: DICOMSettings = Field(default_factory=DICOMSettings)
-    compliance: ComplianceSettings = Field(default_factory=ComplianceSettings)
-    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
-    redis: RedisSettings = Field(default_factory=RedisSettings)
-
     # Integration settings
     fhir_server_url: str | None = Field(default=None, description="FHIR server URL")
     pacs_server_url: str | None = Field(default=None, description="PACS server URL")
 
+    # Nested settings, each read from the environment on first access
+    # (they are not model fields, so model_dump() does not include them)
+    @cached_property
+    def ai(self) -> AIModelSettings:
+        """AI model settings."""
+        return _build_nested(AIModelSettings)
+
+    @cached_property
+    def dicom(self) -> DICOMSettings:
+        """DICOM settings."""
+        return _build_nested(DICOMSettings)
+
+    @cached_property
+    def compliance(self) -> ComplianceSettings:
+        """Compliance settings."""
+        return _build_nested(ComplianceSettings)
+
+    @cached_property
+    def database(self) -> DatabaseSettings:
+        """Database settings."""
+        return _build_nested(DatabaseSettings)
+
+    @cached_property
+    def redis(self) -> RedisSettings:
+        """Redis settings."""
+        return _build_nested(RedisSettings)
+
     @model_validator(mode="after")
     def validate_settings(self) -> "Settings":
         """Validate settings after initialization."""
         # Handle SECRET_KEY based on environment
         if _is_insecure_key(self.secret_key):
             if self.environment == "production":
-                print(
-                    "\n"
-                    "=" * 70 + "\n"
-                    "FATAL ERROR: SECRET_KEY is not configured for production!\n"
-                    "=" * 70 + "\n"
-                    "\n"
-                    "A secure SECRET_KEY is required in production to protect:\n"
-                    "  - JWT authentication tokens\n"
-                    "  - Encrypted sensitive data\n"
-                    "  - Session security\n"
-                    "\n"
-                    "Generate a secure key with:\n"
-                    "  openssl rand -hex 32\n"
-                    "\n"
-                    "Then set it in your environment or .env file:\n"
-                    "  SECRET_KEY=<your-generated-key>\n"
-                    "=" * 70 + "\n",
-                    file=sys.stderr,
-                )
+                print(_PROD_SECRET_KEY_FATAL, file=sys.stderr)
                 raise ValueError("SECRET_KEY must be set to a secure value in production")
             # Development mode - generate a temporary key and warn loudly
             temp_key = _generate_dev_secret_key()
             object.__setattr__(self, "secret_key", temp_key)
-            print(
-                "\n"
-                "!" * 70 + "\n"
-                "WARNING: Using auto-generated temporary SECRET_KEY for development!\n"
-                "!" * 70 + "\n"
-                "\n"
-                "This key is NOT secure and will change on every restart.\n"
-                "For persistent development, add SECRET_KEY to your .env file.\n"
-                "\n"
-                "Generate a key with: openssl rand -hex 32\n"
-                "!" * 70 + "\n",
-                file=sys.stderr,
-            )
+            print(_DEV_SECRET_KEY_WARNING, file=sys.stderr)
 
         # Production-specific validations
         if self.environment == "production":
@@ -388,11 +472,15 @@ def validate_settings(self) -> "Settings":
         return self
 
 
-@lru_cache
-def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+# Global settings instance, built on first access (PEP 562) and then bound
+# as a plain module attribute
+settings: Settings
 
 
-# Global settings instance
-settings = get_settings()
+def __getattr__(name: str) -> Any:
+    """Build the global settings instance the first time it is requested."""
+    if name == "settings":
+        global settings
+        settings = Settings()
+        return settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,13 +4,25 @@
 output formats and log levels based on environment.
 """
 
+import asyncio
+import atexit
+import contextvars
 import logging
+import queue
 import sys
-from typing import Any
+from collections.abc import Callable, Iterable, Sized
+from datetime import datetime, timezone
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING, Any, TypedDict, cast
 
+import orjson
 import structlog
 from structlog.types import EventDict, Processor
 
+if TYPE_CHECKING:
+    from app.services.audit_trail import AuditTrailWriter
+
 
 def add_app_context(logger: logging.Logger, method_name: str, event_dict: EventDict) -> EventDict:
     """Add application context to log entries."""
@@ -18,6 +30,85 @@ def add_app_context(logger: logging.Logger, method_name: str, event_dict: EventD
     return event_dict
 
 
+# Request-scoped fields (request ID, client IP) merged into every event
+_request_context: contextvars.ContextVar[dict[str, Any] | None] = contextvars.ContextVar(
+    "horalix_request_context", default=None
+)
+
+
+def merge_request_context(
+    logger: logging.Logger, method_name: str, event_dict: EventDict
+) -> EventDict:
+    """Merge bound request-scoped fields into the event (no-op when none are bound)."""
+    context = _request_context.get()
+    if context:
+        for key, value in context.items():
+            event_dict.setdefault(key, value)
+    return event_dict
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson (JSONRenderer expects a str)."""
+    return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Processor chains are immutable, so they are built once and shared.
+# The core chain is all the audit logger needs: it never passes stack_info
+# and its fields are never bytes.
+_CORE_PROCESSORS: tuple[Processor, ...] = (
+    merge_request_context,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="iso"),
+    add_app_context,
+)
+
+# General loggers may log stack traces or bytes payloads
+_SHARED_PROCESSORS: tuple[Processor, ...] = _CORE_PROCESSORS + (
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.UnicodeDecoder(),
+)
+
+# JSON output for production
+_JSON_RENDERERS: tuple[Processor, ...] = (
+    structlog.processors.format_exc_info,
+    structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+)
+
+# Human-readable output for development
+_CONSOLE_RENDERERS: tuple[Processor, ...] = (structlog.dev.ConsoleRenderer(colors=True),)
+
+_JSON_PROCESSORS: tuple[Processor, ...] = _SHARED_PROCESSORS + _JSON_RENDERERS
+_CONSOLE_PROCESSORS: tuple[Processor, ...] = _SHARED_PROCESSORS + _CONSOLE_RENDERERS
+
+# Processor chain for audit events under the current configuration
+_audit_processors: tuple[Processor, ...] = _CORE_PROCESSORS + _CONSOLE_RENDERERS
+
+# Arguments of the last setup_logging() call, so repeated calls are no-ops
+_logging_config: tuple[str, bool, str | None] | None = None
+
+# Root handler feeding the log file, and the thread that writes it to disk
+_file_queue_handler: QueueHandler | None = None
+_file_listener: QueueListener | None = None
+
+
+def _stop_file_logging() -> None:
+    """Detach the log file handler, writing out any records still queued."""
+    global _file_queue_handler, _file_listener
+    if _file_queue_handler is not None:
+        logging.getLogger().removeHandler(_file_queue_handler)
+        _file_queue_handler = None
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(_stop_file_logging)
+
+
 def setup_logging(
     log_level: str = "INFO",
     json_logs: bool = False,
@@ -25,62 +116,58 @@ def setup_logging(
 ) -> None:
     """Configure structured logging for the application.
 
+    Calling it again with the same arguments does nothing.
+
     Args:
         log_level: Minimum log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_logs: If True, output logs as JSON (for production)
         log_file: Optional file path for log output
 
     """
+    global _logging_config, _audit_processors, _file_queue_handler, _file_listener
+    config = (log_level, json_logs, log_file)
+    if config == _logging_config:
+        return
+    _logging_config = config
+
+    level = getattr(logging, log_level.upper(), logging.INFO)
+
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper(), logging.INFO),
+        level=level,
     )
 
-    # Shared processors for all outputs
-    shared_processors: list[Processor] = [
-        structlog.contextvars.merge_contextvars,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.UnicodeDecoder(),
-        add_app_context,
-    ]
-
-    if json_logs:
-        # JSON output for production
-        processors: list[Processor] = shared_processors + [
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
-        ]
-    else:
-        # Human-readable output for development
-        processors = shared_processors + [
-            structlog.dev.ConsoleRenderer(colors=True),
-        ]
-
     structlog.configure(
-        processors=processors,
+        processors=list(_JSON_PROCESSORS if json_logs else _CONSOLE_PROCESSORS),
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
-
-    # Configure file handler if specified
+    _audit_processors = _CORE_PROCESSORS + (_JSON_RENDERERS if json_logs else _CONSOLE_RENDERERS)
+    # Drop audit log methods bound under a previous configuration
+    if "audit_logger" in globals():
+        audit_logger.logger = get_audit_logger()
+
+    # Configure file handler if specified; records are queued and written to
+    # disk by a listener thread so logging calls never wait on file I/O
+    _stop_file_logging()
     if log_file:
         file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+        file_handler.setLevel(level)
         if json_logs:
             file_handler.setFormatter(logging.Formatter("%(message)s"))
         else:
             file_handler.setFormatter(
                 logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
             )
-        logging.getLogger().addHandler(file_handler)
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _file_listener = QueueListener(records, file_handler, respect_handler_level=True)
+        _file_listener.start()
+        _file_queue_handler = QueueHandler(records)
+        logging.getLogger().addHandler(_file_queue_handler)
 
 
 def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
@@ -96,16 +183,330 @@ def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
+def get_audit_logger() -> structlog.stdlib.BoundLogger:
+    """Get a logger for audit events, using the core processor chain.
+
+    Returns:
+        BoundLogger writing to the ``audit`` stdlib logger
+
+    """
+    return structlog.wrap_logger(
+        logging.getLogger("audit"),
+        processors=list(_audit_processors),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        context_class=dict,
+        cache_logger_on_first_use=True,
+    )
+
+
+# Background audit delivery: queue bound, events per batch, and max wait to fill a batch
+AUDIT_QUEUE_SIZE = 10_000
+AUDIT_BATCH_SIZE = 100
+AUDIT_FLUSH_INTERVAL = 0.1
+# Resource IDs recorded per data export event
+AUDIT_LOGGED_IDS = 10
+
+# audit_logs action (an AuditAction value) for each (resource_type, action)
+# passed to AuditLogger.log_access()
+_TRAIL_ACCESS_ACTIONS = {
+    ("study", "VIEW"): "study_view",
+    ("study", "UPLOAD"): "study_create",
+    ("study", "UPDATE_METADATA"): "study_update",
+    ("study", "REFRESH"): "study_update",
+    ("study", "DELETE"): "study_delete",
+    ("series", "VIEW"): "series_view",
+    ("series", "UPDATE_METADATA"): "series_update",
+    ("patient", "VIEW"): "patient_view",
+    ("patient", "UPDATE_METADATA"): "patient_update",
+    ("patient", "DELETE"): "patient_delete",
+    ("patient", "MERGE"): "patient_merge",
+    ("annotation", "CREATE"): "annotation_create",
+    ("annotation", "UPDATE"): "annotation_update",
+    ("annotation", "DELETE"): "annotation_delete",
+    ("user", "CREATE"): "user_create",
+}
+
+# audit_logs action for each log_authentication() method on success
+_TRAIL_AUTH_ACTIONS = {
+    "password": "login",
+    "logout": "logout",
+    "password_change": "password_change",
+}
+
+
+def _audit_value(value: Any) -> str:
+    """Render a configuration value for an audit record, truncated for safety.
+
+    Objects exposing ``audit_repr`` (e.g. database/Redis settings) supply a
+    cached, credential-free form instead of their full ``str()``.
+    """
+    return str(getattr(value, "audit_repr", value))[:100]
+
+
+class _QueuedAuditEvent(TypedDict, total=False):
+    """Fields added to an audit record when it is queued."""
+
+    occurred_at: str
+
+
+class AuditEvent(_QueuedAuditEvent):
+    """Fields common to every audit event record."""
+
+    audit_type: str
+
+
+class AccessEvent(AuditEvent):
+    """Resource access audit record."""
+
+    user_id: str
+    resource_type: str
+    resource_id: str
+    action: str
+    success: bool
+    details: dict[str, Any]
+
+
+class AuthEvent(AuditEvent):
+    """Authentication audit record."""
+
+    user_id: str | None
+    username: str
+    success: bool
+    method: str
+    ip_address: str | None
+    failure_reason: str | None
+
+
+class ExportEvent(AuditEvent):
+    """Data export audit record."""
+
+    user_id: str
+    export_type: str
+    resource_count: int
+    resource_ids: list[str]
+    format: str
+    anonymized: bool
+    destination: str | None
+
+
+class ConfigChangeEvent(AuditEvent):
+    """Configuration change audit record."""
+
+    user_id: str
+    setting_name: str
+    old_value: str
+    new_value: str
+    component: str
+
+
+class InferenceEvent(AuditEvent):
+    """AI inference audit record."""
+
+    user_id: str
+    model_name: str
+    study_id: str
+    inference_type: str
+    duration_ms: float
+    success: bool
+    error: str | None
+
+
+# Queued audit event: (level, event, record, context of the logging call)
+_AuditItem = tuple[str, str, AuditEvent, contextvars.Context]
+
+
 class AuditLogger:
     """Specialized logger for audit trail compliance.
 
     Provides methods for logging security-relevant events in a format
     suitable for HIPAA and 21 CFR Part 11 compliance.
+
+    Once ``start()`` has been awaited, events logged from the event loop are
+    queued and written in batches by a background task, keeping audit I/O off
+    the request path. Events are written synchronously when delivery is not
+    running, when called from another thread, or when the queue is full.
+    Callers that must not return before an event is written (deletions,
+    data exports) await ``flush()`` after logging it.
+
+    Request-scoped fields bound with ``bind_request()`` are merged into every
+    event by the ``merge_request_context`` processor; queued events are
+    written in the context they were logged from, so they keep those fields.
+
+    After ``persist_to()``, events are also stored in the ``audit_logs`` table
+    through the audit trail writer.
     """
 
     def __init__(self):
         """Initialize audit logger."""
-        self.logger = get_logger("audit")
+        self._logger = get_audit_logger()
+        # Bound log methods by level, resolved on first use (after setup_logging)
+        self._methods: dict[str, Callable[..., Any]] = {}
+        self._enabled = True
+        self.refresh()
+        # None tells the consumer to finish
+        self._queue: asyncio.Queue[_AuditItem | None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._consumer: asyncio.Task | None = None
+        self._trail: AuditTrailWriter | None = None
+
+    @property
+    def logger(self) -> Any:
+        """Underlying structlog logger for audit events."""
+        return self._logger
+
+    @logger.setter
+    def logger(self, value: Any) -> None:
+        self._logger = value
+        self._methods.clear()
+
+    def _method(self, level: str) -> Callable[..., Any]:
+        """Get the bound log method for a level, caching it after the first lookup."""
+        method = self._methods.get(level)
+        if method is None:
+            method = self._methods[level] = getattr(self._logger, level)
+        return method
+
+    def refresh(self) -> None:
+        """Re-read whether audit logging is enabled from the compliance settings."""
+        from app.core.config import settings
+
+        self._enabled = settings.compliance.audit_logging_enabled
+
+    async def start(self) -> None:
+        """Start background delivery of audit events on the running event loop."""
+        if self._consumer is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=AUDIT_QUEUE_SIZE)
+        self._consumer = asyncio.create_task(self._consume(self._queue))
+
+    async def stop(self) -> None:
+        """Stop background delivery once every queued event has been written."""
+        if self._consumer is None or self._queue is None:
+            return
+        queue, consumer = self._queue, self._consumer
+        self._queue = self._consumer = self._loop = None
+
+        await queue.put(None)
+        await consumer
+
+    def persist_to(self, trail: "AuditTrailWriter | None") -> None:
+        """Also store audit events through a running audit trail writer.
+
+        Args:
+            trail: Started writer, or None to stop storing events
+
+        """
+        self._trail = trail
+
+    def _persist(self, action: str | None, **fields: Any) -> None:
+        """Store an event in the audit trail, if one is attached.
+
+        Args:
+            action: AuditAction value (events without one are only logged)
+            **fields: Other ``SecurityManager.create_audit_entry()`` arguments
+
+        """
+        trail = self._trail
+        if trail is None or action is None:
+            return
+        if fields.get("ip_address") is None:
+            context = _request_context.get()
+            fields["ip_address"] = context.get("ip_address") if context else None
+        try:
+            trail.record(action=action, **fields)
+        except Exception as e:
+            # The event has still been logged
+            get_logger(__name__).error("Failed to record audit trail entry", error=str(e))
+
+    def bind_request(self, request_id: str, ip_address: str | None = None) -> None:
+        """Bind request-scoped fields to all events logged in the current context.
+
+        Args:
+            request_id: Request correlation ID
+            ip_address: Client IP address
+
+        """
+        _request_context.set({"request_id": request_id, "ip_address": ip_address})
+
+    def clear_request(self) -> None:
+        """Drop fields bound with ``bind_request()``."""
+        _request_context.set(None)
+
+    async def flush(self) -> None:
+        """Wait until every audit event queued so far has been written (and stored)."""
+        queue = self._queue
+        if queue is not None and self._on_delivery_loop():
+            await queue.join()
+        if self._trail is not None:
+            await self._trail.flush()
+
+    def enqueue(self, level: str, event: str, **fields: Any) -> None:
+        """Queue an audit event for background delivery, or write it directly.
+
+        Args:
+            level: Log level name (e.g., "info", "warning")
+            event: Audit event name
+            **fields: Event fields
+
+        """
+        self._submit(level, event, cast(AuditEvent, fields))
+
+    def _submit(self, level: str, event: str, record: AuditEvent) -> None:
+        """Queue or write an audit record, passing the record dict through as-is."""
+        queue = self._queue
+        if queue is not None and self._on_delivery_loop():
+            record["occurred_at"] = datetime.now(timezone.utc).isoformat()
+            try:
+                queue.put_nowait((level, event, record, contextvars.copy_context()))
+                return
+            except asyncio.QueueFull:
+                pass  # Backpressure: write in-line rather than drop the event
+        self._method(level)(event, **record)
+
+    def _on_delivery_loop(self) -> bool:
+        """Check whether the caller runs on the loop that owns the audit queue."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    async def _consume(self, queue: asyncio.Queue[_AuditItem | None]) -> None:
+        """Collect queued events into batches and write them off the event loop."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await queue.get()
+            if item is None:
+                queue.task_done()
+                return
+            batch = [item]
+            deadline = loop.time() + AUDIT_FLUSH_INTERVAL
+            while len(batch) < AUDIT_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    queue.task_done()
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception as e:
+                get_logger(__name__).error("Failed to write audit events", error=str(e))
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _write_batch(self, batch: list[_AuditItem]) -> None:
+        """Write a batch of queued audit events."""
+        for level, event, record, context in batch:
+            context.run(self._method(level), event, **record)
 
     def log_access(
         self,
@@ -127,15 +528,25 @@ def log_access(
             details: Additional details
 
         """
-        self.logger.info(
-            "resource_access",
+        if not self._enabled:
+            return
+        record: AccessEvent = {
+            "user_id": user_id,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "action": action,
+            "success": success,
+            "details": details or {},
+            "audit_type": "access",
+        }
+        self._submit("info", "resource_access", record)
+        self._persist(
+            _TRAIL_ACCESS_ACTIONS.get((resource_type, action)),
             user_id=user_id,
             resource_type=resource_type,
             resource_id=resource_id,
-            action=action,
+            details=details,
             success=success,
-            details=details or {},
-            audit_type="access",
         )
 
     def log_authentication(
@@ -158,48 +569,84 @@ def log_authentication(
             failure_reason: Reason for failure (if applicable)
 
         """
-        log_method = self.logger.info if success else self.logger.warning
-        log_method(
-            "authentication",
-            user_id=user_id,
-            username=username,
-            success=success,
-            method=method,
+        if not self._enabled:
+            return
+        record: AuthEvent = {
+            "user_id": user_id,
+            "username": username,
+            "success": success,
+            "method": method,
+            "ip_address": ip_address,
+            "failure_reason": failure_reason,
+            "audit_type": "authentication",
+        }
+        self._submit("info" if success else "warning", "authentication", record)
+        self._persist(
+            _TRAIL_AUTH_ACTIONS.get(method) if success else "login_failed",
+            user_id=user_id or username,
+            resource_type="user",
+            resource_id=username,
+            details={"method": method},
             ip_address=ip_address,
-            failure_reason=failure_reason,
-            audit_type="authentication",
+            success=success,
+            error_message=failure_reason,
         )
 
     def log_data_export(
         self,
         user_id: str,
         export_type: str,
-        resource_ids: list[str],
+        resource_ids: Iterable[str],
         format: str,
         anonymized: bool = False,
         destination: str | None = None,
+        resource_count: int | None = None,
     ) -> None:
         """Log a data export event.
 
         Args:
             user_id: ID of the user exporting data
             export_type: Type of export (e.g., "study", "report")
-            resource_ids: IDs of exported resources
+            resource_ids: IDs of exported resources (any iterable; only the
+                first few are logged)
             format: Export format (e.g., "DICOM", "PDF")
             anonymized: Whether data was anonymized
             destination: Export destination (if applicable)
+            resource_count: Total number of exported resources, when known;
+                otherwise counted from resource_ids in a single pass
 
         """
-        self.logger.info(
-            "data_export",
+        if not self._enabled:
+            return
+        ids = iter(resource_ids)
+        sample = list(islice(ids, AUDIT_LOGGED_IDS))  # Limit logged IDs
+        if resource_count is None:
+            if isinstance(resource_ids, Sized):
+                resource_count = len(resource_ids)
+            else:
+                resource_count = len(sample) + sum(1 for _ in ids)
+        record: ExportEvent = {
+            "user_id": user_id,
+            "export_type": export_type,
+            "resource_count": resource_count,
+            "resource_ids": sample,
+            "format": format,
+            "anonymized": anonymized,
+            "destination": destination,
+            "audit_type": "export",
+        }
+        self._submit("info", "data_export", record)
+        self._persist(
+            "study_export",
             user_id=user_id,
-            export_type=export_type,
-            resource_count=len(resource_ids),
-            resource_ids=resource_ids[:10],  # Limit logged IDs
-            format=format,
-            anonymized=anonymized,
-            destination=destination,
-            audit_type="export",
+            resource_type=export_type,
+            resource_id=",".join(sample)[:256],
+            details={
+                "resource_count": resource_count,
+                "format": format,
+                "anonymized": anonymized,
+                "destination": destination,
+            },
         )
 
     def log_configuration_change(
@@ -220,14 +667,23 @@ def log_configuration_change(
             component: Component/module affected
 
         """
-        self.logger.info(
-            "configuration_change",
+        if not self._enabled:
+            return
+        record: ConfigChangeEvent = {
+            "user_id": user_id,
+            "setting_name": setting_name,
+            "old_value": _audit_value(old_value),
+            "new_value": _audit_value(new_value),
+            "component": component,
+            "audit_type": "configuration",
+        }
+        self._submit("info", "configuration_change", record)
+        self._persist(
+            "settings_change",
             user_id=user_id,
-            setting_name=setting_name,
-            old_value=str(old_value)[:100],  # Truncate for safety
-            new_value=str(new_value)[:100],
-            component=component,
-            audit_type="configuration",
+            resource_type=component,
+            resource_id=setting_name,
+            details={"old_value": record["old_value"], "new_value": record["new_value"]},
         )
 
     def log_ai_inference(
@@ -252,19 +708,43 @@ def log_ai_inference(
             error: Error message if failed
 
         """
-        log_method = self.logger.info if success else self.logger.error
-        log_method(
-            "ai_inference",
+        if not self._enabled:
+            return
+        record: InferenceEvent = {
+            "user_id": user_id,
+            "model_name": model_name,
+            "study_id": study_id,
+            "inference_type": inference_type,
+            "duration_ms": duration_ms,
+            "success": success,
+            "error": error,
+            "audit_type": "ai",
+        }
+        self._submit("info" if success else "error", "ai_inference", record)
+        self._persist(
+            "ai_job_submit",
             user_id=user_id,
-            model_name=model_name,
-            study_id=study_id,
-            inference_type=inference_type,
-            duration_ms=duration_ms,
+            resource_type="study",
+            resource_id=study_id,
+            details={
+                "model_name": model_name,
+                "inference_type": inference_type,
+                "duration_ms": duration_ms,
+            },
             success=success,
-            error=error,
-            audit_type="ai",
+            error_message=error,
         )
 
 
-# Global audit logger instance
-audit_logger = AuditLogger()
+# Global audit logger instance, built on first access (PEP 562) so that
+# importing this module does not read settings
+audit_logger: AuditLogger
+
+
+def __getattr__(name: str) -> Any:
+    """Build the global audit logger the first time it is requested."""
+    if name == "audit_logger":
+        global audit_logger
+        audit_logger = AuditLogger()
+        return audit_logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
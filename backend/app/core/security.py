@@ -4,17 +4,26 @@
 capabilities for HIPAA and 21 CFR Part 11 compliance.
 """
 
+import asyncio
 import base64
 import hashlib
 import hmac
+import os
 import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, ClassVar
 
+import jwt
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from jose import JWTError, jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel
 
@@ -44,6 +53,87 @@ class AuditLogEntry(BaseModel):
     error_message: str | None = None
 
 
+@dataclass(slots=True)
+class AuditEntry:
+    """Audit entry built on the audit hot path.
+
+    Mirrors AuditLogEntry without per-instance validation; convert with
+    ``AuditLogEntry.model_validate(dataclasses.asdict(entry))`` where the
+    API shape is needed.
+    """
+
+    timestamp: datetime
+    user_id: str
+    action: str
+    resource_type: str
+    resource_id: str
+    details: dict[str, Any] = field(default_factory=dict)
+    ip_address: str | None = None
+    user_agent: str | None = None
+    success: bool = True
+    error_message: str | None = None
+
+
+# Leading byte of AES-GCM ciphertexts; Fernet tokens always start with b"g"
+_AEAD_VERSION = b"\x01"
+_AEAD_NONCE_SIZE = 12
+
+# Successful password verifications remembered per manager, and for how long (s)
+VERIFY_CACHE_SIZE = 4096
+VERIFY_CACHE_TTL = 60.0
+
+
+# Threads for bcrypt and key derivation, which release the GIL while hashing
+_crypto_executor: ThreadPoolExecutor | None = None
+
+
+def get_crypto_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool used for password hashing off the event loop."""
+    global _crypto_executor
+    if _crypto_executor is None:
+        _crypto_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="crypto"
+        )
+    return _crypto_executor
+
+
+def shutdown_crypto_executor() -> None:
+    """Shut down the shared crypto pool, if it was started."""
+    global _crypto_executor
+    if _crypto_executor is not None:
+        _crypto_executor.shutdown(wait=True, cancel_futures=True)
+        _crypto_executor = None
+
+
+@lru_cache(maxsize=4)
+def _derive_key(secret_key: str) -> bytes:
+    """Derive the 32-byte master encryption key for a secret key.
+
+    PBKDF2 at 100k iterations costs tens of milliseconds, so the result is
+    shared by every SecurityManager built with the same key.
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b"horalix-view-salt",  # In production, use a unique salt per deployment
+        iterations=100000,
+    )
+    return kdf.derive(secret_key.encode())
+
+
+@lru_cache(maxsize=4)
+def _derive_fernet(secret_key: str) -> Fernet:
+    """Get the legacy Fernet cipher, used to read data encrypted before AES-GCM."""
+    return Fernet(base64.urlsafe_b64encode(_derive_key(secret_key)))
+
+
+@lru_cache(maxsize=4)
+def _derive_aead(secret_key: str) -> AESGCM:
+    """Get the AES-256-GCM cipher, keyed separately from the legacy Fernet key."""
+    hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=b"horalix-view aes-gcm")
+    return AESGCM(hkdf.derive(_derive_key(secret_key)))
+
+
 class SecurityManager:
     """Centralized security manager for authentication, encryption, and auditing.
 
@@ -59,6 +149,7 @@ def __init__(
         secret_key: str,
         algorithm: str = "HS256",
         access_token_expire_minutes: int = 60,
+        bcrypt_rounds: int = 12,
     ):
         """Initialize security manager.
 
@@ -66,29 +157,47 @@ def __init__(
             secret_key: Secret key for JWT signing
             algorithm: JWT algorithm (default: HS256)
             access_token_expire_minutes: Token expiration in minutes
+            bcrypt_rounds: bcrypt cost factor for new password hashes
 
         """
         self.secret_key = secret_key
+        # JWT signing key, encoded once rather than per token
+        self._signing_key = secret_key.encode()
         self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.pwd_context = CryptContext(
+            schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=bcrypt_rounds
+        )
         self._fernet: Fernet | None = None
+        self._aead: AESGCM | None = None
+        # HMAC(password) + hash -> expiry (monotonic time), successes only
+        self._verify_cache: OrderedDict[bytes, float] = OrderedDict()
 
     @property
     def fernet(self) -> Fernet:
-        """Get Fernet encryption instance (lazy initialization)."""
+        """Get legacy Fernet instance for decrypting older data (lazy initialization)."""
         if self._fernet is None:
-            # Derive a 32-byte key from secret_key using PBKDF2
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=b"horalix-view-salt",  # In production, use a unique salt per deployment
-                iterations=100000,
-            )
-            key = base64.urlsafe_b64encode(kdf.derive(self.secret_key.encode()))
-            self._fernet = Fernet(key)
+            self._fernet = _derive_fernet(self.secret_key)
         return self._fernet
 
+    @property
+    def aead(self) -> AESGCM:
+        """Get AES-256-GCM encryption instance (lazy initialization)."""
+        if self._aead is None:
+            self._aead = _derive_aead(self.secret_key)
+        return self._aead
+
+    def warm_up(self) -> None:
+        """Run one-time crypto setup now rather than on the first request.
+
+        Derives the encryption keys, loads passlib's bcrypt backend (which
+        passlib otherwise selects lazily on first use) and round-trips a token
+        so the JWT and TokenData code paths are warm.
+        """
+        _ = self.aead, self.fernet
+        self.pwd_context.dummy_verify()
+        self.decode_token(self.create_access_token({"sub": "warmup"}))
+
     def hash_password(self, password: str) -> str:
         """Hash a password using bcrypt.
 
@@ -111,8 +220,70 @@ def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         Returns:
             True if password matches, False otherwise
 
+        Clients that resend credentials (e.g. HTTP Basic) would otherwise pay a
+        full bcrypt per request, so matches are cached for VERIFY_CACHE_TTL
+        seconds, keyed by a keyed HMAC of the password (never the password
+        itself) and the hash. Failures are never cached.
+
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        key = (
+            hmac.new(self.secret_key.encode(), plain_password.encode(), hashlib.sha256).digest()
+            + hashed_password.encode()
+        )
+        now = time.monotonic()
+        expires = self._verify_cache.get(key)
+        if expires is not None:
+            if expires > now:
+                return True
+            self._verify_cache.pop(key, None)  # May run on several pool threads
+
+        if not self.pwd_context.verify(plain_password, hashed_password):
+            return False
+        self._verify_cache[key] = now + VERIFY_CACHE_TTL
+        if len(self._verify_cache) > VERIFY_CACHE_SIZE:
+            self._verify_cache.popitem(last=False)  # Oldest entry expires first
+        return True
+
+    async def ahash_password(self, password: str) -> str:
+        """Hash a password in the crypto thread pool, keeping the event loop free.
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            Hashed password string
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_crypto_executor(), self.hash_password, password)
+
+    async def averify_password(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password in the crypto thread pool, keeping the event loop free.
+
+        Args:
+            plain_password: Plain text password to verify
+            hashed_password: Stored hash to compare against
+
+        Returns:
+            True if password matches, False otherwise
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_crypto_executor(), self.verify_password, plain_password, hashed_password
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a hash was made with outdated settings (e.g. bcrypt cost).
+
+        Args:
+            hashed_password: Stored hash
+
+        Returns:
+            True if the password should be re-hashed on next successful login
+
+        """
+        return self.pwd_context.needs_update(hashed_password)
 
     def create_access_token(
         self,
@@ -130,11 +301,10 @@ def create_access_token(
 
         """
         to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + (
-            expires_delta or timedelta(minutes=self.access_token_expire_minutes)
-        )
-        to_encode.update({"exp": expire, "iat": datetime.now(timezone.utc)})
-        return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        now = datetime.now(timezone.utc)
+        expire = now + (expires_delta or timedelta(minutes=self.access_token_expire_minutes))
+        to_encode.update({"exp": expire, "iat": now})
+        return jwt.encode(to_encode, self._signing_key, algorithm=self.algorithm)
 
     def decode_token(self, token: str) -> TokenData | None:
         """Decode and validate a JWT token.
@@ -147,7 +317,7 @@ def decode_token(self, token: str) -> TokenData | None:
 
         """
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = jwt.decode(token, self._signing_key, algorithms=[self.algorithm])
             return TokenData(
                 user_id=payload.get("sub", ""),
                 username=payload.get("username", ""),
@@ -155,34 +325,41 @@ def decode_token(self, token: str) -> TokenData | None:
                 permissions=payload.get("permissions", []),
                 exp=datetime.fromtimestamp(payload.get("exp", 0), tz=timezone.utc),
             )
-        except JWTError:
+        except jwt.InvalidTokenError:
             return None
 
     def encrypt_data(self, data: str | bytes) -> bytes:
-        """Encrypt sensitive data using Fernet (AES-128-CBC).
+        """Encrypt sensitive data using AES-256-GCM.
 
         Args:
             data: Data to encrypt (string or bytes)
 
         Returns:
-            Encrypted data as bytes
+            Encrypted data as bytes (version byte, nonce, ciphertext and tag)
 
         """
         if isinstance(data, str):
             data = data.encode()
-        return self.fernet.encrypt(data)
+        nonce = os.urandom(_AEAD_NONCE_SIZE)
+        return _AEAD_VERSION + nonce + self.aead.encrypt(nonce, data, None)
 
     def decrypt_data(self, encrypted_data: bytes) -> bytes:
         """Decrypt encrypted data.
 
         Args:
-            encrypted_data: Data encrypted with encrypt_data()
+            encrypted_data: Data encrypted with encrypt_data(), including
+                legacy Fernet tokens
 
         Returns:
             Decrypted data as bytes
 
         """
-        return self.fernet.decrypt(encrypted_data)
+        if not encrypted_data.startswith(_AEAD_VERSION):
+            return self.fernet.decrypt(encrypted_data)
+        nonce_end = len(_AEAD_VERSION) + _AEAD_NONCE_SIZE
+        return self.aead.decrypt(
+            encrypted_data[len(_AEAD_VERSION) : nonce_end], encrypted_data[nonce_end:], None
+        )
 
     def generate_secure_token(self, length: int = 32) -> str:
         """Generate a cryptographically secure random token.
@@ -214,22 +391,37 @@ def hash_api_key(self, api_key: str) -> str:
             api_key: API key to hash
 
         Returns:
-            SHA-256 hash of the API key
+            SHA-256 hash of the API key (hex)
 
         """
         return hashlib.sha256(api_key.encode()).hexdigest()
 
-    def verify_api_key(self, api_key: str, stored_hash: str) -> bool:
+    def hash_api_key_bytes(self, api_key: str) -> bytes:
+        """Hash an API key for secure storage as a raw 32-byte digest.
+
+        Args:
+            api_key: API key to hash
+
+        Returns:
+            SHA-256 digest of the API key
+
+        """
+        return hashlib.sha256(api_key.encode()).digest()
+
+    def verify_api_key(self, api_key: str, stored_hash: str | bytes) -> bool:
         """Verify an API key against a stored hash.
 
         Args:
             api_key: API key to verify
-            stored_hash: Stored hash to compare
+            stored_hash: Stored hash to compare, either a raw digest from
+                hash_api_key_bytes() or a hex digest from hash_api_key()
 
         Returns:
             True if key matches, False otherwise
 
         """
+        if isinstance(stored_hash, bytes):
+            return hmac.compare_digest(self.hash_api_key_bytes(api_key), stored_hash)
         return hmac.compare_digest(self.hash_api_key(api_key), stored_hash)
 
     @staticmethod
@@ -243,7 +435,7 @@ def create_audit_entry(
         user_agent: str | None = None,
         success: bool = True,
         error_message: str | None = None,
-    ) -> AuditLogEntry:
+    ) -> AuditEntry:
         """Create an audit log entry.
 
         Args:
@@ -258,10 +450,10 @@ def create_audit_entry(
             error_message: Error message if action failed
 
         Returns:
-            AuditLogEntry object
+            AuditEntry object
 
         """
-        return AuditLogEntry(
+        return AuditEntry(
             timestamp=datetime.now(timezone.utc),
             user_id=user_id,
             action=action,
@@ -315,6 +507,11 @@ class PermissionChecker:
         ],
     }
 
+    # Role permissions as sets, built once when the class is defined
+    _ROLE_PERMISSIONS: ClassVar[dict[str, frozenset[str]]] = {
+        role: frozenset(perms) for role, perms in PERMISSIONS.items()
+    }
+
     def __init__(self, user_roles: list[str], user_permissions: list[str] | None = None):
         """Initialize permission checker.
 
@@ -325,14 +522,12 @@ def __init__(self, user_roles: list[str], user_permissions: list[str] | None = N
         """
         self.user_roles = user_roles
         self.user_permissions = user_permissions or self._get_permissions_for_roles(user_roles)
+        # Canonical key for the cached permission decisions
+        self._perm_key = tuple(sorted(set(self.user_permissions)))
 
     def _get_permissions_for_roles(self, roles: list[str]) -> list[str]:
         """Get all permissions for given roles."""
-        permissions = set()
-        for role in roles:
-            role_perms = self.PERMISSIONS.get(role, [])
-            permissions.update(role_perms)
-        return list(permissions)
+        return list(_perms_for_roles(tuple(sorted(roles))))
 
     def has_permission(self, required_permission: str) -> bool:
         """Check if user has a specific permission.
@@ -344,18 +539,7 @@ def has_permission(self, required_permission: str) -> bool:
             True if user has permission, False otherwise
 
         """
-        for perm in self.user_permissions:
-            # Check for wildcard permissions
-            if perm.endswith(":*"):
-                prefix = perm[:-1]  # Remove "*"
-                if required_permission.startswith(prefix) or required_permission.startswith(
-                    perm.split(":")[0]
-                ):
-                    return True
-            # Check for exact match
-            if perm == required_permission:
-                return True
-        return False
+        return _decide(self._perm_key, required_permission)
 
     def has_any_permission(self, permissions: list[str]) -> bool:
         """Check if user has any of the given permissions."""
@@ -364,3 +548,30 @@ def has_any_permission(self, permissions: list[str]) -> bool:
     def has_all_permissions(self, permissions: list[str]) -> bool:
         """Check if user has all of the given permissions."""
         return all(self.has_permission(p) for p in permissions)
+
+
+# The permission table is static, so role expansion and permission decisions
+# are pure functions of their inputs; call cache_clear() on these if
+# PermissionChecker.PERMISSIONS is ever changed at runtime.
+@lru_cache(maxsize=256)
+def _perms_for_roles(roles: tuple[str, ...]) -> frozenset[str]:
+    """Get the union of permissions for a sorted tuple of roles."""
+    empty: frozenset[str] = frozenset()
+    role_permissions = PermissionChecker._ROLE_PERMISSIONS
+    return empty.union(*(role_permissions.get(role, empty) for role in roles))
+
+
+@lru_cache(maxsize=256)
+def _compile_permissions(perm_key: tuple[str, ...]) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Split permissions into exact ones and the "resource:" prefixes of wildcards."""
+    exact = frozenset(p for p in perm_key if not p.endswith(":*"))
+    return exact, tuple(p[:-1] for p in perm_key if p.endswith(":*"))
+
+
+@lru_cache(maxsize=4096)
+def _decide(perm_key: tuple[str, ...], required_permission: str) -> bool:
+    """Decide whether a set of permissions grants the required permission."""
+    exact, wild_prefixes = _compile_permissions(perm_key)
+    if required_permission in exact:
+        return True
+    return any(required_permission.startswith(prefix) for prefix in wild_prefixes)
@@ -3,18 +3,25 @@
 Main FastAPI application entry point.
 """
 
+import asyncio
+import random
+import secrets
+import time
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+from typing import Any
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from prometheus_client import Counter, Histogram, make_asgi_app
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
 
 from app.api.v1.router import api_router
 from app.core.config import settings
-from app.core.logging import get_logger, setup_logging
+from app.core.logging import audit_logger, get_logger, setup_logging
 
 # Initialize logging
 setup_logging(
@@ -37,12 +44,44 @@
 )
 
 
+@lru_cache(maxsize=1024)
+def _request_count(method: str, endpoint: str, status: int) -> Any:
+    """Get the request counter child for a label set (resolved once per set)."""
+    return REQUEST_COUNT.labels(method=method, endpoint=endpoint, status=status)
+
+
+@lru_cache(maxsize=1024)
+def _request_latency(method: str, endpoint: str) -> Any:
+    """Get the latency histogram child for a label set (resolved once per set)."""
+    return REQUEST_LATENCY.labels(method=method, endpoint=endpoint)
+
+
+# DICOM payloads are binary and mostly already compressed (JPEG, JPEG 2000,
+# JPEG-LS transfer syntaxes), so gzipping them burns CPU for no gain
+_GZIP_EXCLUDED_CONTENT_TYPES = DEFAULT_EXCLUDED_CONTENT_TYPES + (
+    "application/dicom",
+    "application/octet-stream",
+    "multipart/related",
+    "image/jp2",
+    "image/jls",
+)
+
+# Probe and scrape endpoints, polled constantly and covered by the metrics
+_UNLOGGED_PATHS = frozenset({"/health", "/ready", "/metrics", "/metrics/"})
+
+
 def _safe_request_path(request: Request) -> str:
     """Return a route template path to avoid logging PHI in URLs."""
     route = request.scope.get("route")
-    if route and hasattr(route, "path"):
-        return route.path
-    return request.url.path
+    path_format = getattr(route, "path_format", None)
+    if path_format is None:
+        return request.url.path
+    # Routes of included routers are relative to their prefix; restore it
+    path = request.scope["path"]
+    concrete = path_format.format(**request.path_params)
+    if concrete and path.endswith(concrete):
+        return path[: len(path) - len(concrete)] + path_format
+    return path_format
 
 
 @asynccontextmanager
@@ -55,12 +94,48 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         environment=settings.environment,
     )
 
+    # Deliver audit events from a background task
+    await audit_logger.start()
+
     # Initialize database
-    from app.models.base import async_session_maker, engine
+    from app.models.base import async_session_maker, engine, warm_pool
 
     app.state.db_engine = engine
     app.state.db_session_maker = async_session_maker
-    logger.info("Database connection pool initialized")
+
+    # Persist audit events to audit_logs in batches from a background task
+    from app.services.audit_trail import audit_trail
+
+    await audit_trail.start()
+    audit_logger.persist_to(audit_trail)
+    try:
+        opened = await warm_pool()
+        logger.info("Database connection pool initialized", connections=opened)
+    except Exception as e:
+        # Log but don't fail startup - connections will be opened on demand
+        logger.warning(f"Could not pre-warm database connection pool: {e}")
+
+    # audit_logs is partitioned by month on PostgreSQL; keep the upcoming
+    # partitions created so new entries don't fall into the default partition
+    partition_task = None
+    if engine.dialect.name == "postgresql":
+        from app.services.audit_trail import maintain_audit_partitions
+
+        partition_task = asyncio.create_task(maintain_audit_partitions(engine))
+
+    # Derive encryption keys, load the bcrypt backend and exercise the JWT path
+    # before serving requests: a few hundred ms of startup (on the crypto pool,
+    # which this also starts) instead of a slow first login
+    from app.api.v1.endpoints.auth import security
+    from app.core.security import get_crypto_executor
+
+    await asyncio.get_running_loop().run_in_executor(get_crypto_executor(), security.warm_up)
+    app.state.security = security
+
+    # Start the DICOM parse pool (and its fork server) before any upload
+    from app.services.dicom.extraction import get_parse_executor
+
+    get_parse_executor()
 
     # Initialize default users (development only unless explicitly enabled)
     if settings.environment != "production" or settings.init_default_users:
@@ -117,11 +192,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if hasattr(app.state, "model_registry"):
         await app.state.model_registry.shutdown()
 
+    from app.services.dicom.extraction import shutdown_parse_executor
+
+    shutdown_parse_executor()
+
+    from app.core.security import shutdown_crypto_executor
+
+    shutdown_crypto_executor()
+
+    if partition_task is not None:
+        partition_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await partition_task
+
+    # Write out queued audit trail entries while the database is still open
+    audit_logger.persist_to(None)
+    await audit_trail.stop()
+
     # Close database connections
     if hasattr(app.state, "db_engine"):
         await app.state.db_engine.dispose()
         logger.info("Database connections closed")
 
+    await audit_logger.stop()
+
     logger.info("Horalix View shutdown complete")
 
 
@@ -151,6 +245,7 @@ def create_application() -> FastAPI:
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
         openapi_url="/openapi.json" if settings.debug else None,
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
@@ -165,48 +260,56 @@ def create_application() -> FastAPI:
     )
 
     # Add GZip compression
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=1000,
+        exclude_content_types=_GZIP_EXCLUDED_CONTENT_TYPES,
+    )
+
+    # Add request logging middleware; Prometheus records every request, so
+    # completion logs can be sampled
+    log_sample_rate = 1.0 if settings.debug else settings.request_log_sample_rate
 
-    # Add request logging middleware
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
-        """Log all incoming requests with timing."""
-        import time
-        import uuid
-
-        request_id = str(uuid.uuid4())[:8]
+        """Time all incoming requests and log a sample of them."""
+        request_id = secrets.token_hex(4)
         start_time = time.time()
-        safe_path = _safe_request_path(request)
-
-        # Add request ID to headers
-        response = await call_next(request)
-        process_time = time.time() - start_time
-
-        # Update metrics
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=safe_path,
-            status=response.status_code,
-        ).inc()
-        REQUEST_LATENCY.labels(
-            method=request.method,
-            endpoint=safe_path,
-        ).observe(process_time)
 
-        # Add custom headers
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Process-Time"] = f"{process_time:.4f}"
-
-        logger.info(
-            "request_completed",
+        # Bind request-scoped fields once for every log and audit event below
+        audit_logger.bind_request(
             request_id=request_id,
-            method=request.method,
-            path=safe_path,
-            status_code=response.status_code,
-            process_time=f"{process_time:.4f}s",
+            ip_address=request.client.host if request.client else None,
         )
-
-        return response
+        try:
+            response = await call_next(request)
+            process_time = time.time() - start_time
+            # Routing has now set the matched route, so this is its template
+            safe_path = _safe_request_path(request)
+
+            # Update metrics
+            _request_count(request.method, safe_path, response.status_code).inc()
+            _request_latency(request.method, safe_path).observe(process_time)
+
+            # Add custom headers
+            response.headers["X-Request-ID"] = request_id
+            response.headers["X-Process-Time"] = f"{process_time:.4f}"
+
+            if safe_path in _UNLOGGED_PATHS or (
+                log_sample_rate < 1.0 and random.random() >= log_sample_rate  # noqa: S311
+            ):
+                return response
+
+            logger.info(
+                "request_completed",
+                method=request.method,
+                path=safe_path,
+                status_code=response.status_code,
+                process_time=f"{process_time:.4f}s",
+            )
+            return response
+        finally:
+            audit_logger.clear_request()
 
     # Mount Prometheus metrics endpoint
     metrics_app = make_asgi_app()
@@ -253,7 +356,7 @@ async def readiness_check(request: Request):
             checks["model_registry"] = request.app.state.model_registry.is_ready()
 
         all_ready = all(checks.values())
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200 if all_ready else 503,
             content={
                 "ready": all_ready,
@@ -272,7 +375,7 @@ async def global_exception_handler(request: Request, exc: Exception):
             error=str(exc),
             exc_info=exc,
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "detail": "Internal server error",
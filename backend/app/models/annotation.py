@@ -7,12 +7,12 @@
 
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING, Optional
-from uuid import uuid4
+from uuid import UUID, uuid4
 
-from sqlalchemy import String, Integer, Text, Boolean, ForeignKey, Index, Enum, JSON
+from sqlalchemy import String, Integer, Text, Boolean, ForeignKey, Index, Enum, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, JSONDocument
 
 if TYPE_CHECKING:
     from app.models.study import Study
@@ -51,13 +51,14 @@ class Annotation(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
-    # Unique annotation ID (UUID for external references)
-    annotation_uid: Mapped[str] = mapped_column(
-        String(36), unique=True, nullable=False, index=True, default=lambda: str(uuid4())
+    # Unique annotation ID (UUID for external references); native 16-byte uuid
+    # on PostgreSQL, CHAR(32) elsewhere
+    annotation_uid: Mapped[UUID] = mapped_column(
+        Uuid, unique=True, nullable=False, index=True, default=uuid4
     )
 
-    # DICOM references
-    study_uid: Mapped[str] = mapped_column(String(128), nullable=False, index=True)
+    # DICOM references (study_uid is indexed by ix_annotations_study_series)
+    study_uid: Mapped[str] = mapped_column(String(128), nullable=False)
     series_uid: Mapped[str] = mapped_column(String(128), nullable=False, index=True)
     instance_uid: Mapped[str] = mapped_column(String(128), nullable=False, index=True)
 
@@ -69,13 +70,13 @@ class Annotation(Base):
         Enum(AnnotationType), nullable=False, index=True
     )
 
-    # Geometric data (stored as JSON)
+    # Geometric data (stored as JSONB on PostgreSQL: parsed once on write, not per read)
     # Contains: points, points_3d, handles, text_position
-    geometry: Mapped[dict] = mapped_column(JSON, nullable=False)
+    geometry: Mapped[dict] = mapped_column(JSONDocument, nullable=False)
 
     # Measurements (stored as JSON array)
     # Each measurement: {value: float, unit: str, label: str}
-    measurements: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    measurements: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
 
     # Labels and descriptions
     label: Mapped[Optional[str]] = mapped_column(String(256), nullable=True)
@@ -97,9 +98,24 @@ class Annotation(Base):
     )
 
     # Composite indexes for common queries
-    # Note: Single-column indexes are already created via index=True on columns
+    # Note: study_uid has no index of its own: it leads ix_annotations_study_series,
+    # which serves study_uid-only filters. series_uid and instance_uid keep
+    # single-column indexes (index=True) because the list endpoint filters on
+    # each of them without study_uid.
     __table_args__ = (
-        Index("ix_annotations_study_series", "study_uid", "series_uid"),
+        # Covers the per-series listing keys so PostgreSQL can answer lookups
+        # of them from the index alone (INCLUDE is ignored elsewhere)
+        Index(
+            "ix_annotations_study_series",
+            "study_uid",
+            "series_uid",
+            postgresql_include=[
+                "instance_uid",
+                "frame_number",
+                "annotation_type",
+                "annotation_uid",
+            ],
+        ),
         Index("ix_annotations_created_at_desc", "created_at"),
     )
 
@@ -8,13 +8,14 @@
 from datetime import datetime
 from enum import Enum as PyEnum
 from typing import Optional
+from uuid import UUID
 
-from sqlalchemy import String, Boolean, Index, Enum, Text, JSON, DateTime, func
+from sqlalchemy import String, Boolean, Index, Enum, Text, DateTime, LargeBinary, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
-from app.models.base import metadata
+from app.models.base import JSONDocument, metadata, uuid7
 
 
 class AuditBase(DeclarativeBase):
@@ -50,6 +51,7 @@ class AuditAction(str, PyEnum):
 
     # Series/Instance operations
     SERIES_VIEW = "series_view"
+    SERIES_UPDATE = "series_update"
     INSTANCE_VIEW = "instance_view"
     PIXEL_DATA_ACCESS = "pixel_data_access"
 
@@ -60,6 +62,11 @@ class AuditAction(str, PyEnum):
     PATIENT_DELETE = "patient_delete"
     PATIENT_MERGE = "patient_merge"
 
+    # Annotation operations
+    ANNOTATION_CREATE = "annotation_create"
+    ANNOTATION_UPDATE = "annotation_update"
+    ANNOTATION_DELETE = "annotation_delete"
+
     # AI operations
     AI_JOB_SUBMIT = "ai_job_submit"
     AI_JOB_CANCEL = "ai_job_cancel"
@@ -94,10 +101,11 @@ class AuditLog(AuditBase):
 
     __tablename__ = "audit_logs"
 
-    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    # Time-ordered UUIDv7, generated client-side (no sequence hotspot)
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid7)
 
     # Action details
-    action: Mapped[AuditAction] = mapped_column(Enum(AuditAction), nullable=False, index=True)
+    action: Mapped[AuditAction] = mapped_column(Enum(AuditAction), nullable=False)
     action_description: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
 
     # User information
@@ -110,11 +118,11 @@ class AuditLog(AuditBase):
     resource_id: Mapped[Optional[str]] = mapped_column(String(256), nullable=True, index=True)
 
     # Additional context (JSON)
-    details: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    details: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
 
     # Before/after values for modifications
-    old_value: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    new_value: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    old_value: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
+    new_value: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
 
     # Request information
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
@@ -127,20 +135,42 @@ class AuditLog(AuditBase):
     success: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    # Tamper-evident hash chain: row_hash = SHA-256(prev_hash || canonical row),
+    # see app.services.audit_trail (NULL for rows written before chaining)
+    prev_hash: Mapped[Optional[bytes]] = mapped_column(LargeBinary(32), nullable=True)
+    row_hash: Mapped[Optional[bytes]] = mapped_column(LargeBinary(32), nullable=True, index=True)
+
     # Timestamp (using server time for accuracy)
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
-        index=True,
     )
 
-    # Indexes for compliance queries
+    # Indexes for compliance queries. On PostgreSQL the table is range
+    # partitioned by month on timestamp with primary key (id, timestamp), see
+    # migration 014; ids are unique UUIDv7s, so id alone identifies a row and
+    # stays the mapped key
     __table_args__ = (
         Index("ix_audit_logs_user_timestamp", "user_id", "timestamp"),
         Index("ix_audit_logs_resource_timestamp", "resource_type", "resource_id", "timestamp"),
-        Index("ix_audit_logs_action_timestamp", "action", "timestamp"),
-        Index("ix_audit_logs_timestamp_desc", timestamp.desc()),
+        # Serves action-filtered, newest-first pages without a sort (id breaks ties)
+        Index("ix_audit_logs_action_timestamp_id", "action", timestamp.desc(), id.desc()),
+        # Rows arrive in timestamp order, so a BRIN index serves time-range
+        # scans (retention, export) at a fraction of a B-tree's size
+        Index(
+            "ix_audit_logs_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 128},
+        ),
+        # Containment filters on details (details @> '{...}'); PostgreSQL only
+        Index(
+            "ix_audit_logs_details_gin",
+            "details",
+            postgresql_using="gin",
+            postgresql_ops={"details": "jsonb_path_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -4,11 +4,24 @@
 Provides async SQLAlchemy engine, session factory, and base model class.
 """
 
+import asyncio
+import secrets
+import threading
+import time
 from datetime import datetime
-from typing import AsyncGenerator
-
-from sqlalchemy import MetaData, DateTime, func
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from typing import Any, AsyncGenerator
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, MetaData, DateTime, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+    async_sessionmaker,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from app.core.config import settings
@@ -24,6 +37,41 @@
 
 metadata = MetaData(naming_convention=convention)
 
+# JSON document columns: binary, indexable jsonb on PostgreSQL, JSON elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+_uuid7_lock = threading.Lock()
+_uuid7_last = (0, 0)
+
+
+def uuid7(after: UUID | None = None) -> UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+
+    The 12-bit rand_a field is a counter within each millisecond, so values
+    generated by one process are strictly increasing.
+
+    Args:
+        after: Value the result must sort after, such as one generated by
+            another process in the same millisecond
+
+    """
+    global _uuid7_last
+    with _uuid7_lock:
+        ms = time.time_ns() // 1_000_000
+        last_ms, counter = _uuid7_last
+        if after is not None:
+            last_ms, counter = max((last_ms, counter), (after.int >> 80, (after.int >> 64) & 0xFFF))
+        if ms > last_ms:
+            counter = secrets.randbits(10)  # Random start, leaving room to count
+        else:
+            ms, counter = last_ms, counter + 1
+            if counter > 0xFFF:
+                ms, counter = ms + 1, 0
+        _uuid7_last = (ms, counter)
+    return UUID(
+        int=(ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | secrets.randbits(62)
+    )
+
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
@@ -44,13 +92,33 @@ class Base(DeclarativeBase):
     )
 
 
+def engine_connect_args() -> dict[str, Any]:
+    """
+    Get asyncpg connect arguments for the configured database.
+
+    PgBouncer in transaction pooling mode hands each transaction a possibly
+    different server connection, so asyncpg's named prepared statement caches
+    must be disabled and statement names made unique.
+    """
+    if not settings.database.pgbouncer:
+        return {}
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     settings.database.url,
     echo=settings.debug,
+    poolclass=AsyncAdaptedQueuePool,
     pool_size=settings.database.pool_size,
     max_overflow=settings.database.max_overflow,
+    pool_recycle=settings.database.pool_recycle,
     pool_pre_ping=True,
+    connect_args=engine_connect_args(),
 )
 
 # Create async session factory
@@ -69,6 +137,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
     Yields:
         AsyncSession: Database session that is automatically closed after use
+
     """
     async with async_session_maker() as session:
         try:
@@ -81,6 +150,44 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def warm_pool(target: AsyncEngine | None = None, size: int | None = None) -> int:
+    """
+    Open pooled connections up front so the first requests skip the connect cost.
+
+    All connections are checked out concurrently (forcing the pool to open
+    ``size`` distinct connections) and then returned to the pool.
+
+    Args:
+        target: Engine to warm (defaults to the application engine)
+        size: Number of connections to open (defaults to the configured pool size)
+
+    Returns:
+        Number of connections opened
+
+    """
+    target = target if target is not None else engine
+    size = size if size is not None else settings.database.pool_size
+
+    async def _open() -> AsyncConnection:
+        conn = await target.connect()
+        try:
+            await conn.execute(text("SELECT 1"))
+        except Exception:
+            await conn.close()
+            raise
+        return conn
+
+    results = await asyncio.gather(*(_open() for _ in range(size)), return_exceptions=True)
+    connections = [r for r in results if isinstance(r, AsyncConnection)]
+    for conn in connections:
+        await conn.close()
+
+    for r in results:
+        if isinstance(r, BaseException):
+            raise r
+    return len(connections)
+
+
 async def create_tables() -> None:
     """Create all database tables."""
     async with engine.begin() as conn:
@@ -7,7 +7,8 @@
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Integer, Float, ForeignKey, Index, BigInteger
+from sqlalchemy import DDL, JSON, String, Integer, Float, ForeignKey, Index, BigInteger, event
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -63,14 +64,20 @@ class Instance(Base):
     slice_location: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     slice_thickness: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
-    # Image Position Patient (0020,0032) - stored as "x\y\z"
-    image_position_patient: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
+    # Image Position Patient (0020,0032) - [x, y, z]
+    image_position_patient: Mapped[Optional[list[float]]] = mapped_column(
+        ARRAY(Float).with_variant(JSON(), "sqlite"), nullable=True
+    )
 
-    # Image Orientation Patient (0020,0037) - stored as "r1\r2\r3\c1\c2\c3"
-    image_orientation_patient: Mapped[Optional[str]] = mapped_column(String(256), nullable=True)
+    # Image Orientation Patient (0020,0037) - [r1, r2, r3, c1, c2, c3]
+    image_orientation_patient: Mapped[Optional[list[float]]] = mapped_column(
+        ARRAY(Float).with_variant(JSON(), "sqlite"), nullable=True
+    )
 
-    # Pixel Spacing (0028,0030) - stored as "row\col"
-    pixel_spacing: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    # Pixel Spacing (0028,0030) - [row, col]
+    pixel_spacing: Mapped[Optional[list[float]]] = mapped_column(
+        ARRAY(Float).with_variant(JSON(), "sqlite"), nullable=True
+    )
 
     # Number of frames (for multiframe instances)
     number_of_frames: Mapped[int] = mapped_column(Integer, default=1)
@@ -79,6 +86,8 @@ class Instance(Base):
     file_path: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
     file_size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     file_checksum: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    # Hash algorithm used for file_checksum ("blake3"; legacy rows are "sha256")
+    file_checksum_algo: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
 
     # Series relationship
     series_instance_uid_fk: Mapped[str] = mapped_column(
@@ -90,42 +99,38 @@ class Instance(Base):
 
     # Indexes for common queries
     __table_args__ = (
-        Index("ix_instances_series_uid", "series_instance_uid_fk"),
+        # Series playback order, covering the frame columns for index-only
+        # scans; on PostgreSQL the table is clustered on it (migration 022)
+        Index(
+            "ix_instances_series_order",
+            "series_instance_uid_fk",
+            "instance_number",
+            postgresql_include=["sop_instance_uid", "file_path", "slice_location"],
+        ),
         Index("ix_instances_number", "instance_number"),
         Index("ix_instances_slice_location", "slice_location"),
+        Index("ix_instances_file_checksum", "file_checksum"),
     )
 
     @property
     def image_position_tuple(self) -> tuple[float, float, float] | None:
         """Get image position as a tuple (x, y, z)."""
-        if self.image_position_patient:
-            parts = self.image_position_patient.split("\\")
-            if len(parts) == 3:
-                return (float(parts[0]), float(parts[1]), float(parts[2]))
+        value = self.image_position_patient
+        if value and len(value) == 3:
+            return (value[0], value[1], value[2])
         return None
 
     @image_position_tuple.setter
     def image_position_tuple(self, value: tuple[float, float, float] | None) -> None:
         """Set image position from a tuple."""
-        if value:
-            self.image_position_patient = f"{value[0]}\\{value[1]}\\{value[2]}"
-        else:
-            self.image_position_patient = None
+        self.image_position_patient = list(value) if value else None
 
     @property
     def image_orientation_tuple(self) -> tuple[float, float, float, float, float, float] | None:
         """Get image orientation as a tuple (row/col direction cosines)."""
-        if self.image_orientation_patient:
-            parts = self.image_orientation_patient.split("\\")
-            if len(parts) == 6:
-                return (
-                    float(parts[0]),
-                    float(parts[1]),
-                    float(parts[2]),
-                    float(parts[3]),
-                    float(parts[4]),
-                    float(parts[5]),
-                )
+        value = self.image_orientation_patient
+        if value and len(value) == 6:
+            return (value[0], value[1], value[2], value[3], value[4], value[5])
         return None
 
     @image_orientation_tuple.setter
@@ -133,29 +138,81 @@ def image_orientation_tuple(
         self, value: tuple[float, float, float, float, float, float] | None
     ) -> None:
         """Set image orientation from a tuple."""
-        if value:
-            self.image_orientation_patient = (
-                f"{value[0]}\\{value[1]}\\{value[2]}\\{value[3]}\\{value[4]}\\{value[5]}"
-            )
-        else:
-            self.image_orientation_patient = None
+        self.image_orientation_patient = list(value) if value else None
 
     @property
     def pixel_spacing_tuple(self) -> tuple[float, float] | None:
         """Get pixel spacing as a tuple (row, col)."""
-        if self.pixel_spacing:
-            parts = self.pixel_spacing.split("\\")
-            if len(parts) == 2:
-                return (float(parts[0]), float(parts[1]))
+        value = self.pixel_spacing
+        if value and len(value) == 2:
+            return (value[0], value[1])
         return None
 
     @pixel_spacing_tuple.setter
     def pixel_spacing_tuple(self, value: tuple[float, float] | None) -> None:
         """Set pixel spacing from a tuple."""
-        if value:
-            self.pixel_spacing = f"{value[0]}\\{value[1]}"
-        else:
-            self.pixel_spacing = None
+        self.pixel_spacing = list(value) if value else None
 
     def __repr__(self) -> str:
         return f"<Instance(id={self.id}, uid='{self.sop_instance_uid}', number={self.instance_number})>"
+
+
+# Series.num_instances and Study.num_instances follow instance inserts and
+# deletes in the database (migration 021), so neither uploads nor readers
+# count instances. PostgreSQL aggregates each statement's transition table, so
+# a bulk insert updates every series row once rather than once per instance.
+_PG_COUNT_TRIGGERS = (
+    """
+    CREATE OR REPLACE FUNCTION instances_update_counts() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    DECLARE
+        delta integer := CASE TG_OP WHEN 'INSERT' THEN 1 ELSE -1 END;
+    BEGIN
+        UPDATE series AS s SET num_instances = s.num_instances + delta * c.n
+        FROM (
+            SELECT series_instance_uid_fk AS uid, count(*) AS n
+            FROM changed_rows GROUP BY series_instance_uid_fk
+        ) AS c
+        WHERE s.series_instance_uid = c.uid;
+        UPDATE studies AS st SET num_instances = st.num_instances + delta * c.n
+        FROM (
+            SELECT s.study_instance_uid_fk AS uid, count(*) AS n
+            FROM changed_rows AS i
+            JOIN series AS s ON s.series_instance_uid = i.series_instance_uid_fk
+            GROUP BY s.study_instance_uid_fk
+        ) AS c
+        WHERE st.study_instance_uid = c.uid;
+        RETURN NULL;
+    END
+    $$
+    """,
+    "CREATE TRIGGER instances_count_insert AFTER INSERT ON instances "
+    "REFERENCING NEW TABLE AS changed_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION instances_update_counts()",
+    "CREATE TRIGGER instances_count_delete AFTER DELETE ON instances "
+    "REFERENCING OLD TABLE AS changed_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION instances_update_counts()",
+)
+
+# SQLite (tests, local development) only has row-level triggers
+_SQLITE_COUNT_TRIGGERS = tuple(f"""
+    CREATE TRIGGER instances_count_{op.lower()} AFTER {op} ON instances
+    BEGIN
+        UPDATE series SET num_instances = num_instances {sign} 1
+        WHERE series_instance_uid = {row}.series_instance_uid_fk;
+        UPDATE studies SET num_instances = num_instances {sign} 1
+        WHERE study_instance_uid = (
+            SELECT study_instance_uid_fk FROM series
+            WHERE series_instance_uid = {row}.series_instance_uid_fk
+        );
+    END
+    """ for op, row, sign in (("INSERT", "NEW", "+"), ("DELETE", "OLD", "-")))  # noqa: S608
+
+for _dialect, _statements in (
+    ("postgresql", _PG_COUNT_TRIGGERS),
+    ("sqlite", _SQLITE_COUNT_TRIGGERS),
+):
+    for _statement in _statements:
+        event.listen(
+            Instance.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect)
+        )
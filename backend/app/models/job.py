@@ -9,10 +9,24 @@
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Integer, Float, ForeignKey, Index, Enum, Text, JSON
+from sqlalchemy import (
+    BigInteger,
+    Computed,
+    String,
+    Integer,
+    Float,
+    ForeignKey,
+    Index,
+    Enum,
+    Text,
+    column,
+    text,
+)
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql.functions import FunctionElement
 
-from app.models.base import Base
+from app.models.base import Base, JSONDocument
 
 if TYPE_CHECKING:
     from app.models.study import Study
@@ -77,6 +91,26 @@ class JobStatus(str, PyEnum):
     CANCELLED = "cancelled"
 
 
+class ElapsedMs(FunctionElement):
+    """Whole milliseconds from the first timestamp argument to the second."""
+
+    type = BigInteger()
+    inherit_cache = True
+
+
+@compiles(ElapsedMs, "postgresql")
+def _elapsed_ms_postgresql(element: ElapsedMs, compiler, **kw) -> str:
+    start, end = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"(EXTRACT(EPOCH FROM ({end} - {start})) * 1000)::bigint"
+
+
+@compiles(ElapsedMs)
+def _elapsed_ms_default(element: ElapsedMs, compiler, **kw) -> str:
+    # SQLite: julianday() counts (fractional) days
+    start, end = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"CAST(ROUND((julianday({end}) - julianday({start})) * 86400000) AS INTEGER)"
+
+
 class AIJob(Base):
     """
     AIJob model representing an AI inference job.
@@ -96,9 +130,9 @@ class AIJob(Base):
     model_type: Mapped[ModelType] = mapped_column(Enum(ModelType), nullable=False)
     task_type: Mapped[TaskType] = mapped_column(Enum(TaskType), nullable=False)
 
-    # Job status
+    # Job status (queried through ix_ai_jobs_status_priority, which leads with it)
     status: Mapped[JobStatus] = mapped_column(
-        Enum(JobStatus), default=JobStatus.PENDING, nullable=False, index=True
+        Enum(JobStatus), default=JobStatus.PENDING, nullable=False
     )
     progress: Mapped[float] = mapped_column(Float, default=0.0)
 
@@ -122,44 +156,50 @@ class AIJob(Base):
     submitted_by: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
 
     # Model parameters (JSON)
-    parameters: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    parameters: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
 
     # Results (JSON structure depends on task type)
-    results: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    results: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
 
     # Result file paths (for masks, enhanced images, etc.)
-    result_files: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    result_files: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
 
     # Error information
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    error_traceback: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Write-only diagnostics: deferred so job queries never fetch (or detoast) it
+    error_traceback: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
 
     # Performance metrics
     inference_time_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     gpu_memory_mb: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
+    # Job duration, computed by the database whenever the timestamps change
+    duration_ms: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        Computed(ElapsedMs(column("started_at"), column("completed_at")), persisted=True),
+        nullable=True,
+    )
+
     # Quality metrics (depends on task type)
-    quality_metrics: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    quality_metrics: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
 
     # Relationships
     study: Mapped["Study"] = relationship("Study", back_populates="ai_jobs")
 
     # Indexes
     __table_args__ = (
-        Index("ix_ai_jobs_status_priority", "status", "priority"),
+        # Next-job lookups: status match, then priority and age from one range scan
+        Index("ix_ai_jobs_status_priority", "status", "priority", text("created_at DESC")),
         Index("ix_ai_jobs_study_uid", "study_instance_uid"),
         Index("ix_ai_jobs_model_type", "model_type"),
         Index("ix_ai_jobs_submitted_by", "submitted_by"),
         Index("ix_ai_jobs_created_at", "created_at"),
+        Index("ix_ai_jobs_duration", "duration_ms"),
     )
 
-    @property
-    def duration_ms(self) -> int | None:
-        """Calculate job duration in milliseconds."""
-        if self.started_at and self.completed_at:
-            delta = self.completed_at - self.started_at
-            return int(delta.total_seconds() * 1000)
-        return None
+    # Read duration_ms back in the same statement (RETURNING) after each
+    # INSERT/UPDATE rather than expiring it
+    __mapper_args__ = {"eager_defaults": True}
 
     def __repr__(self) -> str:
         return f"<AIJob(id={self.id}, job_id='{self.job_id}', model='{self.model_type}', status='{self.status}')>"
@@ -63,7 +63,15 @@ class Patient(Base):
 
     # Indexes for common queries
     __table_args__ = (
-        Index("ix_patients_name_lower", "patient_name"),
+        # Name-ordered patient lists
+        Index("ix_patients_name", "patient_name"),
+        # Partial, case-insensitive name search (ILIKE '%...%'); needs pg_trgm
+        Index(
+            "ix_patients_name_trgm",
+            "patient_name",
+            postgresql_using="gin",
+            postgresql_ops={"patient_name": "gin_trgm_ops"},
+        ),
         Index("ix_patients_birth_date", "birth_date"),
     )
 
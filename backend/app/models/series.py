@@ -8,7 +8,7 @@
 from datetime import date, time
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Date, Time, Integer, Float, ForeignKey, Index
+from sqlalchemy import DDL, String, Date, Time, Integer, Float, ForeignKey, Index, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -79,8 +79,8 @@ class Series(Base):
     # DICOM Window Width (0028,1051) - default value
     window_width: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
-    # Calculated fields
-    num_instances: Mapped[int] = mapped_column(Integer, default=0)
+    # Calculated fields, maintained by triggers on instances
+    num_instances: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
 
     # Study relationship
     study_instance_uid_fk: Mapped[str] = mapped_column(
@@ -127,3 +127,54 @@ def __repr__(self) -> str:
         return (
             f"<Series(id={self.id}, uid='{self.series_instance_uid}', modality='{self.modality}')>"
         )
+
+
+# Study.num_series (and the series' share of Study.num_instances) follow series
+# inserts and deletes in the database, like the instance counters
+# (app.models.instance). A series removed by the studies -> series cascade
+# takes its instance count with it, since its instances can no longer be
+# joined back to the study when they are deleted in turn.
+_PG_COUNT_TRIGGERS = (
+    """
+    CREATE OR REPLACE FUNCTION series_update_counts() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    DECLARE
+        delta integer := CASE TG_OP WHEN 'INSERT' THEN 1 ELSE -1 END;
+    BEGIN
+        UPDATE studies AS st
+        SET num_series = st.num_series + delta * c.n,
+            num_instances = st.num_instances + delta * c.instances
+        FROM (
+            SELECT study_instance_uid_fk AS uid, count(*) AS n,
+                   sum(num_instances) AS instances
+            FROM changed_rows GROUP BY study_instance_uid_fk
+        ) AS c
+        WHERE st.study_instance_uid = c.uid;
+        RETURN NULL;
+    END
+    $$
+    """,
+    "CREATE TRIGGER series_count_insert AFTER INSERT ON series "
+    "REFERENCING NEW TABLE AS changed_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION series_update_counts()",
+    "CREATE TRIGGER series_count_delete AFTER DELETE ON series "
+    "REFERENCING OLD TABLE AS changed_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION series_update_counts()",
+)
+
+_SQLITE_COUNT_TRIGGERS = tuple(f"""
+    CREATE TRIGGER series_count_{op.lower()} AFTER {op} ON series
+    BEGIN
+        UPDATE studies
+        SET num_series = num_series {sign} 1,
+            num_instances = num_instances {sign} {row}.num_instances
+        WHERE study_instance_uid = {row}.study_instance_uid_fk;
+    END
+    """ for op, row, sign in (("INSERT", "NEW", "+"), ("DELETE", "OLD", "-")))  # noqa: S608
+
+for _dialect, _statements in (
+    ("postgresql", _PG_COUNT_TRIGGERS),
+    ("sqlite", _SQLITE_COUNT_TRIGGERS),
+):
+    for _statement in _statements:
+        event.listen(Series.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
@@ -9,7 +9,8 @@
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Date, Time, Integer, ForeignKey, Index, Enum, Text, ARRAY
+from sqlalchemy import JSON, String, Date, Time, Integer, ForeignKey, Index, Enum, Text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -69,12 +70,17 @@ class Study(Base):
     # DICOM Station Name (0008,1010)
     station_name: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
 
-    # DICOM Modalities in Study (0008,0061) - stored as comma-separated
-    modalities_in_study: Mapped[Optional[str]] = mapped_column(String(256), nullable=True)
+    # DICOM Modalities in Study (0008,0061) - stored as text[] (GIN indexed on Postgres)
+    modalities_in_study: Mapped[Optional[list[str]]] = mapped_column(
+        ARRAY(String(16)).with_variant(JSON(), "sqlite"), nullable=True
+    )
+
+    # Calculated fields, maintained by triggers on series and instances
+    num_series: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    num_instances: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
 
-    # Calculated fields
-    num_series: Mapped[int] = mapped_column(Integer, default=0)
-    num_instances: Mapped[int] = mapped_column(Integer, default=0)
+    # BLAKE3 digest over the sorted per-file checksums of the uploaded instances
+    content_digest: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
 
     # Processing status
     status: Mapped[StudyStatus] = mapped_column(
@@ -109,19 +115,8 @@ class Study(Base):
         Index("ix_studies_study_date_desc", study_date.desc()),
         Index("ix_studies_patient_id_fk", "patient_id_fk"),
         Index("ix_studies_status", "status"),
+        Index("ix_studies_modalities_gin", "modalities_in_study", postgresql_using="gin"),
     )
 
-    @property
-    def modalities_list(self) -> list[str]:
-        """Get modalities as a list."""
-        if self.modalities_in_study:
-            return [m.strip() for m in self.modalities_in_study.split(",")]
-        return []
-
-    @modalities_list.setter
-    def modalities_list(self, value: list[str]) -> None:
-        """Set modalities from a list."""
-        self.modalities_in_study = ",".join(value) if value else None
-
     def __repr__(self) -> str:
         return f"<Study(id={self.id}, uid='{self.study_instance_uid}', description='{self.study_description}')>"
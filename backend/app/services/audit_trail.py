@@ -0,0 +1,489 @@
+"""Persistent audit trail for Horalix View.
+
+Stores audit entries in the ``audit_logs`` table. Once ``start()`` has been
+awaited, entries are queued and inserted in batches by a background task, so
+recording an event costs a queue put rather than a database round trip. On
+asyncpg each batch is written with ``COPY`` instead of a multi-row INSERT.
+The application's ``audit_logger`` feeds the writer through ``record()``.
+
+Rows are tamper-evident: all rows form one chain, ordered by id, with
+``row_hash = SHA-256(prev_hash || canonical JSON of the row)``, which
+``verify_audit_chain()`` rechecks offline. On PostgreSQL writers in every
+process extend the chain under a transaction-level advisory lock.
+"""
+
+import asyncio
+import hashlib
+from collections.abc import Iterable
+from datetime import date, datetime, timezone
+from typing import Any
+
+import orjson
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+)
+
+from app.core.logging import get_logger
+from app.core.security import AuditEntry, SecurityManager
+from app.models.audit import AuditAction, AuditLog
+from app.models.base import async_session_maker, uuid7
+
+logger = get_logger(__name__)
+
+# Queue bound, rows per INSERT, and max wait (s) to fill a batch
+AUDIT_TRAIL_QUEUE_SIZE = 10_000
+AUDIT_TRAIL_BATCH_SIZE = 500
+AUDIT_TRAIL_FLUSH_INTERVAL = 0.1
+
+# Attempts per batch before retrying its rows one by one, and the first retry
+# delay (s), doubled after each failure
+AUDIT_TRAIL_RETRIES = 3
+AUDIT_TRAIL_RETRY_DELAY = 0.5
+
+# pg_advisory_xact_lock() key serializing hash chain writers across processes
+AUDIT_CHAIN_LOCK_ID = 0x6175_6469_7463_6831
+
+# Monthly audit_logs partitions created ahead of time, and how often (s) to
+# check for them (PostgreSQL only)
+AUDIT_PARTITION_MONTHS_AHEAD = 3
+AUDIT_PARTITION_CHECK_INTERVAL = 6 * 3600
+
+
+def _to_row(entry: AuditEntry) -> dict[str, Any]:
+    """Convert an audit entry into an ``audit_logs`` row.
+
+    Raises:
+        ValueError: If the entry's action is not an AuditAction value
+
+    """
+    return {
+        "id": uuid7(),
+        "action": AuditAction(entry.action),
+        "user_id": entry.user_id,
+        "resource_type": entry.resource_type,
+        "resource_id": entry.resource_id,
+        "details": entry.details or None,
+        "ip_address": entry.ip_address,
+        "user_agent": entry.user_agent,
+        "success": entry.success,
+        "error_message": entry.error_message,
+        "timestamp": entry.timestamp,
+    }
+
+
+# Columns covered by the hash chain
+_CHAINED_COLUMNS = (
+    "action",
+    "user_id",
+    "resource_type",
+    "resource_id",
+    "details",
+    "ip_address",
+    "user_agent",
+    "success",
+    "error_message",
+    "timestamp",
+)
+
+# Columns written by COPY, in record order (created_at uses its default)
+_COPY_COLUMNS = ("id", *_CHAINED_COLUMNS, "prev_hash", "row_hash")
+
+
+def chain_hash(prev_hash: bytes | None, row: dict[str, Any]) -> bytes:
+    """Compute an audit row's hash from the previous row's hash.
+
+    Args:
+        prev_hash: Hash of the previous row in the chain (None to start one)
+        row: Row values for at least the chained columns
+
+    Returns:
+        32-byte SHA-256 digest
+
+    """
+    timestamp = row["timestamp"]
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    canonical = {column: row[column] for column in _CHAINED_COLUMNS}
+    canonical["action"] = AuditAction(row["action"]).value
+    canonical["timestamp"] = timestamp.astimezone(timezone.utc)
+    payload = orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256((prev_hash or b"") + payload).digest()
+
+
+def verify_audit_chain(logs: Iterable[AuditLog]) -> bool:
+    """Check the hash chain of audit log rows, given oldest first.
+
+    Every chained row's hash must match its contents and its ``prev_hash``
+    must be the hash of the chained row right before it, so edited, inserted,
+    removed or reordered rows are detected. The first chained row may point
+    at a row outside ``logs``, so a chain can be checked piecewise. Rows
+    written before chaining (no ``row_hash``) are skipped.
+    """
+    first = True
+    prev_hash: bytes | None = None
+    for log in logs:
+        if log.row_hash is None:
+            continue
+        if not first and log.prev_hash != prev_hash:
+            return False
+        row = {column: getattr(log, column) for column in _CHAINED_COLUMNS}
+        if chain_hash(log.prev_hash, row) != log.row_hash:
+            return False
+        first, prev_hash = False, log.row_hash
+    return True
+
+
+def _to_copy_record(row: dict[str, Any]) -> tuple[Any, ...]:
+    """Convert an ``audit_logs`` row into a COPY record.
+
+    COPY bypasses SQLAlchemy's type processing: the action enum is stored by
+    name and JSON columns take their text form.
+    """
+    record = dict(row)
+    record["action"] = row["action"].name
+    if row["details"] is not None:
+        record["details"] = orjson.dumps(row["details"]).decode()
+    return tuple(record[column] for column in _COPY_COLUMNS)
+
+
+def _add_months(month: date, months: int) -> date:
+    """Return the first day of the month ``months`` after ``month``."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def audit_partition_ddl(month: date) -> str:
+    """Build the statement creating the ``audit_logs`` partition for a month."""
+    start = month.replace(day=1)
+    end = _add_months(start, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS audit_logs_{start:%Y_%m} PARTITION OF audit_logs "
+        f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+    )
+
+
+async def ensure_audit_partitions(
+    conn: AsyncConnection, months_ahead: int = AUDIT_PARTITION_MONTHS_AHEAD
+) -> int:
+    """Create the current and upcoming monthly ``audit_logs`` partitions.
+
+    Does nothing unless ``audit_logs`` is range-partitioned (migration 014).
+    Rows outside every monthly partition land in ``audit_logs_default``; a
+    partition is also created for each month found there, and its rows are
+    moved out of the default partition (a month's partition cannot be created
+    while the default one holds rows of that month). Each month is handled in
+    its own savepoint, so one failure does not undo the others.
+
+    Args:
+        conn: PostgreSQL connection (inside a transaction)
+        months_ahead: Number of months after the current one to prepare
+
+    Returns:
+        Number of monthly partitions that exist afterwards among those checked
+
+    """
+    partitioned = await conn.scalar(
+        text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('audit_logs')")
+    )
+    if not partitioned:
+        return 0
+
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    months = {_add_months(this_month, offset) for offset in range(months_ahead + 1)}
+    stray = await conn.scalars(
+        text(
+            "SELECT DISTINCT date_trunc('month', timestamp AT TIME ZONE 'UTC')::date "
+            "FROM audit_logs_default"
+        )
+    )
+    months.update(stray)
+
+    ensured = 0
+    for month in sorted(months):
+        try:
+            async with conn.begin_nested():
+                await _create_audit_partition(conn, month)
+            ensured += 1
+        except Exception as e:
+            logger.warning(
+                "Could not create audit log partition", month=month.isoformat(), error=str(e)
+            )
+    return ensured
+
+
+async def _create_audit_partition(conn: AsyncConnection, month: date) -> None:
+    """Create one month's partition, moving its rows out of the default partition."""
+    exists = await conn.scalar(
+        text("SELECT to_regclass(:name) IS NOT NULL"), {"name": f"audit_logs_{month:%Y_%m}"}
+    )
+    if exists:
+        return
+
+    bounds = {
+        "start": datetime(month.year, month.month, 1, tzinfo=timezone.utc),
+        "end": datetime.combine(_add_months(month, 1), datetime.min.time(), timezone.utc),
+    }
+    in_range = "WHERE timestamp >= :start AND timestamp < :end"
+    stray = await conn.scalar(
+        text(f"SELECT EXISTS (SELECT 1 FROM audit_logs_default {in_range})"),  # noqa: S608
+        bounds,
+    )
+    if not stray:
+        await conn.execute(text(audit_partition_ddl(month)))
+        return
+
+    # The new bounds would overlap rows already in the default partition:
+    # take it out, create the month, move its rows over and put it back
+    await conn.execute(text("ALTER TABLE audit_logs DETACH PARTITION audit_logs_default"))
+    await conn.execute(text(audit_partition_ddl(month)))
+    await conn.execute(
+        text(
+            f"WITH moved AS (DELETE FROM audit_logs_default {in_range} RETURNING *) "  # noqa: S608
+            f"INSERT INTO audit_logs_{month:%Y_%m} SELECT * FROM moved"
+        ),
+        bounds,
+    )
+    await conn.execute(text("ALTER TABLE audit_logs ATTACH PARTITION audit_logs_default DEFAULT"))
+
+
+async def maintain_audit_partitions(
+    engine: AsyncEngine, interval: float = AUDIT_PARTITION_CHECK_INTERVAL
+) -> None:
+    """Keep ``audit_logs`` partitions ahead of the clock until cancelled.
+
+    Runs ``ensure_audit_partitions()`` now and then every ``interval``
+    seconds, so long-running processes keep creating new months.
+    """
+    while True:
+        try:
+            async with engine.begin() as conn:
+                months = await ensure_audit_partitions(conn)
+            logger.info("Audit log partitions ensured", months=months)
+        except Exception as e:
+            logger.warning(f"Could not create audit log partitions: {e}")
+        await asyncio.sleep(interval)
+
+
+class AuditTrailWriter:
+    """Batched writer for the persistent audit trail.
+
+    Entries are inserted directly when the writer is not running or its queue
+    is full. A failed insert is retried with backoff, then row by row, so one
+    bad entry or a database blip never costs the rest of a batch. Each batch
+    extends the hash chain from the newest chained row stored, read in the
+    insert transaction after taking ``AUDIT_CHAIN_LOCK_ID`` on PostgreSQL, so
+    writers in other processes cannot fork it.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession] | None = None):
+        """Initialize the writer.
+
+        Args:
+            session_maker: Session factory (defaults to the application's)
+
+        """
+        self._session_maker = session_maker or async_session_maker
+        self._queue: asyncio.Queue[dict[str, Any] | None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._consumer: asyncio.Task | None = None
+        # In-line writes started by record(), awaited by flush() and stop()
+        self._pending: set[asyncio.Future[None]] = set()
+        self._chain_lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Start batched delivery on the running event loop."""
+        if self._consumer is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=AUDIT_TRAIL_QUEUE_SIZE)
+        self._consumer = asyncio.create_task(self._consume(self._queue))
+
+    async def stop(self) -> None:
+        """Stop batched delivery once every queued entry has been inserted."""
+        if self._consumer is None or self._queue is None:
+            return
+        queue, consumer = self._queue, self._consumer
+        self._queue = self._consumer = self._loop = None
+
+        await queue.put(None)
+        await consumer
+        await self._wait_pending()
+
+    async def flush(self) -> None:
+        """Wait until every entry queued so far has been inserted."""
+        if self._queue is not None:
+            await self._queue.join()
+        await self._wait_pending()
+
+    async def _wait_pending(self) -> None:
+        """Wait for in-line writes started by ``record()``."""
+        while self._pending:
+            await asyncio.gather(*self._pending)
+
+    async def emit(self, entry: AuditEntry) -> None:
+        """Record an audit entry.
+
+        Args:
+            entry: Entry built with ``SecurityManager.create_audit_entry()``
+
+        Raises:
+            ValueError: If the entry's action is not an AuditAction value
+
+        """
+        row = _to_row(entry)
+        if self._queue is not None:
+            try:
+                self._queue.put_nowait(row)
+                return
+            except asyncio.QueueFull:
+                pass  # Backpressure: insert in-line rather than drop the entry
+        await self._write([row])
+
+    def record(self, **fields: Any) -> None:
+        """Record an audit entry without waiting for it to be written.
+
+        For synchronous callers such as ``AuditLogger``. The entry is queued,
+        or written by a task on the writer's loop when the queue is full; it
+        may be called from other threads.
+
+        Args:
+            **fields: Arguments for ``SecurityManager.create_audit_entry()``
+
+        Raises:
+            ValueError: If the action is not an AuditAction value
+            RuntimeError: If the writer has not been started
+
+        """
+        loop = self._loop
+        if loop is None:
+            raise RuntimeError("Audit trail writer is not running")
+        row = _to_row(SecurityManager.create_audit_entry(**fields))
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._enqueue(row)
+        else:
+            loop.call_soon_threadsafe(self._enqueue, row)
+
+    def _enqueue(self, row: dict[str, Any]) -> None:
+        """Queue a row, or start writing it in-line when the queue is full."""
+        if self._queue is not None:
+            try:
+                self._queue.put_nowait(row)
+                return
+            except asyncio.QueueFull:
+                pass
+        task = asyncio.ensure_future(self._write([row]))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _consume(self, queue: asyncio.Queue[dict[str, Any] | None]) -> None:
+        """Collect queued rows into batches and insert each batch at once."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            row = await queue.get()
+            if row is None:
+                queue.task_done()
+                return
+            batch = [row]
+            deadline = loop.time() + AUDIT_TRAIL_FLUSH_INTERVAL
+            while len(batch) < AUDIT_TRAIL_BATCH_SIZE:
+                try:
+                    row = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        row = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if row is None:
+                    queue.task_done()
+                    stopping = True
+                    break
+                batch.append(row)
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write(self, rows: list[dict[str, Any]]) -> None:
+        """Insert rows, retrying with backoff and then one row at a time.
+
+        Only rows that still fail on their own are given up on, and each of
+        those is logged in full so the entry survives in the log stream.
+        """
+        delay = AUDIT_TRAIL_RETRY_DELAY
+        for attempt in range(1, AUDIT_TRAIL_RETRIES + 1):
+            try:
+                await self._insert(rows)
+                return
+            except Exception as e:
+                logger.warning(
+                    "Audit trail write failed", error=str(e), entries=len(rows), attempt=attempt
+                )
+            if attempt < AUDIT_TRAIL_RETRIES:
+                await asyncio.sleep(delay)
+                delay *= 2
+
+        for row in rows:
+            try:
+                await self._insert([row])
+            except Exception as e:
+                logger.error(
+                    "Failed to write audit trail entry",
+                    error=str(e),
+                    **{column: row[column] for column in ("id", *_CHAINED_COLUMNS)},
+                )
+
+    async def _insert(self, rows: list[dict[str, Any]]) -> None:
+        """Chain and insert rows into ``audit_logs`` with a single statement."""
+        async with self._chain_lock, self._session_maker() as session:
+            conn = await session.connection()
+            if conn.dialect.name == "postgresql":
+                # Held until commit: one writer at a time extends the chain
+                await conn.execute(
+                    text("SELECT pg_advisory_xact_lock(:key)"), {"key": AUDIT_CHAIN_LOCK_ID}
+                )
+            head = (
+                await session.execute(
+                    select(AuditLog.id, AuditLog.row_hash)
+                    .where(AuditLog.row_hash.is_not(None))
+                    .order_by(AuditLog.id.desc())
+                    .limit(1)
+                )
+            ).first()
+            prev_id, prev_hash = head if head is not None else (None, None)
+
+            # Ids are issued now, after the head, so id order is chain order
+            for row in rows:
+                row["id"] = prev_id = uuid7(after=prev_id)
+                row["prev_hash"] = prev_hash
+                row["row_hash"] = prev_hash = chain_hash(prev_hash, row)
+
+            if conn.dialect.driver == "asyncpg":
+                raw = await conn.get_raw_connection()
+                driver_conn = raw.driver_connection
+                if driver_conn is None:
+                    raise RuntimeError("asyncpg connection is closed")
+                await driver_conn.copy_records_to_table(
+                    AuditLog.__tablename__,
+                    records=[_to_copy_record(row) for row in rows],
+                    columns=_COPY_COLUMNS,
+                )
+            else:
+                await session.execute(insert(AuditLog), rows)
+            await session.commit()
+
+
+# Global audit trail writer instance
+audit_trail = AuditTrailWriter()
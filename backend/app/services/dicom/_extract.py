@@ -0,0 +1,161 @@
+"""Per-file DICOM field extraction for upload indexing.
+
+Kept free of imports from the rest of the application and fully annotated
+so it can be compiled with mypyc (``mypyc app/services/dicom/_extract.py``).
+The compiled extension, when present, is picked up in place of this module;
+otherwise the pure-Python version runs unchanged.
+"""
+
+from datetime import date
+from datetime import time as dt_time
+from functools import lru_cache
+from typing import Any
+
+
+def extract_series_fields(ds: Any, series_uid: str) -> dict[str, Any]:
+    """Extract the series-level fields indexed on upload from a dataset."""
+    pixel_spacing_value: tuple[float, float] | None = None
+    if hasattr(ds, "PixelSpacing") and ds.PixelSpacing:
+        pixel_spacing_value = (
+            float(ds.PixelSpacing[0]),
+            float(ds.PixelSpacing[1]),
+        )
+    elif hasattr(ds, "ImagerPixelSpacing") and ds.ImagerPixelSpacing:
+        pixel_spacing_value = (
+            float(ds.ImagerPixelSpacing[0]),
+            float(ds.ImagerPixelSpacing[1]),
+        )
+
+    return {
+        "series_instance_uid": series_uid,
+        "series_number": ds.get("SeriesNumber"),
+        "series_description": str(ds.get("SeriesDescription", "")),
+        "modality": str(ds.get("Modality", "OT")),
+        "series_date": parse_dicom_date(ds.get("SeriesDate")),
+        "series_time": parse_dicom_time(ds.get("SeriesTime")),
+        "body_part_examined": str(ds.get("BodyPartExamined", "")),
+        "patient_position": str(ds.get("PatientPosition", "")),
+        "protocol_name": str(ds.get("ProtocolName", "")),
+        "slice_thickness": (float(ds.SliceThickness) if hasattr(ds, "SliceThickness") else None),
+        "spacing_between_slices": (
+            float(ds.SpacingBetweenSlices) if hasattr(ds, "SpacingBetweenSlices") else None
+        ),
+        "rows": ds.Rows if hasattr(ds, "Rows") else None,
+        "columns": ds.Columns if hasattr(ds, "Columns") else None,
+        "pixel_spacing": (
+            f"{pixel_spacing_value[0]}\\{pixel_spacing_value[1]}" if pixel_spacing_value else None
+        ),
+        "window_center": (
+            float(ds.WindowCenter[0]) if hasattr(ds, "WindowCenter") and ds.WindowCenter else None
+        ),
+        "window_width": (
+            float(ds.WindowWidth[0]) if hasattr(ds, "WindowWidth") and ds.WindowWidth else None
+        ),
+    }
+
+
+def extract_instance_fields(ds: Any, instance_uid: str, sop_class_uid: str) -> dict[str, Any]:
+    """Extract the instance-level fields indexed on upload from a dataset."""
+    return {
+        "sop_instance_uid": instance_uid,
+        "sop_class_uid": sop_class_uid,
+        "instance_number": ds.get("InstanceNumber"),
+        "rows": ds.Rows if hasattr(ds, "Rows") else None,
+        "columns": ds.Columns if hasattr(ds, "Columns") else None,
+        "bits_allocated": ds.BitsAllocated if hasattr(ds, "BitsAllocated") else None,
+        "bits_stored": ds.BitsStored if hasattr(ds, "BitsStored") else None,
+        "high_bit": ds.HighBit if hasattr(ds, "HighBit") else None,
+        "pixel_representation": (
+            ds.PixelRepresentation if hasattr(ds, "PixelRepresentation") else None
+        ),
+        "samples_per_pixel": (ds.SamplesPerPixel if hasattr(ds, "SamplesPerPixel") else None),
+        "photometric_interpretation": str(ds.get("PhotometricInterpretation", "")),
+        "transfer_syntax_uid": (
+            str(ds.file_meta.TransferSyntaxUID)
+            if getattr(ds, "file_meta", None) and getattr(ds.file_meta, "TransferSyntaxUID", None)
+            else None
+        ),
+        "pixel_spacing": (
+            [float(ds.PixelSpacing[0]), float(ds.PixelSpacing[1])]
+            if hasattr(ds, "PixelSpacing") and ds.PixelSpacing
+            else None
+        ),
+        "image_position_patient": (
+            [float(v) for v in ds.ImagePositionPatient]
+            if hasattr(ds, "ImagePositionPatient") and ds.ImagePositionPatient
+            else None
+        ),
+        "image_orientation_patient": (
+            [float(v) for v in ds.ImageOrientationPatient]
+            if hasattr(ds, "ImageOrientationPatient") and ds.ImageOrientationPatient
+            else None
+        ),
+        "window_center": (
+            float(ds.WindowCenter[0]) if hasattr(ds, "WindowCenter") and ds.WindowCenter else None
+        ),
+        "window_width": (
+            float(ds.WindowWidth[0]) if hasattr(ds, "WindowWidth") and ds.WindowWidth else None
+        ),
+        "rescale_intercept": (
+            float(ds.RescaleIntercept) if hasattr(ds, "RescaleIntercept") else 0.0
+        ),
+        "rescale_slope": float(ds.RescaleSlope) if hasattr(ds, "RescaleSlope") else 1.0,
+        "slice_location": float(ds.SliceLocation) if hasattr(ds, "SliceLocation") else None,
+        "slice_thickness": (float(ds.SliceThickness) if hasattr(ds, "SliceThickness") else None),
+        "number_of_frames": (
+            int(ds.NumberOfFrames) if hasattr(ds, "NumberOfFrames") and ds.NumberOfFrames else 1
+        ),
+    }
+
+
+def parse_dicom_date(value: Any) -> date | None:
+    """Parse DICOM date format (YYYYMMDD)."""
+    if not value:
+        return None
+    return _parse_date_str(str(value))
+
+
+def parse_dicom_time(value: Any) -> dt_time | None:
+    """Parse DICOM time format (HHMMSS.FFFFFF)."""
+    if not value:
+        return None
+    return _parse_time_str(str(value))
+
+
+# Files of one study repeat the same few date/time strings; results are immutable
+@lru_cache(maxsize=4096)
+def _parse_date_str(date_str: str) -> date | None:
+    """Parse a YYYYMMDD string."""
+    if len(date_str) != 8 or not (date_str.isascii() and date_str.isdigit()):
+        return None
+    # One integer conversion, then split the fields arithmetically
+    year, month_day = divmod(int(date_str), 10000)
+    month, day = divmod(month_day, 100)
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_time_str(value: str) -> dt_time | None:
+    """Parse an HHMMSS.FFFFFF (or HHMM) string."""
+    time_str = value.partition(".")[0]  # Remove fractional seconds
+    if len(time_str) >= 6:
+        digits = time_str[:6]
+    elif len(time_str) >= 4:
+        digits = time_str[:4]
+    else:
+        return None
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    packed = int(digits)
+    try:
+        if len(digits) == 6:
+            hours, minutes_seconds = divmod(packed, 10000)
+            minutes, seconds = divmod(minutes_seconds, 100)
+            return dt_time(hours, minutes, seconds)
+        hours, minutes = divmod(packed, 100)
+        return dt_time(hours, minutes)
+    except ValueError:
+        return None
@@ -0,0 +1,156 @@
+"""DICOM upload metadata extraction for Horalix View.
+
+Parses uploaded DICOM headers into plain dictionaries of patient, study,
+series, and instance fields. Extraction runs in a process pool so that
+CPU-bound header parsing does not block the event loop and scales with
+the number of cores.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from app.services.dicom._extract import (
+    extract_instance_fields,
+    extract_series_fields,
+    parse_dicom_date,
+    parse_dicom_time,
+)
+
+_parse_executor: ProcessPoolExecutor | None = None
+
+# Series fields already extracted in this worker, keyed by (upload ID, series UID).
+# Every file of a series carries the same series-level attributes, so they are
+# probed once per series per upload rather than once per file.
+_SERIES_CACHE_SIZE = 256
+_series_fields_cache: dict[tuple[str, str], dict[str, Any]] = {}
+
+
+class DicomExtractionError(ValueError):
+    """Raised when an uploaded file is not valid DICOM or lacks required UIDs."""
+
+
+def get_parse_executor() -> ProcessPoolExecutor:
+    """Get the shared process pool used for DICOM header parsing.
+
+    Workers are started from a fork server (spawned where that is missing)
+    rather than forked from the application, which holds event loop, thread
+    pool and database connection state that must not be copied. The
+    application creates the pool at startup.
+    """
+    global _parse_executor
+    if _parse_executor is None:
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload([__name__])
+        else:
+            context = multiprocessing.get_context("spawn")
+        _parse_executor = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context)
+    return _parse_executor
+
+
+def shutdown_parse_executor() -> None:
+    """Shut down the shared parse pool, if it was started."""
+    global _parse_executor
+    if _parse_executor is not None:
+        _parse_executor.shutdown(wait=True, cancel_futures=True)
+        _parse_executor = None
+
+
+def extract_upload_metadata(file_path: str, upload_id: str | None = None) -> dict[str, Any]:
+    """Parse a DICOM file header and extract the fields indexed on upload.
+
+    Runs in a worker process, so only a picklable dict is returned.
+
+    Args:
+        file_path: Path to the DICOM file on disk
+        upload_id: Identifier of the upload the file belongs to; when given,
+            series fields are reused for later files of the same series
+
+    Returns:
+        Dictionary with the study/series/instance UIDs and the ``patient``,
+        ``study``, ``series``, and ``instance`` field dictionaries
+
+    Raises:
+        DicomExtractionError: If the file cannot be parsed or lacks required UIDs
+
+    """
+    import pydicom
+
+    try:
+        ds = pydicom.dcmread(file_path, stop_before_pixels=True)
+    except Exception as e:
+        raise DicomExtractionError(f"Invalid DICOM file: {str(e)}")
+
+    # Extract required UIDs
+    study_uid_value = getattr(ds, "StudyInstanceUID", None)
+    series_uid_value = getattr(ds, "SeriesInstanceUID", None)
+    instance_uid_value = getattr(ds, "SOPInstanceUID", None)
+    sop_class_uid_value = getattr(ds, "SOPClassUID", None) or getattr(
+        getattr(ds, "file_meta", None), "MediaStorageSOPClassUID", None
+    )
+
+    missing_fields = []
+    if not study_uid_value:
+        missing_fields.append("StudyInstanceUID")
+    if not series_uid_value:
+        missing_fields.append("SeriesInstanceUID")
+    if not instance_uid_value:
+        missing_fields.append("SOPInstanceUID")
+    if not sop_class_uid_value:
+        missing_fields.append("SOPClassUID")
+
+    if missing_fields:
+        raise DicomExtractionError(f"Missing required DICOM fields: {', '.join(missing_fields)}")
+
+    study_uid = str(study_uid_value)
+    series_uid = str(series_uid_value)
+    instance_uid = str(instance_uid_value)
+    sop_class_uid = str(sop_class_uid_value)
+
+    patient_data = {
+        "patient_id": str(ds.get("PatientID", "UNKNOWN")),
+        "patient_name": str(ds.get("PatientName", "")),
+        "birth_date": parse_dicom_date(ds.get("PatientBirthDate")),
+        "sex": str(ds.get("PatientSex", "")),
+    }
+
+    study_data = {
+        "study_instance_uid": study_uid,
+        "study_id": str(ds.get("StudyID", "")),
+        "study_date": parse_dicom_date(ds.get("StudyDate")),
+        "study_time": parse_dicom_time(ds.get("StudyTime")),
+        "study_description": str(ds.get("StudyDescription", "")),
+        "accession_number": str(ds.get("AccessionNumber", "")),
+        "referring_physician_name": str(ds.get("ReferringPhysicianName", "")),
+        "institution_name": str(ds.get("InstitutionName", "")),
+    }
+
+    series_data = _get_series_fields(ds, series_uid, upload_id)
+    instance_data = extract_instance_fields(ds, instance_uid, sop_class_uid)
+
+    return {
+        "study_instance_uid": study_uid,
+        "series_instance_uid": series_uid,
+        "sop_instance_uid": instance_uid,
+        "patient": patient_data,
+        "study": study_data,
+        "series": series_data,
+        "instance": instance_data,
+    }
+
+
+def _get_series_fields(ds: Any, series_uid: str, upload_id: str | None) -> dict[str, Any]:
+    """Extract series fields, reusing this worker's copy for a series seen earlier in the upload."""
+    if upload_id is None:
+        return extract_series_fields(ds, series_uid)
+
+    key = (upload_id, series_uid)
+    series_data = _series_fields_cache.get(key)
+    if series_data is None:
+        series_data = extract_series_fields(ds, series_uid)
+        if len(_series_fields_cache) >= _SERIES_CACHE_SIZE:
+            del _series_fields_cache[next(iter(_series_fields_cache))]
+        _series_fields_cache[key] = series_data
+    return dict(series_data)
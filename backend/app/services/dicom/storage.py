@@ -4,19 +4,44 @@
 for hierarchical organization and caching.
 """
 
-import hashlib
 import shutil
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import aiofiles
 import aiofiles.os
+import blake3
 
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Algorithm recorded alongside each stored file checksum
+CHECKSUM_ALGORITHM = "blake3"
+
+
+def new_checksum() -> blake3.blake3:
+    """Create a streaming hasher for stored file checksums.
+
+    BLAKE3 dispatches to SSE4.1/AVX2/AVX-512/NEON at runtime and hashes large
+    chunks on multiple threads, keeping checksumming off the upload critical path.
+    """
+    return blake3.blake3(max_threads=blake3.blake3.AUTO)
+
+
+def content_digest(checksums: Iterable[str]) -> str:
+    """Combine per-file checksums into a single order-independent digest.
+
+    Hashes the sorted raw digests, so a set of stored files can be verified
+    from their recorded checksums without re-reading file contents.
+    """
+    hasher = blake3.blake3()
+    for checksum in sorted(checksums):
+        hasher.update(bytes.fromhex(checksum))
+    return hasher.hexdigest()
+
 
 class DicomStorageService:
     """Service for managing DICOM file storage.
@@ -31,6 +56,10 @@ class DicomStorageService:
         │   │   └── ...
         │   └── ...
         └── ...
+
+    Uploaded files are stored once under ``.blobs/`` keyed by checksum, and
+    the hierarchical paths are hard links to those blobs, so re-uploaded
+    content does not consume additional disk space.
     """
 
     def __init__(self, storage_dir: Path):
@@ -43,6 +72,7 @@ def __init__(self, storage_dir: Path):
         self.storage_dir = Path(storage_dir)
         self.cache_dir = self.storage_dir / ".cache"
         self.temp_dir = self.storage_dir / ".temp"
+        self.blob_dir = self.storage_dir / ".blobs"
         self._ready = False
 
     async def initialize(self) -> None:
@@ -51,6 +81,7 @@ async def initialize(self) -> None:
             await aiofiles.os.makedirs(self.storage_dir, exist_ok=True)
             await aiofiles.os.makedirs(self.cache_dir, exist_ok=True)
             await aiofiles.os.makedirs(self.temp_dir, exist_ok=True)
+            await aiofiles.os.makedirs(self.blob_dir, exist_ok=True)
             self._ready = True
             logger.info("DICOM storage initialized", path=str(self.storage_dir))
         except Exception as e:
@@ -61,6 +92,14 @@ def is_ready(self) -> bool:
         """Check if storage service is ready."""
         return self._ready
 
+    def _blob_path(self, checksum: str) -> Path:
+        """Get the content-addressed path for a file checksum."""
+        return self.blob_dir / checksum[:2] / checksum[2:4] / checksum
+
+    async def has_blob(self, checksum: str) -> bool:
+        """Check whether content with the given checksum is already stored."""
+        return await aiofiles.os.path.exists(self._blob_path(checksum))
+
     async def store_instance(self, data: bytes) -> dict[str, Any]:
         """Store a DICOM instance.
 
@@ -94,7 +133,9 @@ async def store_instance(self, data: bytes) -> dict[str, Any]:
                 await f.write(data)
 
             # Calculate checksum
-            checksum = hashlib.sha256(data).hexdigest()
+            hasher = new_checksum()
+            hasher.update(data)
+            checksum = hasher.hexdigest()
 
             logger.info(
                 "Stored DICOM instance",
@@ -112,6 +153,7 @@ async def store_instance(self, data: bytes) -> dict[str, Any]:
                 "file_path": str(file_path),
                 "file_size": len(data),
                 "checksum": checksum,
+                "checksum_algorithm": CHECKSUM_ALGORITHM,
                 "stored_at": datetime.now().isoformat(),
             }
 
@@ -122,22 +164,60 @@ async def store_instance(self, data: bytes) -> dict[str, Any]:
     async def store_instance_file(
         self,
         file_path: Path,
-        dicom_dataset: Any,
+        patient_id: str,
+        study_uid: str,
+        series_uid: str,
+        instance_uid: str,
         checksum: str,
         file_size: int,
     ) -> dict[str, Any]:
-        """Store a DICOM instance from an existing file path."""
-        try:
-            patient_id = str(dicom_dataset.get("PatientID", "UNKNOWN"))
-            study_uid = str(dicom_dataset.StudyInstanceUID)
-            series_uid = str(dicom_dataset.SeriesInstanceUID)
-            instance_uid = str(dicom_dataset.SOPInstanceUID)
+        """Store a DICOM instance from an existing file path.
+
+        If content with the same checksum is already stored, the instance path
+        is hard-linked to that blob and the file is discarded; otherwise the
+        file is moved into place and recorded as the blob for its checksum.
+
+        Args:
+            file_path: Path of the already-written DICOM file (moved into storage)
+            patient_id: Patient ID used for the storage hierarchy
+            study_uid: Study Instance UID
+            series_uid: Series Instance UID
+            instance_uid: SOP Instance UID
+            checksum: Checksum computed while the file was written
+            file_size: File size in bytes
+
+        Returns:
+            Dictionary with storage information
 
+        """
+        try:
             instance_dir = self.storage_dir / patient_id / study_uid / series_uid
             await aiofiles.os.makedirs(instance_dir, exist_ok=True)
 
             destination = instance_dir / f"{instance_uid}.dcm"
-            await aiofiles.os.replace(file_path, destination)
+            if await aiofiles.os.path.exists(destination):
+                await aiofiles.os.remove(destination)
+
+            blob_path = self._blob_path(checksum)
+            deduplicated = False
+            if await self.has_blob(checksum):
+                try:
+                    await aiofiles.os.link(blob_path, destination)
+                    deduplicated = True
+                except OSError:
+                    # Blob pruned since the check, or no hard-link support
+                    pass
+
+            if deduplicated:
+                await aiofiles.os.remove(file_path)
+            else:
+                await aiofiles.os.replace(file_path, destination)
+                try:
+                    await aiofiles.os.makedirs(blob_path.parent, exist_ok=True)
+                    await aiofiles.os.link(destination, blob_path)
+                except OSError:
+                    # Already recorded by a concurrent upload, or no hard-link support
+                    pass
 
             logger.info(
                 "Stored DICOM instance",
@@ -145,6 +225,7 @@ async def store_instance_file(
                 study_uid=study_uid,
                 series_uid=series_uid,
                 file_size=file_size,
+                deduplicated=deduplicated,
             )
 
             return {
@@ -155,6 +236,8 @@ async def store_instance_file(
                 "file_path": str(destination),
                 "file_size": file_size,
                 "checksum": checksum,
+                "checksum_algorithm": CHECKSUM_ALGORITHM,
+                "deduplicated": deduplicated,
                 "stored_at": datetime.now().isoformat(),
             }
 
@@ -257,6 +340,33 @@ async def delete_study(self, study_uid: str) -> int:
                 )
         return deleted_count
 
+    async def prune_blobs(self, checksums: Iterable[str] | None = None) -> int:
+        """Remove content blobs no longer linked from any instance path.
+
+        Args:
+            checksums: Checksums of the blobs to check; all blobs when omitted
+
+        Returns:
+            Number of blobs removed
+
+        """
+        if checksums is None:
+            blobs: Iterable[Path] = self.blob_dir.glob("*/*/*")
+        else:
+            blobs = [self._blob_path(checksum) for checksum in set(checksums)]
+
+        pruned = 0
+        for blob in blobs:
+            try:
+                if blob.stat().st_nlink <= 1:
+                    await aiofiles.os.remove(blob)
+                    pruned += 1
+            except FileNotFoundError:
+                continue
+        if pruned:
+            logger.info("Pruned unreferenced DICOM blobs", count=pruned)
+        return pruned
+
     async def get_study_path(self, study_uid: str) -> Path | None:
         """Get the storage path for a study."""
         for patient_dir in self.storage_dir.iterdir():
@@ -0,0 +1,70 @@
+"""API tests for annotation endpoints."""
+
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.v1.endpoints.annotations import router as annotations_router
+from app.api.v1.endpoints.auth import get_current_active_user
+from app.core.security import TokenData
+from app.models.base import Base, get_db
+
+
+@pytest.fixture
+async def client(tmp_path):
+    app = FastAPI()
+    app.include_router(annotations_router, prefix="/api/v1/annotations")
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'annotations.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def override_get_db():
+        async with session_maker() as session:
+            yield session
+
+    async def override_user() -> TokenData:
+        return TokenData(user_id="test-user", username="tester", roles=["admin"], permissions=[])
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_active_user] = override_user
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_annotation_round_trip_by_uuid(client: AsyncClient):
+    """Test a created annotation is returned with a UUID id and found by it."""
+    response = await client.post(
+        "/api/v1/annotations",
+        json={
+            "study_uid": "1.2.3",
+            "series_uid": "1.2.3.4",
+            "instance_uid": "1.2.3.4.5",
+            "annotation_type": "length",
+            "data": {"points": [{"x": 0, "y": 0}, {"x": 3, "y": 4}]},
+            "measurements": [{"value": 5.0, "unit": "mm", "label": "Length"}],
+        },
+    )
+    assert response.status_code == 201
+    annotation_id = response.json()["id"]
+    UUID(annotation_id)
+
+    response = await client.get(f"/api/v1/annotations/{annotation_id}")
+    assert response.status_code == 200
+    assert response.json()["measurements"][0]["value"] == 5.0
+
+
+@pytest.mark.asyncio
+async def test_non_uuid_annotation_id_not_found(client: AsyncClient):
+    """Test IDs that are not UUIDs are reported as not found."""
+    response = await client.get("/api/v1/annotations/not-a-uuid")
+
+    assert response.status_code == 404
@@ -0,0 +1,34 @@
+"""Tests for response compression."""
+
+import pytest
+from fastapi import Response
+from httpx import ASGITransport, AsyncClient
+
+from app import main
+
+
+@pytest.fixture
+def app():
+    """Create the application with a JSON and a DICOM route of compressible size."""
+    application = main.create_application()
+
+    @application.get("/test/json")
+    async def json_payload() -> dict[str, str]:
+        return {"value": "0" * 5000}
+
+    @application.get("/test/dicom")
+    async def dicom_payload() -> Response:
+        return Response(b"\0" * 5000, media_type="application/dicom")
+
+    return application
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("path", "encoding"), [("/test/json", "gzip"), ("/test/dicom", None)])
+async def test_gzip_skips_binary_dicom(app, path: str, encoding: str | None):
+    """Test JSON is gzipped while DICOM payloads are sent as-is."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(path, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == encoding
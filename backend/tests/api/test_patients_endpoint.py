@@ -1,5 +1,7 @@
 """API tests for patients endpoints (no demo data)."""
 
+from datetime import date
+
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
@@ -9,6 +11,8 @@
 from app.api.v1.endpoints.patients import router as patients_router
 from app.core.security import TokenData
 from app.models.base import Base, get_db
+from app.models.patient import Patient
+from app.models.study import Study
 
 
 @pytest.fixture
@@ -47,3 +51,34 @@ async def test_patients_list_is_empty_without_seed(patients_app: FastAPI) -> Non
     payload = response.json()
     assert payload["total"] == 0
     assert payload["patients"] == []
+
+
+@pytest.mark.asyncio
+async def test_patients_list_reports_study_stats(patients_app: FastAPI) -> None:
+    async for session in patients_app.dependency_overrides[get_db]():
+        patient = Patient(patient_id="P1", patient_name="Doe^Jane")
+        session.add(patient)
+        await session.flush()
+        session.add_all(
+            [
+                Study(
+                    study_instance_uid=f"1.2.3.{i}",
+                    patient_id_fk=patient.id,
+                    study_date=date(2024, 1, i),
+                )
+                for i in (1, 2)
+            ]
+        )
+        await session.commit()
+
+    transport = ASGITransport(app=patients_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        listed = await client.get("/api/v1/patients")
+        studies = await client.get("/api/v1/patients/P1/studies")
+
+    assert listed.status_code == 200
+    [entry] = listed.json()["patients"]
+    assert entry["patient_name"] == "Doe^Jane"
+    assert entry["study_count"] == 2
+    assert entry["last_study_date"] == "2024-01-02"
+    assert [s["study_instance_uid"] for s in studies.json()] == ["1.2.3.2", "1.2.3.1"]
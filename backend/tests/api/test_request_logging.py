@@ -0,0 +1,60 @@
+"""Tests for the request logging middleware."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+
+from app import main
+
+
+@pytest.fixture
+def request_logger(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the middleware's logger with a mock."""
+    mock_logger = MagicMock()
+    monkeypatch.setattr(main, "logger", mock_logger)
+    return mock_logger
+
+
+async def _get(app, path: str) -> int:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(path)
+    return response.status_code
+
+
+@pytest.mark.asyncio
+async def test_health_probe_not_logged(request_logger: MagicMock):
+    """Test health probes are timed but not logged."""
+    assert await _get(main.create_application(), "/health") == 200
+
+    request_logger.info.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_requests_sampled(request_logger: MagicMock, monkeypatch: pytest.MonkeyPatch):
+    """Test request completion logs follow the configured sample rate."""
+    monkeypatch.setattr(
+        main,
+        "settings",
+        main.settings.model_copy(update={"debug": False, "request_log_sample_rate": 0.0}),
+    )
+    assert await _get(main.create_application(), "/api/v1/missing") == 404
+    request_logger.info.assert_not_called()
+
+    monkeypatch.setattr(
+        main, "settings", main.settings.model_copy(update={"request_log_sample_rate": 1.0})
+    )
+    assert await _get(main.create_application(), "/api/v1/missing") == 404
+    request_logger.info.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_metrics_labelled_with_full_route_template(request_logger: MagicMock):
+    """Test metrics use the prefixed route template, not the concrete URL."""
+    labels = {"method": "GET", "endpoint": "/api/v1/studies/{study_uid}", "status": "401"}
+    before = REGISTRY.get_sample_value("horalix_requests_total", labels) or 0.0
+
+    assert await _get(main.create_application(), "/api/v1/studies/1.2.3") == 401
+
+    assert REGISTRY.get_sample_value("horalix_requests_total", labels) == before + 1
@@ -6,15 +6,17 @@
 3. Computes annotations count from database
 """
 
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.models.annotation import Annotation, AnnotationType
 from app.models.base import Base
+from app.models.instance import Instance
+from app.models.job import AIJob, JobStatus
 from app.models.patient import Patient
 from app.models.series import Series
 from app.models.study import Study, StudyStatus
@@ -70,9 +72,7 @@ async def sample_study(test_db: AsyncSession, sample_patient: Patient):
         study_date=date(2024, 1, 15),
         study_description="Test CT Study",
         accession_number="ACC001",
-        modalities_in_study="CT",
-        num_series=1,
-        num_instances=10,
+        modalities_in_study=["CT"],
         status=StudyStatus.COMPLETE,
         patient_id_fk=sample_patient.id,
     )
@@ -174,7 +174,7 @@ async def test_multiple_studies_annotations_isolated(
             study_date=date(2024, 1, 16),
             study_description="Test CT Study 2",
             accession_number="ACC002",
-            modalities_in_study="CT",
+            modalities_in_study=["CT"],
             num_series=1,
             num_instances=5,
             status=StudyStatus.COMPLETE,
@@ -271,3 +271,307 @@ async def test_annotation_types_all_counted(
         count = result.scalar() or 0
 
         assert count == len(annotation_types)
+
+    @pytest.mark.asyncio
+    async def test_get_study_returns_annotations_count(
+        self,
+        test_db: AsyncSession,
+        sample_study: Study,
+        sample_series: Series,
+    ):
+        """Test that get_study reports the study's annotation count."""
+        from app.api.v1.endpoints.studies import get_study
+        from app.core.security import TokenData
+
+        for i in range(2):
+            test_db.add(
+                Annotation(
+                    study_uid=sample_study.study_instance_uid,
+                    series_uid=sample_series.series_instance_uid,
+                    instance_uid=f"1.2.840.10008.5.1.4.1.1.2.1.99999.{i}",
+                    annotation_type=AnnotationType.LENGTH,
+                    geometry={"points": [[10, 10], [20, 20]]},
+                    created_by="test_user",
+                )
+            )
+        await test_db.commit()
+        test_db.expunge_all()
+
+        user = TokenData(user_id="test-user", username="tester", roles=["admin"])
+        response = await get_study(sample_study.study_instance_uid, user, test_db)
+
+        assert response.annotations_count == 2
+        assert response.study.study_instance_uid == sample_study.study_instance_uid
+        assert [s.series_instance_uid for s in response.series] == [
+            sample_series.series_instance_uid
+        ]
+        assert response.ai_results_available is False
+
+    @pytest.mark.asyncio
+    async def test_get_study_reports_completed_ai_results(
+        self,
+        test_db: AsyncSession,
+        sample_study: Study,
+    ):
+        """Test that get_study only flags AI results for completed jobs."""
+        from app.api.v1.endpoints.studies import get_study
+        from app.core.security import TokenData
+
+        test_db.add(
+            AIJob(
+                job_id="job-running",
+                study_instance_uid=sample_study.study_instance_uid,
+                model_type="nnunet",
+                task_type="segmentation",
+                status=JobStatus.RUNNING,
+            )
+        )
+        await test_db.commit()
+        test_db.expunge_all()
+
+        user = TokenData(user_id="test-user", username="tester", roles=["admin"])
+        response = await get_study(sample_study.study_instance_uid, user, test_db)
+        assert response.ai_results_available is False
+
+        test_db.add(
+            AIJob(
+                job_id="job-completed",
+                study_instance_uid=sample_study.study_instance_uid,
+                model_type="nnunet",
+                task_type="segmentation",
+                status=JobStatus.COMPLETED,
+            )
+        )
+        await test_db.commit()
+        test_db.expunge_all()
+
+        response = await get_study(sample_study.study_instance_uid, user, test_db)
+        assert response.ai_results_available is True
+
+
+class TestListStudies:
+    """Test the list_studies endpoint."""
+
+    @staticmethod
+    async def _list(db: AsyncSession, **filters):
+        from app.api.v1.endpoints.studies import list_studies
+        from app.core.security import TokenData
+
+        params = {
+            "patient_id": None,
+            "patient_name": None,
+            "study_date_from": None,
+            "study_date_to": None,
+            "modality": None,
+            "accession_number": None,
+            "study_description": None,
+            "page": 1,
+            "page_size": 20,
+        }
+        params.update(filters)
+        user = TokenData(user_id="test-user", username="tester", roles=["admin"])
+        return await list_studies(user, db, **params)
+
+    @pytest.mark.asyncio
+    async def test_list_studies_includes_patient_fields(
+        self, test_db: AsyncSession, sample_study: Study
+    ):
+        """Test that listed studies carry their patient and study metadata."""
+        test_db.add(
+            Study(
+                study_instance_uid="1.2.840.10008.5.1.4.1.1.2.1.99999.50",
+                study_date=date(2023, 6, 1),
+                status=StudyStatus.PENDING,
+            )
+        )
+        await test_db.commit()
+
+        response = await self._list(test_db)
+
+        assert response.total == 2
+        first, second = response.studies
+        assert first.study_instance_uid == sample_study.study_instance_uid
+        assert first.patient_id == "TEST001"
+        assert first.patient_name == "Test Patient"
+        assert first.modalities_in_study == ["CT"]
+        assert first.status == "complete"
+        assert second.patient_id is None
+        assert second.modalities_in_study == []
+
+    @pytest.mark.asyncio
+    async def test_list_studies_filters_by_patient(
+        self, test_db: AsyncSession, sample_study: Study
+    ):
+        """Test patient filters against the joined patient columns."""
+        response = await self._list(test_db, patient_id="TEST001")
+        assert [s.study_instance_uid for s in response.studies] == [sample_study.study_instance_uid]
+
+        response = await self._list(test_db, patient_name="nobody")
+        assert response.total == 0
+        assert response.studies == []
+
+    @pytest.mark.asyncio
+    async def test_list_studies_filters_by_modality(
+        self, test_db: AsyncSession, sample_study: Study
+    ):
+        """Test the modality filter matches whole modality codes only."""
+        from app.api.v1.endpoints.studies import Modality
+
+        for suffix, modalities in (("51", ["CTA"]), ("52", ["MR", "CT"]), ("53", None)):
+            test_db.add(
+                Study(
+                    study_instance_uid=f"1.2.840.10008.5.1.4.1.1.2.1.99999.{suffix}",
+                    modalities_in_study=modalities,
+                    status=StudyStatus.PENDING,
+                )
+            )
+        await test_db.commit()
+
+        response = await self._list(test_db, modality=Modality.CT)
+        assert sorted(s.study_instance_uid for s in response.studies) == [
+            sample_study.study_instance_uid,
+            "1.2.840.10008.5.1.4.1.1.2.1.99999.52",
+        ]
+        response = await self._list(test_db, modality=Modality.MR)
+        assert [s.modalities_in_study for s in response.studies] == [["MR", "CT"]]
+
+    def test_modality_filter_uses_array_containment_on_postgres(self):
+        """Test PostgreSQL filters with @> so the GIN index serves it."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.api.v1.endpoints.studies import Modality, _has_modality
+
+        compiled = _has_modality(Modality.CT, "postgresql").compile(dialect=postgresql.dialect())
+        assert "studies.modalities_in_study @> " in str(compiled)
+        assert list(compiled.params.values()) == [["CT"]]
+
+    @pytest.mark.asyncio
+    async def test_stream_studies_writes_ndjson(self, test_db: AsyncSession, sample_study: Study):
+        """Test that stream_studies emits one JSON document per matching study."""
+        import json
+
+        from app.api.v1.endpoints.studies import stream_studies
+        from app.core.security import TokenData
+
+        user = TokenData(user_id="test-user", username="tester", roles=["admin"])
+        response = await stream_studies(
+            user,
+            test_db,
+            patient_id="TEST001",
+            patient_name=None,
+            study_date_from=None,
+            study_date_to=None,
+            modality=None,
+            accession_number=None,
+            study_description=None,
+            limit=None,
+        )
+        assert response.media_type == "application/x-ndjson"
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        lines = body.splitlines()
+        assert len(lines) == 1
+        study = json.loads(lines[0])
+        assert study["study_instance_uid"] == sample_study.study_instance_uid
+        assert study["study_date"] == "2024-01-15"
+        assert study["patient_name"] == "Test Patient"
+
+
+class TestRefreshStudy:
+    """Test the refresh_study_metadata endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_bumps_updated_at(self, test_db: AsyncSession, sample_study: Study):
+        """Test that refresh updates the timestamp and returns patient fields."""
+        from app.api.v1.endpoints.studies import refresh_study_metadata
+        from app.core.security import TokenData
+
+        previous = sample_study.updated_at
+        test_db.expunge_all()
+
+        user = TokenData(user_id="test-user", username="tester", roles=["admin"])
+        response = await refresh_study_metadata(sample_study.study_instance_uid, user, test_db)
+
+        assert response.study_instance_uid == sample_study.study_instance_uid
+        assert response.patient_id == "TEST001"
+        assert response.updated_at >= previous
+
+    @pytest.mark.asyncio
+    async def test_refresh_unknown_study_returns_404(self, test_db: AsyncSession):
+        """Test that refreshing a missing study raises 404."""
+        from fastapi import HTTPException
+
+        from app.api.v1.endpoints.studies import refresh_study_metadata
+        from app.core.security import TokenData
+
+        user = TokenData(user_id="test-user", username="tester", roles=["admin"])
+        with pytest.raises(HTTPException) as exc_info:
+            await refresh_study_metadata("9.9.9", user, test_db)
+        assert exc_info.value.status_code == 404
+
+
+class TestAIJobDuration:
+    """Test the database-computed AI job duration."""
+
+    @pytest.mark.asyncio
+    async def test_duration_computed_on_completion(
+        self, test_db: AsyncSession, sample_study: Study
+    ):
+        """Test duration_ms is filled in once both timestamps are set."""
+        started = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
+        job = AIJob(
+            job_id="job-timed",
+            study_instance_uid=sample_study.study_instance_uid,
+            model_type="nnunet",
+            task_type="segmentation",
+            status=JobStatus.RUNNING,
+            started_at=started,
+        )
+        test_db.add(job)
+        await test_db.commit()
+        assert job.duration_ms is None
+
+        job.completed_at = started + timedelta(seconds=2, milliseconds=500)
+        job.status = JobStatus.COMPLETED
+        await test_db.commit()
+
+        assert job.duration_ms == 2500
+
+
+class TestCountTriggers:
+    """Test the trigger-maintained series and instance counters."""
+
+    @pytest.mark.asyncio
+    async def test_counts_follow_inserts_and_deletes(
+        self, test_db: AsyncSession, sample_study: Study, sample_series: Series
+    ):
+        """Test instance and series writes update the counters in the database."""
+        await test_db.refresh(sample_study)
+        assert (sample_study.num_series, sample_study.num_instances) == (1, 10)
+
+        await test_db.execute(
+            insert(Instance),
+            [
+                {
+                    "sop_instance_uid": f"1.2.3.{number}",
+                    "sop_class_uid": "1.2.840.10008.5.1.4.1.1.2",
+                    "instance_number": number,
+                    "series_instance_uid_fk": sample_series.series_instance_uid,
+                }
+                for number in range(3)
+            ],
+        )
+        await test_db.refresh(sample_series)
+        await test_db.refresh(sample_study)
+        assert sample_series.num_instances == 13
+        assert sample_study.num_instances == 13
+
+        await test_db.execute(delete(Instance).where(Instance.instance_number < 2))
+        await test_db.refresh(sample_series)
+        await test_db.refresh(sample_study)
+        assert sample_series.num_instances == 11
+        assert sample_study.num_instances == 11
+
+        await test_db.execute(delete(Series))
+        await test_db.refresh(sample_study)
+        assert (sample_study.num_series, sample_study.num_instances) == (0, 0)
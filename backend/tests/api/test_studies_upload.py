@@ -3,6 +3,7 @@
 from datetime import datetime
 from pathlib import Path
 
+import blake3
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
@@ -10,6 +11,7 @@
 from pydicom.uid import ExplicitVRLittleEndian
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from starlette.datastructures import UploadFile
 
 from app.api.v1.endpoints.auth import get_current_active_user
 from app.api.v1.endpoints.studies import router as studies_router
@@ -18,10 +20,16 @@
 from app.models.instance import Instance
 from app.models.series import Series
 from app.models.study import Study
+from app.services.dicom.extraction import extract_upload_metadata
 from app.services.dicom.storage import DicomStorageService
 
 
-def _create_test_dicom(path: Path) -> None:
+def _create_test_dicom(
+    path: Path,
+    series_uid: str = "1.2.3.4",
+    instance_uid: str = "1.2.3.4.5",
+    modality: str = "CT",
+) -> None:
     file_meta = Dataset()
     file_meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
     file_meta.MediaStorageSOPInstanceUID = "1.2.3.4.5.6.7.8.9.1"
@@ -35,9 +43,9 @@ def _create_test_dicom(path: Path) -> None:
     ds.PatientID = "TEST001"
     ds.PatientName = "Test^Patient"
     ds.StudyInstanceUID = "1.2.3"
-    ds.SeriesInstanceUID = "1.2.3.4"
-    ds.SOPInstanceUID = "1.2.3.4.5"
-    ds.Modality = "CT"
+    ds.SeriesInstanceUID = series_uid
+    ds.SOPInstanceUID = instance_uid
+    ds.Modality = modality
     ds.StudyDate = datetime.now().strftime("%Y%m%d")
     ds.SeriesNumber = 1
     ds.InstanceNumber = 1
@@ -102,6 +110,7 @@ async def test_upload_stores_dicom_file(upload_app, tmp_path: Path) -> None:
     assert response.status_code == 201
     payload = response.json()
     assert payload["study_instance_uid"] == "1.2.3"
+    assert payload["modalities_in_study"] == ["CT"]
 
     stored_path = storage.storage_dir / "TEST001" / "1.2.3" / "1.2.3.4" / "1.2.3.4.5.dcm"
     assert stored_path.exists()
@@ -112,8 +121,141 @@ async def test_upload_stores_dicom_file(upload_app, tmp_path: Path) -> None:
         )
         study = study_result.scalar_one_or_none()
         assert study is not None
+        assert study.modalities_in_study == ["CT"]
 
         series = (await session.execute(select(Series))).scalars().all()
         instances = (await session.execute(select(Instance))).scalars().all()
         assert len(series) == 1
         assert len(instances) == 1
+        assert instances[0].file_checksum_algo == "blake3"
+        assert instances[0].file_checksum == blake3.blake3(dicom_path.read_bytes()).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_upload_rejects_invalid_dicom(upload_app, tmp_path: Path) -> None:
+    app, session_maker, storage = upload_app
+    bogus_path = tmp_path / "bogus.dcm"
+    bogus_path.write_bytes(b"not a dicom file")
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        with bogus_path.open("rb") as f:
+            response = await client.post(
+                "/api/v1/studies/upload",
+                files={"files": ("bogus.dcm", f, "application/dicom")},
+            )
+
+    assert response.status_code == 400
+    assert "bogus.dcm" in response.json()["detail"]
+    assert list(storage.temp_dir.iterdir()) == []
+
+    async with session_maker() as session:
+        studies = (await session.execute(select(Study))).scalars().all()
+        assert studies == []
+
+
+@pytest.mark.asyncio
+async def test_upload_stops_at_invalid_first_file(
+    upload_app, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    app, session_maker, storage = upload_app
+    bogus_path = tmp_path / "bogus.dcm"
+    bogus_path.write_bytes(b"not a dicom file")
+    dicom_path = tmp_path / "valid.dcm"
+    _create_test_dicom(dicom_path)
+
+    read_names: set[str] = set()
+    read = UploadFile.read
+
+    async def tracking_read(self: UploadFile, size: int = -1) -> bytes:
+        read_names.add(self.filename)
+        return await read(self, size)
+
+    monkeypatch.setattr(UploadFile, "read", tracking_read)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        with bogus_path.open("rb") as bogus, dicom_path.open("rb") as valid:
+            response = await client.post(
+                "/api/v1/studies/upload",
+                files=[
+                    ("files", ("bogus.dcm", bogus, "application/dicom")),
+                    ("files", ("valid.dcm", valid, "application/dicom")),
+                ],
+            )
+
+    assert response.status_code == 400
+    assert "bogus.dcm" in response.json()["detail"]
+    assert read_names == {"bogus.dcm"}
+    assert list(storage.temp_dir.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_upload_indexes_multiple_series(upload_app, tmp_path: Path) -> None:
+    app, session_maker, storage = upload_app
+    layout = [
+        ("1.2.3.4", "1.2.3.4.1", "CT"),
+        ("1.2.3.4", "1.2.3.4.2", "CT"),
+        ("1.2.3.5", "1.2.3.5.1", "PT"),
+    ]
+    paths = []
+    for series_uid, instance_uid, modality in layout:
+        path = tmp_path / f"{instance_uid}.dcm"
+        _create_test_dicom(path, series_uid, instance_uid, modality)
+        paths.append(path)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        handles = [path.open("rb") for path in paths]
+        try:
+            response = await client.post(
+                "/api/v1/studies/upload",
+                files=[
+                    ("files", (p.name, h, "application/dicom"))
+                    for p, h in zip(paths, handles, strict=True)
+                ],
+            )
+        finally:
+            for handle in handles:
+                handle.close()
+
+    assert response.status_code == 201
+    payload = response.json()
+    assert payload["num_series"] == 2
+    assert payload["num_instances"] == 3
+    assert payload["modalities_in_study"] == ["CT", "PT"]
+
+    async with session_maker() as session:
+        series = (await session.execute(select(Series))).scalars().all()
+        counts = {s.series_instance_uid: s.num_instances for s in series}
+        assert counts == {"1.2.3.4": 2, "1.2.3.5": 1}
+
+        instances = (await session.execute(select(Instance))).scalars().all()
+        assert {i.sop_instance_uid: i.series_instance_uid_fk for i in instances} == {
+            "1.2.3.4.1": "1.2.3.4",
+            "1.2.3.4.2": "1.2.3.4",
+            "1.2.3.5.1": "1.2.3.5",
+        }
+
+        study = (await session.execute(select(Study))).scalar_one()
+        expected_digest = blake3.blake3(
+            b"".join(bytes.fromhex(c) for c in sorted(i.file_checksum for i in instances))
+        ).hexdigest()
+        assert study.content_digest == expected_digest
+
+
+def test_extract_reuses_series_fields_within_upload(tmp_path: Path) -> None:
+    first_path = tmp_path / "first.dcm"
+    second_path = tmp_path / "second.dcm"
+    _create_test_dicom(first_path, instance_uid="1.2.3.4.1", modality="CT")
+    _create_test_dicom(second_path, instance_uid="1.2.3.4.2", modality="MR")
+
+    first = extract_upload_metadata(str(first_path), "upload-a")
+    second = extract_upload_metadata(str(second_path), "upload-a")
+    assert second["series"] == first["series"]
+    assert second["series"] is not first["series"]
+    assert second["instance"]["sop_instance_uid"] == "1.2.3.4.2"
+
+    # A different upload, or no upload ID, extracts the series afresh
+    assert extract_upload_metadata(str(second_path), "upload-b")["series"]["modality"] == "MR"
+    assert extract_upload_metadata(str(second_path))["series"]["modality"] == "MR"
@@ -5,6 +5,7 @@
 """
 
 import asyncio
+import os
 from collections.abc import Generator
 from pathlib import Path
 from typing import Any
@@ -15,6 +16,9 @@
 # Use in-memory SQLite for tests
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# Minimum bcrypt cost keeps password hashing from dominating test runtime
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 
 @pytest.fixture(scope="session")
 def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
@@ -0,0 +1,82 @@
+"""Tests for content-addressed DICOM storage.
+
+These tests verify:
+1. Identical content is stored once and hard-linked into instance paths
+2. Blobs survive while any instance path still links to them
+3. Unreferenced blobs are pruned
+"""
+
+from pathlib import Path
+
+import pytest
+
+from app.services.dicom.storage import DicomStorageService, new_checksum
+
+
+@pytest.fixture
+async def storage(tmp_path: Path) -> DicomStorageService:
+    """Create an initialized storage service in a temp directory."""
+    service = DicomStorageService(tmp_path / "dicom")
+    await service.initialize()
+    return service
+
+
+async def _store(storage: DicomStorageService, content: bytes, study_uid: str, instance_uid: str):
+    temp_path = storage.temp_dir / f"{instance_uid}.tmp"
+    temp_path.write_bytes(content)
+    hasher = new_checksum()
+    hasher.update(content)
+    return await storage.store_instance_file(
+        temp_path,
+        patient_id="TEST001",
+        study_uid=study_uid,
+        series_uid="1.2.3.4",
+        instance_uid=instance_uid,
+        checksum=hasher.hexdigest(),
+        file_size=len(content),
+    )
+
+
+class TestContentAddressedStorage:
+    """Tests for blob deduplication in DicomStorageService."""
+
+    @pytest.mark.asyncio
+    async def test_identical_content_is_deduplicated(self, storage: DicomStorageService):
+        """Test that re-uploaded content links to the existing blob."""
+        first = await _store(storage, b"dicom-bytes", "1.2.3", "1.2.3.4.1")
+        second = await _store(storage, b"dicom-bytes", "1.2.9", "1.2.9.4.1")
+
+        assert first["deduplicated"] is False
+        assert second["deduplicated"] is True
+        assert await storage.has_blob(first["checksum"])
+
+        first_stat = Path(first["file_path"]).stat()
+        second_stat = Path(second["file_path"]).stat()
+        assert first_stat.st_ino == second_stat.st_ino
+        assert first_stat.st_nlink == 3  # blob + two instance paths
+        assert list(storage.temp_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_distinct_content_is_stored_separately(self, storage: DicomStorageService):
+        """Test that different content gets its own blob."""
+        first = await _store(storage, b"first", "1.2.3", "1.2.3.4.1")
+        second = await _store(storage, b"second", "1.2.3", "1.2.3.4.2")
+
+        assert second["deduplicated"] is False
+        assert Path(first["file_path"]).read_bytes() == b"first"
+        assert Path(second["file_path"]).read_bytes() == b"second"
+
+    @pytest.mark.asyncio
+    async def test_prune_keeps_linked_blobs(self, storage: DicomStorageService):
+        """Test that blobs are pruned only once no instance path links them."""
+        first = await _store(storage, b"dicom-bytes", "1.2.3", "1.2.3.4.1")
+        await _store(storage, b"dicom-bytes", "1.2.9", "1.2.9.4.1")
+        checksum = first["checksum"]
+
+        await storage.delete_study("1.2.3")
+        assert await storage.prune_blobs([checksum]) == 0
+        assert await storage.has_blob(checksum)
+
+        await storage.delete_study("1.2.9")
+        assert await storage.prune_blobs() == 1
+        assert not await storage.has_blob(checksum)
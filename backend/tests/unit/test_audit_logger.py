@@ -0,0 +1,133 @@
+"""Tests for background audit event delivery."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core import logging as app_logging
+from app.core.config import DatabaseSettings
+from app.core.logging import AuditLogger
+
+
+@pytest.fixture
+def audit() -> AuditLogger:
+    """Create an audit logger with a mocked underlying logger."""
+    audit_logger = AuditLogger()
+    audit_logger.logger = MagicMock()
+    return audit_logger
+
+
+class TestAuditLogger:
+    """Test AuditLogger delivery modes."""
+
+    def test_writes_synchronously_when_not_started(self, audit: AuditLogger):
+        """Test that events are written in-line without a delivery task."""
+        audit.log_access(user_id="u1", resource_type="study", resource_id="1.2.3", action="VIEW")
+
+        audit.logger.info.assert_called_once()
+        assert audit.logger.info.call_args.args == ("resource_access",)
+        assert "occurred_at" not in audit.logger.info.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_queues_events_until_delivered(self, audit: AuditLogger):
+        """Test that started delivery writes events in the background."""
+        await audit.start()
+        audit.log_access(user_id="u1", resource_type="study", resource_id="1.2.3", action="VIEW")
+        audit.log_authentication(user_id=None, username="bob", success=False)
+        audit.logger.info.assert_not_called()
+
+        await audit.stop()
+
+        audit.logger.info.assert_called_once()
+        assert audit.logger.info.call_args.kwargs["resource_id"] == "1.2.3"
+        assert "occurred_at" in audit.logger.info.call_args.kwargs
+        audit.logger.warning.assert_called_once()
+        assert audit.logger.warning.call_args.args == ("authentication",)
+
+    @pytest.mark.asyncio
+    async def test_writes_synchronously_from_other_threads(self, audit: AuditLogger):
+        """Test that events from worker threads bypass the loop-bound queue."""
+        await audit.start()
+        await asyncio.to_thread(
+            audit.log_access,
+            user_id="u1",
+            resource_type="study",
+            resource_id="1.2.3",
+            action="VIEW",
+        )
+        audit.logger.info.assert_called_once()
+        await audit.stop()
+        audit.logger.info.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_flush_waits_for_queued_events(self, audit: AuditLogger):
+        """Test that flush returns only after queued events are written."""
+        await audit.start()
+        audit.log_data_export(
+            user_id="u1", export_type="study", resource_ids=["1.2.3"], format="DICOM"
+        )
+        audit.logger.info.assert_not_called()
+
+        await audit.flush()
+
+        audit.logger.info.assert_called_once()
+        assert audit.logger.info.call_args.args == ("data_export",)
+        await audit.stop()
+
+    def test_data_export_counts_iterables_in_one_pass(self, audit: AuditLogger):
+        """Test that generator IDs are counted but only a sample is logged."""
+        audit.log_data_export(
+            user_id="u1",
+            export_type="study",
+            resource_ids=(f"1.2.{i}" for i in range(25)),
+            format="DICOM",
+        )
+
+        kwargs = audit.logger.info.call_args.kwargs
+        assert kwargs["resource_count"] == 25
+        assert kwargs["resource_ids"] == [f"1.2.{i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_queued_events_keep_bound_request_fields(self, audit: AuditLogger):
+        """Test that queued events are written in the context they were logged from."""
+        seen: list[dict] = []
+        audit.logger.info.side_effect = lambda *args, **kwargs: seen.append(
+            app_logging._request_context.get()
+        )
+        await audit.start()
+
+        audit.bind_request(request_id="req-1", ip_address="10.0.0.1")
+        audit.log_access(user_id="u1", resource_type="study", resource_id="1.2.3", action="VIEW")
+        audit.clear_request()
+        await audit.stop()
+
+        assert seen == [{"request_id": "req-1", "ip_address": "10.0.0.1"}]
+
+    def test_skips_events_when_audit_logging_disabled(self, audit: AuditLogger):
+        """Test that nothing is built or written when audit logging is off."""
+        audit._enabled = False
+
+        audit.log_access(user_id="u1", resource_type="study", resource_id="1.2.3", action="VIEW")
+        audit.log_authentication(user_id=None, username="bob", success=False)
+
+        audit.logger.info.assert_not_called()
+        audit.logger.warning.assert_not_called()
+
+    def test_configuration_change_omits_connection_passwords(self, audit: AuditLogger):
+        """Test that settings objects are audited via their password-free repr."""
+        old = DatabaseSettings(password="old-secret")
+        new = DatabaseSettings(password="new-secret", host="db.internal")
+
+        audit.log_configuration_change(
+            user_id="admin",
+            setting_name="database",
+            old_value=old,
+            new_value=new,
+            component="core",
+        )
+
+        kwargs = audit.logger.info.call_args.kwargs
+        assert kwargs["new_value"] == new.audit_repr[:100]
+        assert "secret" not in kwargs["old_value"] + kwargs["new_value"]
+        assert '"host":"db.internal"' in kwargs["new_value"]
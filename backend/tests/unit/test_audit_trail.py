@@ -0,0 +1,322 @@
+"""Tests for the batched persistent audit trail."""
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.logging import AuditLogger
+from app.core.security import SecurityManager
+from app.models.audit import AuditAction, AuditLog
+from app.models.base import Base
+from app.services import audit_trail
+from app.services.audit_trail import (
+    _CHAINED_COLUMNS,
+    _COPY_COLUMNS,
+    AuditTrailWriter,
+    _to_copy_record,
+    _to_row,
+    audit_partition_ddl,
+    chain_hash,
+    ensure_audit_partitions,
+    verify_audit_chain,
+)
+
+
+@pytest.fixture
+async def session_maker(tmp_path):
+    """Create a SQLite database with the audit_logs table."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'audit.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    await engine.dispose()
+
+
+def _entry(resource_id: str, action: str = AuditAction.STUDY_VIEW.value):
+    return SecurityManager.create_audit_entry(
+        user_id="u1", action=action, resource_type="study", resource_id=resource_id
+    )
+
+
+class TestAuditTrailWriter:
+    """Test AuditTrailWriter delivery modes."""
+
+    @pytest.mark.asyncio
+    async def test_queued_entries_inserted_in_one_batch(self, session_maker):
+        """Test entries queued together are written with a single insert."""
+        writer = AuditTrailWriter(session_maker)
+        insert_spy = AsyncMock(wraps=writer._insert)
+        writer._insert = insert_spy
+        await writer.start()
+
+        for i in range(5):
+            await writer.emit(_entry(f"1.2.{i}"))
+        await writer.stop()
+
+        insert_spy.assert_awaited_once()
+        async with session_maker() as session:
+            count = await session.scalar(select(func.count()).select_from(AuditLog))
+        assert count == 5
+
+    @pytest.mark.asyncio
+    async def test_inserts_directly_when_not_started(self, session_maker):
+        """Test entries are written immediately without background delivery."""
+        writer = AuditTrailWriter(session_maker)
+
+        await writer.emit(_entry("1.2.3"))
+
+        async with session_maker() as session:
+            log = await session.scalar(select(AuditLog))
+        assert log.action is AuditAction.STUDY_VIEW
+        assert log.resource_id == "1.2.3"
+
+    @pytest.mark.asyncio
+    async def test_ids_are_time_ordered_uuid7(self, session_maker):
+        """Test rows get UUIDv7 ids that sort in insertion order."""
+        writer = AuditTrailWriter(session_maker)
+        for i in range(20):
+            await writer.emit(_entry(f"1.2.{i}"))
+
+        async with session_maker() as session:
+            logs = (await session.scalars(select(AuditLog).order_by(AuditLog.id))).all()
+        assert all(log.id.version == 7 for log in logs)
+        assert [log.resource_id for log in logs] == [f"1.2.{i}" for i in range(20)]
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_action(self, session_maker):
+        """Test entries with an action outside AuditAction are refused up front."""
+        writer = AuditTrailWriter(session_maker)
+
+        with pytest.raises(ValueError):
+            await writer.emit(_entry("1.2.3", action="VIEW"))
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried(self, session_maker, monkeypatch):
+        """Test a batch that fails once is written by the retry."""
+        monkeypatch.setattr(audit_trail, "AUDIT_TRAIL_RETRY_DELAY", 0)
+        writer = AuditTrailWriter(session_maker)
+        insert = writer._insert
+        failures = [OSError("connection reset")]
+
+        async def flaky_insert(rows):
+            if failures:
+                raise failures.pop()
+            await insert(rows)
+
+        writer._insert = flaky_insert
+        await writer.start()
+        for i in range(3):
+            await writer.emit(_entry(f"1.2.{i}"))
+        await writer.stop()
+
+        async with session_maker() as session:
+            logs = (await session.scalars(select(AuditLog).order_by(AuditLog.id))).all()
+        assert [log.resource_id for log in logs] == ["1.2.0", "1.2.1", "1.2.2"]
+        assert verify_audit_chain(logs)
+
+    @pytest.mark.asyncio
+    async def test_bad_row_does_not_drop_its_batch(self, session_maker, monkeypatch):
+        """Test a batch that keeps failing is written row by row."""
+        monkeypatch.setattr(audit_trail, "AUDIT_TRAIL_RETRY_DELAY", 0)
+        writer = AuditTrailWriter(session_maker)
+        insert = writer._insert
+
+        async def reject_bad_row(rows):
+            if any(row["resource_id"] == "bad" for row in rows):
+                raise ValueError("rejected")
+            await insert(rows)
+
+        writer._insert = reject_bad_row
+        await writer.start()
+        for resource_id in ("1.2.0", "bad", "1.2.2"):
+            await writer.emit(_entry(resource_id))
+        await writer.stop()
+
+        async with session_maker() as session:
+            logs = (await session.scalars(select(AuditLog).order_by(AuditLog.id))).all()
+        assert [log.resource_id for log in logs] == ["1.2.0", "1.2.2"]
+        assert verify_audit_chain(logs)
+
+    @pytest.mark.asyncio
+    async def test_audit_logger_feeds_the_trail(self, session_maker):
+        """Test events logged through AuditLogger are stored in audit_logs."""
+        writer = AuditTrailWriter(session_maker)
+        audit = AuditLogger()
+        audit.logger = MagicMock()
+        await writer.start()
+        audit.persist_to(writer)
+
+        audit.log_access(user_id="u1", resource_type="study", resource_id="1.2.3", action="VIEW")
+        audit.log_authentication(user_id=None, username="bob", success=False)
+        # No audit_logs action for this pair: logged only
+        audit.log_access(user_id="u1", resource_type="study", resource_id="1.2.3", action="PING")
+        await audit.flush()
+        audit.persist_to(None)
+        await writer.stop()
+
+        async with session_maker() as session:
+            logs = (await session.scalars(select(AuditLog).order_by(AuditLog.id))).all()
+        assert [log.action for log in logs] == [AuditAction.STUDY_VIEW, AuditAction.LOGIN_FAILED]
+        assert logs[1].user_id == "bob"
+        assert not logs[1].success
+
+
+class TestAuditHashChain:
+    """Test the tamper-evident audit hash chain."""
+
+    @pytest.mark.asyncio
+    async def test_rows_are_chained_across_batches(self, session_maker):
+        """Test each row links to the previous one, including after a restart."""
+        writer = AuditTrailWriter(session_maker)
+        await writer.emit(_entry("1.2.1"))
+        await writer.emit(_entry("1.2.2"))
+        # A new writer continues the chain from the stored rows
+        await AuditTrailWriter(session_maker).emit(_entry("1.2.3"))
+
+        async with session_maker() as session:
+            logs = (await session.scalars(select(AuditLog).order_by(AuditLog.id))).all()
+        assert logs[0].prev_hash is None
+        assert [log.prev_hash for log in logs[1:]] == [log.row_hash for log in logs[:-1]]
+        assert verify_audit_chain(logs)
+
+    @pytest.mark.asyncio
+    async def test_tampering_is_detected(self, session_maker):
+        """Test edited or removed rows break verification."""
+        writer = AuditTrailWriter(session_maker)
+        for i in range(3):
+            await writer.emit(_entry(f"1.2.{i}"))
+
+        async with session_maker() as session:
+            logs = list((await session.scalars(select(AuditLog).order_by(AuditLog.id))).all())
+        assert not verify_audit_chain([logs[0], logs[2]])
+
+        logs[1].resource_id = "9.9.9"
+        assert not verify_audit_chain(logs)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writers_share_one_chain(self, session_maker):
+        """Test writers standing in for separate processes do not fork the chain."""
+        writers = [AuditTrailWriter(session_maker), AuditTrailWriter(session_maker)]
+        for i in range(4):
+            await writers[i % 2].emit(_entry(f"1.2.{i}"))
+
+        async with session_maker() as session:
+            logs = (await session.scalars(select(AuditLog).order_by(AuditLog.id))).all()
+        assert [log.resource_id for log in logs] == [f"1.2.{i}" for i in range(4)]
+        assert verify_audit_chain(logs)
+
+    @pytest.mark.asyncio
+    async def test_forked_chain_is_detected(self, session_maker):
+        """Test a row linking to an older row than its predecessor fails."""
+        writer = AuditTrailWriter(session_maker)
+        for i in range(3):
+            await writer.emit(_entry(f"1.2.{i}"))
+
+        async with session_maker() as session:
+            logs = list((await session.scalars(select(AuditLog).order_by(AuditLog.id))).all())
+        row = {column: getattr(logs[2], column) for column in _CHAINED_COLUMNS}
+        logs[2].prev_hash = logs[0].row_hash
+        logs[2].row_hash = chain_hash(logs[0].row_hash, row)
+        assert not verify_audit_chain(logs)
+        # A slice of the chain checks on its own
+        assert verify_audit_chain(logs[1:2])
+
+
+class TestCopyRecord:
+    """Test rows prepared for COPY on PostgreSQL."""
+
+    def test_record_matches_copy_columns(self):
+        """Test records carry the enum name and JSON text in column order."""
+        entry = _entry("1.2.3")
+        entry.details = {"frames": 3}
+
+        row = _to_row(entry)
+        row["prev_hash"] = None
+        row["row_hash"] = chain_hash(None, row)
+
+        record = dict(zip(_COPY_COLUMNS, _to_copy_record(row), strict=True))
+
+        assert record["action"] == "STUDY_VIEW"
+        assert record["details"] == '{"frames":3}'
+        assert record["resource_id"] == "1.2.3"
+        assert record["timestamp"] == entry.timestamp
+        assert record["row_hash"] == row["row_hash"]
+
+
+class TestAuditPartitionDDL:
+    """Test monthly audit_logs partition statements."""
+
+    def test_partition_covers_one_month(self):
+        """Test the partition is named for its month and bounded by the next."""
+        ddl = audit_partition_ddl(date(2026, 10, 17))
+
+        assert "audit_logs_2026_10 PARTITION OF audit_logs" in ddl
+        assert "FROM ('2026-10-01 00:00:00+00') TO ('2026-11-01 00:00:00+00')" in ddl
+
+    def test_december_rolls_over_year(self):
+        """Test the December partition ends on January 1st of the next year."""
+        ddl = audit_partition_ddl(date(2026, 12, 1))
+
+        assert "TO ('2027-01-01 00:00:00+00')" in ddl
+
+
+class _RecordingConnection:
+    """Connection stand-in that records SQL and answers scalar queries."""
+
+    def __init__(self, scalars: dict[str, object]):
+        self.scalars_by_prefix = scalars
+        self.statements: list[str] = []
+
+    async def scalar(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        return next((v for k, v in self.scalars_by_prefix.items() if sql.startswith(k)), None)
+
+    async def scalars(self, statement, params=None):
+        self.statements.append(str(statement))
+        return []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+
+    def begin_nested(self):
+        savepoint = MagicMock()
+        savepoint.__aenter__ = AsyncMock()
+        savepoint.__aexit__ = AsyncMock(return_value=False)
+        return savepoint
+
+
+class TestEnsureAuditPartitions:
+    """Test creating monthly partitions on a partitioned audit_logs."""
+
+    @pytest.mark.asyncio
+    async def test_moves_rows_out_of_default_partition(self):
+        """Test default rows of a new month are moved while it is detached."""
+        conn = _RecordingConnection(
+            {
+                "SELECT 1 FROM pg_partitioned_table": 1,
+                "SELECT to_regclass": False,
+                "SELECT EXISTS": True,
+            }
+        )
+
+        assert await ensure_audit_partitions(conn, months_ahead=0) == 1
+
+        ddl = [s for s in conn.statements if not s.startswith("SELECT")]
+        assert ddl[0] == "ALTER TABLE audit_logs DETACH PARTITION audit_logs_default"
+        assert "PARTITION OF audit_logs" in ddl[1]
+        assert ddl[2].startswith("WITH moved AS (DELETE FROM audit_logs_default")
+        assert ddl[3] == "ALTER TABLE audit_logs ATTACH PARTITION audit_logs_default DEFAULT"
+
+    @pytest.mark.asyncio
+    async def test_skips_existing_partitions(self):
+        """Test months whose partition exists issue no DDL."""
+        conn = _RecordingConnection(
+            {"SELECT 1 FROM pg_partitioned_table": 1, "SELECT to_regclass": True}
+        )
+
+        assert await ensure_audit_partitions(conn, months_ahead=2) == 3
+        assert all(s.startswith("SELECT") for s in conn.statements)
@@ -1,6 +1,14 @@
 """Tests for configuration module."""
 
-from app.core.config import Settings, get_settings
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import (
+    DatabaseSettings,
+    Settings,
+    _is_insecure_key,
+)
+from app.core.config import settings as global_settings
 
 
 class TestSettings:
@@ -34,8 +42,49 @@ def test_compliance_settings(self):
         assert settings.compliance.audit_logging_enabled is True
         assert settings.compliance.encryption_at_rest is True
 
-    def test_get_settings_cached(self):
-        """Test settings are cached."""
-        settings1 = get_settings()
-        settings2 = get_settings()
-        assert settings1 is settings2
+    def test_nested_settings_built_on_first_access(self):
+        """Test nested settings groups are only built when first read."""
+        settings = Settings()
+        assert "dicom" not in settings.__dict__
+        dicom = settings.dicom
+        assert settings.dicom is dicom
+        assert "ai" not in settings.__dict__
+
+    def test_database_url_cached(self):
+        """Test the database URL is built once and reused."""
+        settings = Settings()
+        assert settings.database.url is settings.database.url
+        assert settings.database.url.startswith("postgresql+asyncpg://")
+
+    def test_database_url_not_rebuilt_after_mutation(self):
+        """Test the cached URL is intentionally stale until invalidated."""
+        database = DatabaseSettings(password="old")
+        url = database.url
+        database.password = "new"
+        assert database.url == url
+
+        del database.__dict__["url"]
+        assert ":new@" in database.url
+
+    def test_global_settings_frozen(self):
+        """Test the module-level settings instance cannot be reassigned."""
+        with pytest.raises(ValidationError):
+            global_settings.debug = not global_settings.debug
+
+
+def test_is_insecure_key():
+    """Test placeholder and short keys are rejected case-insensitively."""
+    assert _is_insecure_key("")
+    assert _is_insecure_key("short")
+    assert _is_insecure_key("x" * 30 + "CHANGE-THIS")
+    assert not _is_insecure_key("a1b2c3d4" * 8)
+
+
+def test_dev_secret_key_warning_banner(capsys):
+    """Test the development SECRET_KEY banner is printed with 70-column rules."""
+    settings = Settings(secret_key="")
+
+    assert settings.secret_key.startswith("dev-only-insecure-")
+    lines = capsys.readouterr().err.splitlines()
+    assert lines.count("!" * 70) == 3
+    assert "WARNING: Using auto-generated temporary SECRET_KEY for development!" in lines
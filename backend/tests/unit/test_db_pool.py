@@ -0,0 +1,27 @@
+"""Tests for database connection pool pre-warming."""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.models.base import warm_pool
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_opens_pool_size_connections(tmp_path: Path) -> None:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=3,
+        max_overflow=0,
+    )
+    try:
+        opened = await warm_pool(engine, size=3)
+
+        assert opened == 3
+        assert engine.pool.checkedin() == 3
+        assert engine.pool.checkedout() == 0
+    finally:
+        await engine.dispose()
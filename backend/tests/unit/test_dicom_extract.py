@@ -0,0 +1,80 @@
+"""Tests for DICOM field extraction used during upload indexing."""
+
+from datetime import date, time
+
+import pytest
+from pydicom.dataset import Dataset
+
+from app.services.dicom._extract import (
+    extract_instance_fields,
+    parse_dicom_date,
+    parse_dicom_time,
+)
+
+
+class TestParseDicomDate:
+    """Test DICOM DA parsing."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("20240115", date(2024, 1, 15)),
+            ("19991231", date(1999, 12, 31)),
+            (None, None),
+            ("", None),
+            ("2024011", None),
+            ("2024-01-15", None),
+            ("2024AB15", None),
+            ("20241315", None),
+            ("20240230", None),
+        ],
+    )
+    def test_parse(self, value, expected):
+        """Test valid and invalid DICOM dates."""
+        assert parse_dicom_date(value) == expected
+
+
+class TestParseDicomTime:
+    """Test DICOM TM parsing."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("101530", time(10, 15, 30)),
+            ("101530.123456", time(10, 15, 30)),
+            ("1015", time(10, 15)),
+            ("235959", time(23, 59, 59)),
+            (None, None),
+            ("10", None),
+            ("10:15:30", None),
+            ("256000", None),
+            ("1061", None),
+        ],
+    )
+    def test_parse(self, value, expected):
+        """Test valid and invalid DICOM times."""
+        assert parse_dicom_time(value) == expected
+
+
+class TestExtractInstanceGeometry:
+    """Test instance geometry extraction."""
+
+    def test_geometry_extracted_as_floats(self):
+        """Test position, orientation and spacing come out as float lists."""
+        ds = Dataset()
+        ds.ImagePositionPatient = ["-125", "-125.5", "42"]
+        ds.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+        ds.PixelSpacing = ["0.5", "0.75"]
+
+        fields = extract_instance_fields(ds, "1.2.3", "1.2.840.10008.5.1.4.1.1.2")
+
+        assert fields["image_position_patient"] == [-125.0, -125.5, 42.0]
+        assert fields["image_orientation_patient"] == [1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+        assert fields["pixel_spacing"] == [0.5, 0.75]
+
+    def test_missing_geometry_is_none(self):
+        """Test absent geometry attributes are stored as NULL."""
+        fields = extract_instance_fields(Dataset(), "1.2.3", "1.2.840.10008.5.1.4.1.1.2")
+
+        assert fields["image_position_patient"] is None
+        assert fields["pixel_spacing"] is None
@@ -0,0 +1,54 @@
+"""Tests for structured logging setup."""
+
+import logging
+from pathlib import Path
+
+import pytest
+import structlog
+
+from app.core import logging as app_logging
+
+
+@pytest.fixture
+def fresh_logging(monkeypatch: pytest.MonkeyPatch):
+    """Reset setup_logging state and detach any log file afterwards."""
+    monkeypatch.setattr(app_logging, "_logging_config", None)
+    yield
+    app_logging._stop_file_logging()
+
+
+def test_setup_logging_is_idempotent(tmp_path: Path, fresh_logging):
+    """Test repeated setup with the same arguments adds no extra handlers."""
+    root = logging.getLogger()
+    handlers_before = list(root.handlers)
+    log_file = str(tmp_path / "app.log")
+
+    app_logging.setup_logging(json_logs=True, log_file=log_file)
+    app_logging.setup_logging(json_logs=True, log_file=log_file)
+
+    added = [h for h in root.handlers if h not in handlers_before]
+    assert len(added) == 1
+
+
+def test_log_file_written_by_listener(tmp_path: Path, fresh_logging):
+    """Test records reach the log file once the listener drains its queue."""
+    log_file = tmp_path / "app.log"
+    app_logging.setup_logging(json_logs=True, log_file=str(log_file))
+
+    logging.getLogger("test").warning("queued record")
+    app_logging._stop_file_logging()
+
+    assert "queued record" in log_file.read_text()
+
+
+def test_audit_logger_uses_core_processors(fresh_logging):
+    """Test audit events skip the stack-info and bytes-decoding processors."""
+    app_logging.setup_logging(json_logs=True)
+
+    processors = app_logging.get_audit_logger().bind()._processors
+
+    assert not any(
+        isinstance(p, (structlog.processors.StackInfoRenderer, structlog.processors.UnicodeDecoder))
+        for p in processors
+    )
+    assert isinstance(processors[-1], structlog.processors.JSONRenderer)
@@ -0,0 +1,179 @@
+"""Tests for security utilities."""
+
+import time
+from dataclasses import asdict
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import jwt
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from app.core import security as security_module
+from app.core.security import (
+    AuditEntry,
+    AuditLogEntry,
+    PermissionChecker,
+    SecurityManager,
+    _perms_for_roles,
+)
+
+SECRET = "a1b2c3d4" * 8
+
+
+class TestSecurityManager:
+    """Test SecurityManager encryption."""
+
+    def test_encryption_round_trip(self):
+        """Test data encrypted by one manager decrypts with another on the same key."""
+        token = SecurityManager(SECRET).encrypt_data("patient-name")
+
+        assert SecurityManager(SECRET).decrypt_data(token) == b"patient-name"
+
+    def test_access_token_expiry_relative_to_issue_time(self):
+        """Test exp is exactly the configured lifetime after iat."""
+        manager = SecurityManager(SECRET, access_token_expire_minutes=30)
+        token = manager.create_access_token({"sub": "user_1"})
+
+        claims = jwt.decode(token, options={"verify_signature": False})
+        assert claims["exp"] - claims["iat"] == 30 * 60
+
+    def test_decode_token(self):
+        """Test issued tokens decode, while tampered and expired tokens are rejected."""
+        manager = SecurityManager(SECRET)
+        claims = {"sub": "user_1", "username": "bob", "roles": ["admin"]}
+        token = manager.create_access_token(claims)
+
+        data = manager.decode_token(token)
+        assert data is not None
+        assert (data.user_id, data.username, data.roles) == ("user_1", "bob", ["admin"])
+
+        assert manager.decode_token(token[:-2]) is None
+        assert SecurityManager(SECRET[::-1]).decode_token(token) is None
+        expired = manager.create_access_token({"sub": "user_1"}, timedelta(seconds=-1))
+        assert manager.decode_token(expired) is None
+
+    def test_outdated_bcrypt_cost_needs_rehash(self):
+        """Test hashes made with a different cost are flagged for re-hashing."""
+        old_hash = SecurityManager(SECRET, bcrypt_rounds=4).hash_password("pw")
+        manager = SecurityManager(SECRET, bcrypt_rounds=5)
+
+        assert manager.verify_password("pw", old_hash)
+        assert manager.needs_rehash(old_hash)
+        assert not manager.needs_rehash(manager.hash_password("pw"))
+
+    def test_successful_verification_cached(self, monkeypatch: pytest.MonkeyPatch):
+        """Test repeat verifications skip bcrypt until the cache entry expires."""
+        manager = SecurityManager(SECRET, bcrypt_rounds=4)
+        hashed = manager.hash_password("pw")
+        assert manager.verify_password("pw", hashed)
+
+        monkeypatch.setattr(manager.pwd_context, "verify", MagicMock(return_value=False))
+        assert manager.verify_password("pw", hashed)
+        assert not manager.verify_password("wrong", hashed)
+
+        clock = time.monotonic() + security_module.VERIFY_CACHE_TTL + 1
+        monkeypatch.setattr(security_module.time, "monotonic", lambda: clock)
+        assert not manager.verify_password("pw", hashed)
+
+    def test_verify_api_key_raw_and_hex_hashes(self):
+        """Test API keys verify against both raw and hex stored hashes."""
+        manager = SecurityManager(SECRET)
+        _, key = manager.generate_api_key()
+
+        assert manager.verify_api_key(key, manager.hash_api_key_bytes(key))
+        assert manager.verify_api_key(key, manager.hash_api_key(key))
+        assert not manager.verify_api_key(key + "x", manager.hash_api_key_bytes(key))
+
+    def test_warm_up_initializes_ciphers(self):
+        """Test warm_up derives the ciphers before first use."""
+        manager = SecurityManager(SECRET, bcrypt_rounds=4)
+
+        manager.warm_up()
+
+        assert manager._aead is not None
+        assert manager._fernet is not None
+
+    @pytest.mark.asyncio
+    async def test_async_hashing_runs_in_crypto_pool(self):
+        """Test the async password helpers hash and verify off the event loop."""
+        manager = SecurityManager(SECRET, bcrypt_rounds=4)
+
+        hashed = await manager.ahash_password("pw")
+
+        assert await manager.averify_password("pw", hashed)
+        assert not await manager.averify_password("wrong", hashed)
+        assert security_module._crypto_executor is not None
+
+    def test_key_derivation_shared_per_secret(self):
+        """Test managers built with the same secret share one derived cipher."""
+        assert SecurityManager(SECRET).aead is SecurityManager(SECRET).aead
+        assert SecurityManager(SECRET).aead is not SecurityManager(SECRET[::-1]).aead
+
+    def test_decrypts_legacy_fernet_tokens(self):
+        """Test data encrypted with Fernet before the switch to AES-GCM still decrypts."""
+        manager = SecurityManager(SECRET)
+        token = manager.fernet.encrypt(b"legacy")
+
+        assert manager.decrypt_data(token) == b"legacy"
+        assert not manager.encrypt_data(b"legacy").startswith(b"g")
+
+    def test_tampered_ciphertext_rejected(self):
+        """Test AES-GCM authentication rejects modified ciphertext."""
+        manager = SecurityManager(SECRET)
+        token = bytearray(manager.encrypt_data(b"patient-name"))
+        token[-1] ^= 1
+
+        with pytest.raises(InvalidTag):
+            manager.decrypt_data(bytes(token))
+
+
+class TestPermissionChecker:
+    """Test role-based permission checks."""
+
+    def test_role_permissions(self):
+        """Test exact permissions granted by roles."""
+        checker = PermissionChecker(["radiologist", "researcher"])
+
+        assert checker.has_permission("view:studies")
+        assert checker.has_permission("export:anonymized_data")
+        assert not checker.has_permission("delete:studies")
+        assert not checker.has_permission("view:anonymized")
+
+    def test_wildcard_permissions(self):
+        """Test wildcards grant every permission on their resource only."""
+        checker = PermissionChecker(["admin"])
+
+        assert checker.has_all_permissions(["view:studies", "admin:users", "ai:run_inference"])
+        assert not checker.has_permission("import:studies")
+        assert not checker.has_permission("viewer:studies")
+
+    def test_explicit_permissions_override_roles(self):
+        """Test explicit permissions are used instead of role permissions."""
+        checker = PermissionChecker(["admin"], ["view:studies"])
+
+        assert checker.has_permission("view:studies")
+        assert not checker.has_any_permission(["edit:studies", "admin:users"])
+
+    def test_role_expansion_cached_regardless_of_order(self):
+        """Test role permissions are expanded once per set of roles."""
+        first = PermissionChecker(["technologist", "radiologist"])
+        second = PermissionChecker(["radiologist", "technologist"])
+
+        assert sorted(first.user_permissions) == sorted(second.user_permissions)
+        assert _perms_for_roles(("radiologist", "technologist")) is _perms_for_roles(
+            ("radiologist", "technologist")
+        )
+
+
+def test_audit_entry_converts_to_api_model():
+    """Test hot-path audit entries convert to the validated API model."""
+    entry = SecurityManager.create_audit_entry(
+        user_id="u1", action="study_view", resource_type="study", resource_id="1.2.3"
+    )
+
+    model = AuditLogEntry.model_validate(asdict(entry))
+
+    assert isinstance(entry, AuditEntry)
+    assert model.resource_id == "1.2.3"
+    assert model.details == {}
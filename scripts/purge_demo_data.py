@@ -8,7 +8,7 @@
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
-from app.core.config import get_settings
+from app.core.config import settings
 from app.models.patient import Patient
 
 DEMO_PATIENT_IDS = {"PAT001", "PAT002", "PAT003"}
@@ -16,7 +16,6 @@
 
 
 async def purge_demo_data(dry_run: bool) -> int:
-    settings = get_settings()
     engine = create_async_engine(settings.database.url, echo=False)
 
     deleted = 0